@@ -20,7 +20,7 @@ except ImportError:
 
 import firebase_admin
 from firebase_admin import credentials, db
-from utils import generate_conference_code
+from utils import generate_conference_code, conference_code_index_updates
 
 # Initialize Firebase Admin SDK
 try:
@@ -68,6 +68,7 @@ def create_conference_with_code(conference_data):
         # Save to Firebase
         conferences_ref = db.reference('conferences')
         new_conference_ref = conferences_ref.push(conference_data)
+        db.reference('/').update(conference_code_index_updates(new_conference_ref.key, conference_code))
 
         return {
             'conference_id': new_conference_ref.key,
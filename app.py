@@ -1,13 +1,15 @@
-from flask import Flask, render_template, request, redirect, url_for, flash, jsonify, session, send_from_directory, send_file, make_response
+from flask import Flask, render_template, request, redirect, url_for, flash, jsonify, session, send_from_directory, send_file, make_response, g, has_request_context
 import resend
 from flask_login import LoginManager, UserMixin, login_user, login_required, logout_user, current_user
 
 import firebase_admin
 from firebase_admin import credentials, db, auth, firestore, storage
 from config import Config
+import copy
 import json
 from datetime import datetime, timedelta
 from functools import wraps
+from concurrent.futures import ThreadPoolExecutor
 from werkzeug.utils import secure_filename
 import os
 import base64
@@ -24,13 +26,76 @@ from google.cloud import storage as gcs_storage
 
 from PIL import Image, ImageDraw, ImageFont
 from io import BytesIO
-from utils import register_filters, get_conference_by_code
+from utils import (
+    register_filters,
+    get_conference_by_code,
+    generate_conference_code,
+    conference_code_index_updates,
+    validate_conference_code as check_conference_code,
+)
 # Temporarily commented out to use app.py /registration route instead of blueprint route
 # from routes.user_routes import user_routes
 import io
 import mimetypes
+import threading
 import uuid
-from services.yoco_service import create_payment_session, verify_payment, process_payment_webhook, get_yoco_payments
+from services.yoco_service import create_payment_session, verify_payment, process_payment_webhook
+from services.data_backend import activate_backend, create_memory_backend
+from services.request_metrics import init_request_metrics
+from services.user_profile_cache import PROFILE_FIELDS, UserProfileCache, build_profile
+from services.pricing import PricingTable, compile_pricing, default_registration_fees
+from services.submission_archive import paper_archive_name, read_paper_file, stream_zip
+from services.storage_downloads import proxy_url, send_blob, storage_location, stream_blob
+from services.archive_jobs import (
+    STATUS_READY,
+    get_job as get_archive_job,
+    manifest_key,
+    signed_download_url as signed_archive_url,
+    start_job as start_archive_job,
+)
+from services.rtdb_cache import cached_get, cached_get_many, cached_update, invalidate_path
+from services.versioned_cache import VersionedCache
+from services.conference_summaries import fetch_conference_summaries
+from services.registration_index import (
+    find_latest_registration,
+    INDEX_ROOT as REGISTRATION_INDEX_ROOT,
+    index_path as registration_index_path,
+    is_registration_index_ready,
+    refresh_registration_index,
+    set_registration_index,
+)
+from services.payment_index import (
+    get_payment_by_reference,
+    index_updates as payment_index_updates,
+    is_payment_index_ready,
+    payment_index_entry,
+    record_payment_reference,
+    update_payment_reference,
+)
+from services.rtdb_queries import query_by_child, query_latest
+from services.pagination import fetch_merged_page, fetch_page, parse_page_size
+from services.admin_stats import (
+    dashboard_stats,
+    get_stats,
+    record_registration_change,
+    record_submission_change,
+    record_user_change,
+    refresh_yoco_stats_if_stale,
+)
+from services.registration_reassign import (
+    fetch_registrations,
+    fetch_user_registrations,
+    load_reassignment_snapshot,
+    plan_bulk_assignment,
+    plan_paper_moves,
+    plan_registration_move,
+    plan_submission_index_updates,
+    project_conference_papers,
+)
+from services.user_submission_index import (
+    update_submission_index_entry,
+    upsert_submission_index_entry,
+)
 
 try:
     from dotenv import load_dotenv
@@ -85,68 +150,81 @@ else:
 # Register Jinja2 filters
 register_filters(app)
 
-# Initialize Firebase Admin SDK
-try:
-    if os.environ.get('FIREBASE_CREDENTIALS'):
-        # JSON object as string (e.g. from a secret manager or .env — avoid committing it)
-        cred_dict = json.loads(os.environ.get('FIREBASE_CREDENTIALS'))
-        cred = credentials.Certificate(cred_dict)
-        print("Using Firebase credentials from FIREBASE_CREDENTIALS env var")
-    elif os.environ.get('GOOGLE_APPLICATION_CREDENTIALS'):
-        cred_path = os.environ['GOOGLE_APPLICATION_CREDENTIALS']
-        cred = credentials.Certificate(cred_path)
-        print(f"Using Firebase credentials from GOOGLE_APPLICATION_CREDENTIALS: {cred_path}")
-    elif os.environ.get('FIREBASE_SERVICE_ACCOUNT_PATH'):
-        cred_path = os.environ['FIREBASE_SERVICE_ACCOUNT_PATH']
-        cred = credentials.Certificate(cred_path)
-        print(f"Using Firebase credentials from FIREBASE_SERVICE_ACCOUNT_PATH: {cred_path}")
-    else:
-        cred = credentials.Certificate('serviceAccountKey.json')
-        print("Using Firebase credentials from serviceAccountKey.json")
+# Count and time backend calls per request (Server-Timing header, N+1 warnings)
+if Config.REQUEST_METRICS_ENABLED:
+    init_request_metrics(app, threshold=Config.N_PLUS_ONE_THRESHOLD)
+
+# Initialize Firebase Admin SDK (skipped when the in-memory data backend is selected)
+if Config.DATA_BACKEND == 'memory':
+    activate_backend(create_memory_backend(
+        Config.MEMORY_BACKEND_SEED or None,
+        latency_ms=Config.MEMORY_BACKEND_LATENCY_MS,
+        jitter_ms=Config.MEMORY_BACKEND_JITTER_MS,
+    ))
+    app.config['FIREBASE_CONFIG'] = {}
+    print(f"Using in-memory data backend (seed: {Config.MEMORY_BACKEND_SEED or 'empty'})")
+else:
+    try:
+        if os.environ.get('FIREBASE_CREDENTIALS'):
+            # JSON object as string (e.g. from a secret manager or .env — avoid committing it)
+            cred_dict = json.loads(os.environ.get('FIREBASE_CREDENTIALS'))
+            cred = credentials.Certificate(cred_dict)
+            print("Using Firebase credentials from FIREBASE_CREDENTIALS env var")
+        elif os.environ.get('GOOGLE_APPLICATION_CREDENTIALS'):
+            cred_path = os.environ['GOOGLE_APPLICATION_CREDENTIALS']
+            cred = credentials.Certificate(cred_path)
+            print(f"Using Firebase credentials from GOOGLE_APPLICATION_CREDENTIALS: {cred_path}")
+        elif os.environ.get('FIREBASE_SERVICE_ACCOUNT_PATH'):
+            cred_path = os.environ['FIREBASE_SERVICE_ACCOUNT_PATH']
+            cred = credentials.Certificate(cred_path)
+            print(f"Using Firebase credentials from FIREBASE_SERVICE_ACCOUNT_PATH: {cred_path}")
+        else:
+            cred = credentials.Certificate('serviceAccountKey.json')
+            print("Using Firebase credentials from serviceAccountKey.json")
     
-    # Get Firebase API key from .env file
-    firebase_api_key = os.environ.get('FIREBASE_API_KEY')
-    if not firebase_api_key:
-        print("Warning: FIREBASE_API_KEY not found in environment variables")
-    else:
-        print("Using Firebase API key from environment variables")
+        # Get Firebase API key from .env file
+        firebase_api_key = os.environ.get('FIREBASE_API_KEY')
+        if not firebase_api_key:
+            print("Warning: FIREBASE_API_KEY not found in environment variables")
+        else:
+            print("Using Firebase API key from environment variables")
     
-    # Initialize Firebase with options from serviceAccountKey.json
-    firebase_options = {
-        'databaseURL': 'https://giir-66ae6-default-rtdb.firebaseio.com',
-        'storageBucket': 'giir-66ae6.firebasestorage.app',
-        'apiKey': firebase_api_key  # Use API key from .env
-    }
+        # Initialize Firebase with options from serviceAccountKey.json
+        firebase_options = {
+            'databaseURL': 'https://giir-66ae6-default-rtdb.firebaseio.com',
+            'storageBucket': 'giir-66ae6.firebasestorage.app',
+            'apiKey': firebase_api_key  # Use API key from .env
+        }
     
-    # Initialize the Firebase app
-    firebase_admin.initialize_app(cred, firebase_options)
+        # Initialize the Firebase app
+        firebase_admin.initialize_app(cred, firebase_options)
     
-    # Test Firebase Storage connection
-    try:
-        bucket = storage.bucket('giir-66ae6.firebasestorage.app')
-        print(f"Firebase Storage bucket initialized: {bucket.name}")
-        # Test if bucket exists by trying to get its metadata
+        # Test Firebase Storage connection
         try:
-            bucket.get_blob('test-connection')  # This will succeed even if blob doesn't exist
-            print("Firebase Storage bucket is accessible")
-        except Exception as bucket_test:
-            print(f"Firebase Storage bucket test: {str(bucket_test)}")
-    except Exception as storage_init_error:
-        print(f"Firebase Storage initialization warning: {str(storage_init_error)}")
+            bucket = storage.bucket('giir-66ae6.firebasestorage.app')
+            print(f"Firebase Storage bucket initialized: {bucket.name}")
+            # Test if bucket exists by trying to get its metadata
+            try:
+                bucket.get_blob('test-connection')  # This will succeed even if blob doesn't exist
+                print("Firebase Storage bucket is accessible")
+            except Exception as bucket_test:
+                print(f"Firebase Storage bucket test: {str(bucket_test)}")
+        except Exception as storage_init_error:
+            print(f"Firebase Storage initialization warning: {str(storage_init_error)}")
     
-    # Store Firebase config in app.config for easier access later
-    app.config['FIREBASE_CONFIG'] = {
-        'apiKey': firebase_api_key,
-        'authDomain': 'giir-66ae6.firebaseapp.com',
-        'databaseURL': 'https://giir-66ae6-default-rtdb.firebaseio.com',
-        'projectId': 'giir-66ae6',
-        'storageBucket': 'giir-66ae6.firebasestorage.app',
-    }
+        # Store Firebase config in app.config for easier access later
+        app.config['FIREBASE_CONFIG'] = {
+            'apiKey': firebase_api_key,
+            'authDomain': 'giir-66ae6.firebaseapp.com',
+            'databaseURL': 'https://giir-66ae6-default-rtdb.firebaseio.com',
+            'projectId': 'giir-66ae6',
+            'storageBucket': 'giir-66ae6.firebasestorage.app',
+        }
     
-    print("Firebase initialized successfully")
-except Exception as e:
-    print(f"Error initializing Firebase: {str(e)}")
-    raise
+        print("Firebase initialized successfully")
+    except Exception as e:
+        print(f"Error initializing Firebase: {str(e)}")
+        raise
 
 # Initialize Flask-Login
 login_manager = LoginManager()
@@ -440,31 +518,33 @@ class User(UserMixin):
         self.updated_at = None
         self.email_preferences = {}
 
+user_profile_cache = UserProfileCache(
+    ttl_seconds=app.config.get('USER_PROFILE_CACHE_TTL', 60),
+    max_entries=app.config.get('USER_PROFILE_CACHE_SIZE', 1024),
+)
+
+def invalidate_user_profile(user_id):
+    """Drop a cached profile after its users/ node or admin flag changes."""
+    user_profile_cache.invalidate(user_id)
+
 @login_manager.user_loader
 def load_user(user_id):
     try:
-        user = auth.get_user(user_id)
-        # Get additional user data from Realtime Database
-        ref = db.reference(f'users/{user_id}')
-        user_data = ref.get()
-        is_admin = user_data.get('is_admin', False) if user_data else False
+        profile = user_profile_cache.get(user_id)
+        if profile is None:
+            user = auth.get_user(user_id)
+            # Get additional user data from Realtime Database
+            user_data = db.reference(f'users/{user_id}').get()
+            profile = build_profile(user.uid, user.email, user.display_name, user_data)
+            user_profile_cache.put(user_id, profile)
         
         # Create user object
-        user_obj = User(user.uid, user.email, user.display_name, is_admin)
+        user_obj = User(profile['uid'], profile['email'], profile['display_name'], profile['is_admin'])
         
         # Populate additional fields from database
-        if user_data:
-            user_obj.institution = user_data.get('institution')
-            user_obj.department = user_data.get('department')
-            user_obj.title = user_data.get('title')
-            user_obj.phone = user_data.get('phone')
-            user_obj.country = user_data.get('country')
-            user_obj.city = user_data.get('city')
-            user_obj.bio = user_data.get('bio')
-            user_obj.website = user_data.get('website')
-            user_obj.created_at = user_data.get('created_at')
-            user_obj.updated_at = user_data.get('updated_at')
-            user_obj.email_preferences = user_data.get('email_preferences', {})
+        if profile['has_user_data']:
+            for field in PROFILE_FIELDS:
+                setattr(user_obj, field, profile[field])
         
         return user_obj
     except Exception:
@@ -475,10 +555,9 @@ def send_confirmation_email(registration_data):
 
 # Add this helper function near the top of the file
 def get_site_design():
-    """Helper function to fetch site design settings"""
+    """Helper function to fetch site design settings (from the cached site snapshot)"""
     try:
-        design_ref = db.reference('site_design')
-        return design_ref.get() or DEFAULT_THEME
+        return dict(get_site_snapshot().get('site_design') or DEFAULT_THEME)
     except Exception as e:
         print(f"Error fetching site design: {str(e)}")
         return DEFAULT_THEME
@@ -588,7 +667,7 @@ def sitemap_xml():
         except Exception:
             continue
 
-    conferences = get_all_conferences() or {}
+    conferences = get_conference_summaries()
     for conference_id, conference in conferences.items():
         if not conference:
             continue
@@ -642,8 +721,7 @@ def sitemap_xml():
 def home():
     try:
         # Get home content from Firebase
-        content_ref = db.reference('home_content')
-        home_content = content_ref.get() or {}
+        home_content = cached_get('home_content') or {}
         
         # Ensure all required fields exist with defaults
         if not home_content or 'welcome' not in home_content:
@@ -711,7 +789,7 @@ def home():
         # Process dynamic featured conferences for home page display
         display_mode = home_content.get('featured_conferences_display_mode', 'manual')
         selected_ids = home_content.get('selected_conference_ids', [])
-        all_conferences = get_all_conferences()
+        all_conferences = get_conference_summaries()
         
         home_featured_conferences = []
         if display_mode == 'selected':
@@ -1074,11 +1152,11 @@ def paper_submission():
                     print(f"Error uploading paper to Firebase Storage: {str(storage_err)}")
                     new_paper.delete()
                     raise Exception(f"Failed to upload paper file to storage: {str(storage_err)}")
+                record_submission_change(None, paper_data)
 
                 # Store in user's submissions
                 if selected_conference_id:
-                    user_submissions_ref = db.reference(f'user_paper_submissions/{current_user.id}')
-                    user_submissions_ref.push({
+                    upsert_user_conference_submission_index(current_user.id, selected_conference_id, paper_id, {
                         'conference_id': selected_conference_id,
                         'paper_id': paper_id,
                         'paper_title': paper_title,
@@ -1135,7 +1213,7 @@ def paper_submission():
                 
                 if not existing_registration:
                     # Create new registration with the selected type
-                    fees = get_registration_fees(selected_conference_id) or {}
+                    fees = get_pricing_table(selected_conference_id)
                     current_period = get_current_registration_period()
                     
                     pricing = calculate_conference_registration_pricing(
@@ -1183,6 +1261,8 @@ def paper_submission():
                     
                     registrations_ref = db.reference('registrations')
                     new_registration = registrations_ref.push(registration_record)
+                    set_registration_index(new_registration.key, current_user.id, selected_conference_id)
+                    record_registration_change(None, registration_record)
             except Exception as e:
                 print(f"Error creating registration from paper submission: {str(e)}")
 
@@ -1327,6 +1407,7 @@ def profile():
             
             # Save to database
             user_ref.set(user_data)
+            invalidate_user_profile(current_user.id)
             
             # Update current user object
             current_user.full_name = full_name
@@ -1367,16 +1448,10 @@ def profile():
             current_user.email_preferences = user_data.get('email_preferences', {})
         
         # Get user's registrations
-        registrations_ref = db.reference('registrations')
-        all_registrations = registrations_ref.get() or {}
-        user_registrations = {k: v for k, v in all_registrations.items() 
-                            if v.get('user_id') == current_user.id}
+        user_registrations = query_by_child('registrations', 'user_id', current_user.id)
         
         # Get user's paper submissions
-        submissions_ref = db.reference('papers')
-        all_submissions = submissions_ref.get() or {}
-        user_submissions = {k: v for k, v in all_submissions.items() 
-                          if v.get('user_id') == current_user.id}
+        user_submissions = query_by_child('papers', 'user_id', current_user.id)
         
         # Get conferences data
         conferences_ref = db.reference('conferences')
@@ -1455,6 +1530,7 @@ def update_email_preferences():
         })
         
         user_ref.set(user_data)
+        invalidate_user_profile(current_user.id)
         
         # Update current user object
         if not hasattr(current_user, 'email_preferences'):
@@ -1526,6 +1602,7 @@ def debug_login():
                     'is_admin': is_admin_user
                 }
                 ref.set(user_data)
+                record_user_change(None, user_data)
             
             is_admin = user_data.get('is_admin', False)
             display_name = user_data.get('full_name', email.split('@')[0])
@@ -1600,6 +1677,7 @@ def login():
                         'is_admin': is_admin_user
                     }
                     ref.set(user_data)
+                    record_user_change(None, user_data)
                 
                 is_admin = user_data.get('is_admin', False)
                 display_name = user_data.get('full_name', email.split('@')[0])
@@ -1676,6 +1754,7 @@ def register_account():
             # Store additional user data in Realtime Database
             ref = db.reference('users')
             ref.child(user.uid).set(user_data)
+            record_user_change(None, user_data)
             
             # Try to send welcome email (non-blocking)
             try:
@@ -1904,7 +1983,7 @@ def create_payment():
             }), 400
 
         # Get registration fees for this specific conference
-        fees = get_registration_fees(conference_id)
+        fees = get_pricing_table(conference_id)
         
         if not fees:
             return jsonify({
@@ -1915,15 +1994,12 @@ def create_payment():
         # Validate amount
         period = registration_data['selected_period']
         reg_type = registration_data['selected_type']
-        expected_amount = fees.get(period, {}).get('fees', {}).get(reg_type, 0)
+        expected_amount = fees.base_price(period, reg_type)
         
         # Add additional items if selected
-        if fees.get('additional_items'):
-            for item in ['extra_paper', 'workshop', 'banquet']:
-                if registration_data.get(item, False):
-                    item_data = fees['additional_items'].get(item, {})
-                    if item_data.get('enabled', False):
-                        expected_amount += item_data.get('fee', 0)
+        for item in ['extra_paper', 'workshop', 'banquet']:
+            if registration_data.get(item, False):
+                expected_amount += fees.addon_fee(item)
         
         if abs(float(registration_data['total_amount']) - expected_amount) > 0.01:
             return jsonify({
@@ -1952,6 +2028,14 @@ def create_payment():
         payment_result = create_payment_session(payment_data)
         
         if payment_result['success']:
+            try:
+                record_payment_reference(
+                    payment_result['transaction_reference'],
+                    payment_index_entry(None, current_user.id, conference_id, payment_result.get('payment_id'))
+                )
+            except Exception as index_err:
+                print(f"Warning: could not index payment reference: {index_err}")
+
             # Store registration data in session for completion after payment
             session['pending_registration'] = {
                 'registration_data': registration_data,
@@ -1996,6 +2080,22 @@ def payment_callback():
         # Check if we have pending registration data (conference or regular)
         pending_registration = session.get('pending_conference_registration') or session.get('pending_registration')
         is_conference_registration = 'pending_conference_registration' in session
+
+        # Session lost (expired cookie, different device): recover the registration from the reference index
+        if not pending_registration and transaction_ref and current_user.is_authenticated:
+            indexed_payment = get_payment_by_reference(transaction_ref) or {}
+            if indexed_payment.get('registration_id') and indexed_payment.get('user_id') == current_user.id:
+                pending_registration = {
+                    'conference_id': indexed_payment.get('conference_id'),
+                    'registration_id': indexed_payment['registration_id'],
+                    'registration_data': {},
+                    'payment_data': {'checkout_id': indexed_payment.get('payment_id')},
+                    'transaction_reference': transaction_ref,
+                    'payment_id': indexed_payment.get('payment_id')
+                }
+                session['pending_conference_registration'] = pending_registration
+                is_conference_registration = True
+                payment_id = payment_id or indexed_payment.get('payment_id')
         
         if not pending_registration:
             flash('Payment session expired. Please try again.', 'error')
@@ -2048,6 +2148,13 @@ def payment_callback():
                             'updated_at': datetime.now().isoformat()
                         })
                         registration_record = registration_ref.get() or {}
+                        record_registration_change(existing_registration, registration_record)
+                        if registration_record.get('transaction_reference'):
+                            update_payment_reference(registration_record['transaction_reference'], {
+                                'registration_id': registration_id_for_email,
+                                'payment_id': payment_id,
+                                'status': 'paid'
+                            })
                     else:
                         # Fallback to legacy behavior if saved registration cannot be found
                         registration_id_for_email = None
@@ -2088,6 +2195,24 @@ def payment_callback():
                     registrations_ref = db.reference('registrations')
                     new_registration = registrations_ref.push(registration_record)
                     registration_id_for_email = new_registration.key
+                    record_registration_change(None, registration_record)
+                    if registration_record.get('transaction_reference'):
+                        record_payment_reference(
+                            registration_record['transaction_reference'],
+                            payment_index_entry(
+                                registration_id_for_email,
+                                current_user.id,
+                                registration_record.get('conference_id'),
+                                payment_id,
+                                status='paid'
+                            )
+                        )
+                    if registration_record.get('conference_id'):
+                        set_registration_index(
+                            registration_id_for_email,
+                            current_user.id,
+                            registration_record['conference_id']
+                        )
 
                 # Ensure user registration index exists for conference registrations
                 if is_conference_registration:
@@ -2197,24 +2322,30 @@ def payment_webhook():
             
             # Find and update registration if needed
             if payment_data.get('status') == 'paid':
-                # Look for registration with this transaction reference
-                registrations_ref = db.reference('registrations')
-                registrations = registrations_ref.get() or {}
-                
-                for reg_id, reg_data in registrations.items():
-                    if (reg_data and 
-                        reg_data.get('transaction_reference') == payment_data.get('reference') and
-                        reg_data.get('payment_status') != 'paid'):
-                        
-                        # Update registration status
-                        registrations_ref.child(reg_id).update({
-                            'payment_status': 'paid',
-                            'payment_date': payment_data.get('payment_date', datetime.now().isoformat()),
-                            'updated_at': datetime.now().isoformat()
-                        })
-                        
-                        print(f"Registration {reg_id} updated via webhook")
-                        break
+                reference = payment_data.get('reference')
+                reg_id, reg_data = find_registration_by_payment_reference(reference)
+
+                if reg_data and reg_data.get('payment_status') != 'paid':
+                    # Update registration status and the index entry together
+                    now_iso = datetime.now().isoformat()
+                    webhook_updates = {
+                        f'registrations/{reg_id}/payment_status': 'paid',
+                        f'registrations/{reg_id}/payment_date': payment_data.get('payment_date', now_iso),
+                        f'registrations/{reg_id}/updated_at': now_iso,
+                    }
+                    webhook_updates.update(payment_index_updates(reference, {
+                        **(get_payment_by_reference(reference) or payment_index_entry(
+                            reg_id, reg_data.get('user_id'), reg_data.get('conference_id')
+                        )),
+                        'registration_id': reg_id,
+                        'payment_id': payment_data.get('payment_id'),
+                        'status': 'paid',
+                        'updated_at': now_iso,
+                    }))
+                    db.reference('/').update(webhook_updates)
+                    record_registration_change(reg_data, {'payment_status': 'paid'})
+
+                    print(f"Registration {reg_id} updated via webhook")
             
             return jsonify({'status': 'success'}), 200
         else:
@@ -2225,6 +2356,28 @@ def payment_webhook():
         print(f"Webhook processing error: {str(e)}")
         return jsonify({'status': 'error', 'message': 'Webhook processing failed'}), 500
 
+def find_registration_by_payment_reference(reference):
+    """Return (registration_id, registration) for a Yoco transaction reference."""
+    if not reference:
+        return None, None
+
+    entry = get_payment_by_reference(reference)
+    if entry and entry.get('registration_id'):
+        registration_id = entry['registration_id']
+        registration = db.reference(f'registrations/{registration_id}').get()
+        if registration and registration.get('transaction_reference') == reference:
+            return registration_id, registration
+
+    if entry or is_payment_index_ready():
+        return None, None
+
+    # Index not backfilled yet: fall back to querying registrations
+    registrations = query_by_child('registrations', 'transaction_reference', reference, limit=1)
+    for registration_id, registration in registrations.items():
+        if registration and registration.get('transaction_reference') == reference:
+            return registration_id, registration
+    return None, None
+
 @app.route('/payment/demo')
 def payment_demo():
     """Demo payment page for testing the payment flow"""
@@ -2289,149 +2442,17 @@ def admin_required(f):
 @admin_required
 def admin_dashboard():
     try:
-        # Get all users
-        users_ref = db.reference('users')
-        users = users_ref.get() or {}
-        
-        # Get all conferences
-        conferences = get_all_conferences()
-        
-        # Get all registrations across all conferences
-        all_registrations = {}
-        total_registrations = 0
-        pending_registrations = 0
-        
-        for conf_id, conf_data in conferences.items():
-            if conf_data:
-                reg_ref = db.reference(f'conferences/{conf_id}/registrations')
-                conf_registrations = reg_ref.get() or {}
-                all_registrations.update(conf_registrations)
-                total_registrations += len(conf_registrations)
-                pending_registrations += sum(1 for reg in conf_registrations.values() 
-                                           if reg and reg.get('payment_status') == 'pending')
-        
-        # Also get registrations from the main registrations node
-        main_registrations_ref = db.reference('registrations')
-        main_registrations = main_registrations_ref.get() or {}
-        
-        # Calculate revenue from all registrations (both conference-specific and main)
-        total_revenue = 0
-        pending_payments = 0
-        received_payments = 0
-        
-        # Process conference registrations
-        for reg_id, reg in all_registrations.items():
-            if reg:
-                amount = float(reg.get('total_amount', 0) or 0)
-                payment_status = reg.get('payment_status', 'pending').lower()
-                if payment_status == 'approved':
-                    received_payments += amount
-                elif payment_status == 'pending':
-                    pending_payments += amount
-                total_revenue += amount
-        
-        # Process main registrations
-        for reg_id, reg in main_registrations.items():
-            if reg:
-                amount = float(reg.get('total_amount', 0) or 0)
-                payment_status = reg.get('payment_status', 'pending').lower()
-                if payment_status == 'approved':
-                    received_payments += amount
-                elif payment_status == 'pending':
-                    pending_payments += amount
-                # Only add to total if not already counted in conference registrations
-                if reg_id not in all_registrations:
-                    total_revenue += amount
-                    total_registrations += 1
-                    if payment_status == 'pending':
-                        pending_registrations += 1
-        
-        # Try to get Yoco payments for additional revenue data
-        yoco_revenue = {'total_revenue': 0, 'pending': 0, 'received': 0}
-        try:
-            yoco_result = get_yoco_payments(limit=100, status_filter=['approved', 'pending'])
-            if yoco_result.get('success'):
-                yoco_summary = yoco_result.get('summary', {})
-                yoco_revenue = {
-                    'total_revenue': yoco_summary.get('total_revenue', 0),
-                    'approved_count': yoco_summary.get('approved_count', 0),
-                    'pending_count': yoco_summary.get('pending_count', 0)
-                }
-        except Exception as yoco_err:
-            print(f"Note: Could not fetch Yoco payments: {yoco_err}")
-        
-        # Get all submissions (both legacy/global papers and conference-scoped ones)
-        submissions = {}
-        
-        # 1. Legacy/global paper submissions
-        papers = db.reference('papers').get() or {}
-        for paper_id, paper in papers.items():
-            if paper:
-                submissions[f'global::{paper_id}'] = paper
-                
-        # 2. Conference-scoped submissions
-        for conf_id, conf_data in conferences.items():
-            if conf_data:
-                conf_papers = conf_data.get('paper_submissions', {}) or {}
-                for paper_id, paper in conf_papers.items():
-                    if paper:
-                        submissions[f'{conf_id}::{paper_id}'] = paper
-        
-        # Calculate accepted submissions
-        accepted_submissions = sum(
-            1 for sub in submissions.values() 
-            if sub and sub.get('status', '').lower() in ['accepted', 'approved']
-        )
-        
-        # Calculate stats
-        stats = {
-            'total_users': len(users) if users else 0,
-            'total_conferences': len(conferences) if conferences else 0,
-            'active_conferences': sum(1 for conf in conferences.values() 
-                                    if conf and conf.get('basic_info', {}).get('status') == 'active'),
-            'total_registrations': total_registrations,
-            'total_submissions': len(submissions),
-            'pending_registrations': pending_registrations,
-            'pending_submissions': sum(1 for sub in submissions.values() if sub and sub.get('status', '').lower() == 'pending'),
-            'accepted_submissions': accepted_submissions,
-            'total_admins': sum(1 for user in users.values() if user and user.get('is_admin')),
-            'total_regular_users': sum(1 for user in users.values() if user and not user.get('is_admin')),
-            # Revenue stats
-            'total_revenue': round(total_revenue, 2),
-            'pending_payments': round(pending_payments, 2),
-            'received_payments': round(received_payments, 2),
-            # Yoco-specific stats
-            'yoco_revenue': round(yoco_revenue.get('total_revenue', 0), 2),
-            'yoco_approved_count': yoco_revenue.get('approved_count', 0),
-            'yoco_pending_count': yoco_revenue.get('pending_count', 0)
-        }
-        
+        # Conference list comes from the per-worker summary cache
+        conferences = get_conference_summaries()
+
+        # Counters are maintained incrementally in stats/ (see services/admin_stats.py)
+        raw_stats = get_stats()
+        refresh_yoco_stats_if_stale(raw_stats, app.config.get('YOCO_STATS_MAX_AGE_MINUTES', 15) * 60)
+        stats = dashboard_stats(raw_stats, conferences)
+
         # Get recent registrations and users (last 5)
-        recent_registrations = {}
-        recent_users = {}
-        
-        # Combine all registrations for recent list
-        combined_registrations = {**all_registrations, **main_registrations}
-        
-        if combined_registrations:
-            # Sort registrations by created_at date
-            sorted_registrations = sorted(
-                [(k, v) for k, v in combined_registrations.items() if v and (v.get('created_at') or v.get('submission_date'))],
-                key=lambda x: x[1].get('created_at', x[1].get('submission_date', '')),
-                reverse=True
-            )
-            # Get first 5 items
-            recent_registrations = dict(sorted_registrations[:5])
-            
-        if users:
-            # Sort users by created_at date
-            sorted_users = sorted(
-                [(k, v) for k, v in users.items() if v and v.get('created_at')],
-                key=lambda x: x[1].get('created_at', ''),
-                reverse=True
-            )
-            # Get first 5 items
-            recent_users = dict(sorted_users[:5])
+        recent_registrations = query_latest('registrations', 'created_at', 5)
+        recent_users = query_latest('users', 'created_at', 5)
         
         return render_template('admin/dashboard.html', 
                              users=recent_users, 
@@ -2470,12 +2491,12 @@ def admin_dashboard():
 @admin_required
 def admin_users():
     try:
-        users_ref = db.reference('users')
-        users = users_ref.get()
-        return render_template('admin/users.html', users=users or {})
+        # One page of users, most recently created first
+        page = fetch_page('users', 'created_at', **_admin_page_args())
+        return render_template('admin/users.html', users=dict(page['items']), page=page, filters={})
     except Exception as e:
         flash(f'Error loading users: {str(e)}', 'error')
-        return render_template('admin/users.html', users={})
+        return render_template('admin/users.html', users={}, page=None, filters={})
 
 @app.route('/admin/toggle-admin/<user_id>', methods=['POST'])
 @login_required
@@ -2485,8 +2506,11 @@ def toggle_admin(user_id):
         user_ref = db.reference(f'users/{user_id}')
         user_data = user_ref.get()
         if user_data:
+            previous_user_data = dict(user_data)
             user_data['is_admin'] = not user_data.get('is_admin', False)
             user_ref.update({'is_admin': user_data['is_admin']})
+            invalidate_user_profile(user_id)
+            record_user_change(previous_user_data, user_data)
             flash("Admin status updated successfully.", 'success')
         return redirect(url_for('admin_users'))
     except Exception as e:
@@ -2792,10 +2816,12 @@ def admin_registration_fees(conference_id=None):
             
             # Save to conference specific node in Firebase
             db.reference(f'conferences/{conference_id}/registration_fees').set(registration_fees)
+            invalidate_conference_cache()
             
             # Also update global_settings/payment_details if global defaults aren't set yet
             if any(payment_details.values()):
                 db.reference('global_settings/payment_details').set(payment_details)
+            invalidate_pricing_tables()
                 
             flash(f'Registration fees for "{conference_data.get("basic_info", {}).get("name", conference_id)}" updated successfully', 'success')
             return redirect(url_for('admin_registration_fees', conference_id=conference_id))
@@ -2987,69 +3013,92 @@ def delete_download(download_id):
         
     return redirect(url_for('admin_downloads'))
 
+def _registration_filters():
+    return {
+        'conference': (request.args.get('conference') or '').strip(),
+        'status': (request.args.get('status') or '').strip().lower(),
+    }
+
+def _registration_matches(filters):
+    """Predicate for fetch_page implementing the conference / payment status filters."""
+    def _matches(registration_id, registration):
+        conference_id = registration.get('conference_id') or ''
+        if filters['conference'] == 'legacy':
+            if conference_id:
+                return False
+        elif filters['conference'] and conference_id != filters['conference']:
+            return False
+        if filters['status'] and (registration.get('payment_status') or 'pending').lower() != filters['status']:
+            return False
+        return True
+    return _matches
+
+def _with_conference_info(registration_id, reg, conferences):
+    """Fill template defaults and the conference association for an admin registration row."""
+    reg['_id'] = registration_id  # Add Firebase key as _id
+    # Ensure all required fields exist with defaults
+    reg.setdefault('submission_date', '')
+    reg.setdefault('full_name', '')
+    reg.setdefault('email', '')
+    reg.setdefault('institution', '')
+    reg.setdefault('registration_type', '')
+    reg.setdefault('registration_period', '')
+    reg.setdefault('total_amount', 0)
+    reg.setdefault('payment_status', 'pending')
+    reg.setdefault('workshop', False)
+    reg.setdefault('banquet', False)
+    reg.setdefault('extra_paper', False)
+
+    # Add conference association information
+    conference_id = reg.get('conference_id', '')
+    conference_code = reg.get('conference_code', '')
+    conference_name = reg.get('conference_name', '')
+
+    # Look up conference details if conference_id exists
+    if conference_id and conference_id in conferences:
+        conference_data = conferences[conference_id]
+        reg['conference_info'] = {
+            'id': conference_id,
+            'name': conference_data.get('basic_info', {}).get('name', 'Unknown'),
+            'year': conference_data.get('basic_info', {}).get('year', ''),
+            'code': conference_code or conference_data.get('conference_code', ''),
+            'status': conference_data.get('basic_info', {}).get('status', 'unknown')
+        }
+    else:
+        # For legacy registrations or missing conference data
+        reg['conference_info'] = {
+            'id': conference_id,
+            'name': conference_name or 'Legacy Conference',
+            'year': '',
+            'code': conference_code or '',
+            'status': 'legacy'
+        }
+    return reg
+
 @app.route('/admin/registrations')
 @login_required
 @admin_required
 def admin_registrations():
-    try:
-        # Get registrations from Firebase
-        registrations_ref = db.reference('registrations')
-        registrations_data = registrations_ref.get()
-
-        # Get all conferences for association lookup
-        conferences = get_all_conferences()
-
-        # Convert to list and add the Firebase key as _id
-        registrations = []
-        if registrations_data:
-            for key, reg in registrations_data.items():
-                reg['_id'] = key  # Add Firebase key as _id
-                # Ensure all required fields exist with defaults
-                reg.setdefault('submission_date', '')
-                reg.setdefault('full_name', '')
-                reg.setdefault('email', '')
-                reg.setdefault('institution', '')
-                reg.setdefault('registration_type', '')
-                reg.setdefault('registration_period', '')
-                reg.setdefault('total_amount', 0)
-                reg.setdefault('payment_status', 'pending')
-                reg.setdefault('workshop', False)
-                reg.setdefault('banquet', False)
-                reg.setdefault('extra_paper', False)
-
-                # Add conference association information
-                conference_id = reg.get('conference_id', '')
-                conference_code = reg.get('conference_code', '')
-                conference_name = reg.get('conference_name', '')
-
-                # Look up conference details if conference_id exists
-                if conference_id and conference_id in conferences:
-                    conference_data = conferences[conference_id]
-                    reg['conference_info'] = {
-                        'id': conference_id,
-                        'name': conference_data.get('basic_info', {}).get('name', 'Unknown'),
-                        'year': conference_data.get('basic_info', {}).get('year', ''),
-                        'code': conference_code or conference_data.get('conference_code', ''),
-                        'status': conference_data.get('basic_info', {}).get('status', 'unknown')
-                    }
-                else:
-                    # For legacy registrations or missing conference data
-                    reg['conference_info'] = {
-                        'id': conference_id,
-                        'name': conference_name or 'Legacy Conference',
-                        'year': '',
-                        'code': conference_code or '',
-                        'status': 'legacy'
-                    }
-
-                registrations.append(reg)
-
-            # Sort by submission date (newest first)
-            registrations.sort(key=lambda x: x.get('submission_date', ''), reverse=True)
+    filters = _registration_filters()
+    conferences = get_conference_summaries()
+    try:
+        # One page of registrations, newest submission first
+        page = fetch_page(
+            'registrations',
+            'submission_date',
+            predicate=_registration_matches(filters),
+            **_admin_page_args()
+        )
+        registrations = [
+            _with_conference_info(key, reg, conferences)
+            for key, reg in page['items']
+        ]
 
         return render_template('admin/manage_registrations.html',
                             registrations=registrations,
-                            conferences=get_all_conferences(),
+                            page=page,
+                            filters=filters,
+                            conferences=conferences,
                             site_design=get_site_design())
 
     except Exception as e:
@@ -3057,6 +3106,8 @@ def admin_registrations():
         flash(f'Error loading registrations: {str(e)}', 'danger')
         return render_template('admin/manage_registrations.html',
                             registrations=[],
+                            page=None,
+                            filters=filters,
                             conferences={},
                             site_design=get_site_design())
 
@@ -3064,64 +3115,26 @@ def admin_registrations():
 @login_required
 @admin_required
 def export_registrations():
-    """Export all registrations with conference information"""
-    try:
-        # Get registrations from Firebase
-        registrations_ref = db.reference('registrations')
-        registrations_data = registrations_ref.get()
-
-        # Get all conferences for association lookup
-        conferences = get_all_conferences()
-
-        # Convert to list with conference info
-        registrations = []
-        if registrations_data:
-            for key, reg in registrations_data.items():
-                reg['_id'] = key  # Add Firebase key as _id
-                # Ensure all required fields exist with defaults
-                reg.setdefault('submission_date', '')
-                reg.setdefault('full_name', '')
-                reg.setdefault('email', '')
-                reg.setdefault('institution', '')
-                reg.setdefault('registration_type', '')
-                reg.setdefault('registration_period', '')
-                reg.setdefault('total_amount', 0)
-                reg.setdefault('payment_status', 'pending')
-                reg.setdefault('workshop', False)
-                reg.setdefault('banquet', False)
-                reg.setdefault('extra_paper', False)
-
-                # Add conference association information
-                conference_id = reg.get('conference_id', '')
-                conference_code = reg.get('conference_code', '')
-                conference_name = reg.get('conference_name', '')
-
-                # Look up conference details if conference_id exists
-                if conference_id and conference_id in conferences:
-                    conference_data = conferences[conference_id]
-                    reg['conference_info'] = {
-                        'id': conference_id,
-                        'name': conference_data.get('basic_info', {}).get('name', 'Unknown'),
-                        'year': conference_data.get('basic_info', {}).get('year', ''),
-                        'code': conference_code or conference_data.get('conference_code', ''),
-                        'status': conference_data.get('basic_info', {}).get('status', 'unknown')
-                    }
-                else:
-                    # For legacy registrations or missing conference data
-                    reg['conference_info'] = {
-                        'id': conference_id,
-                        'name': conference_name or 'Legacy Conference',
-                        'year': '',
-                        'code': conference_code or '',
-                        'status': 'legacy'
-                    }
+    """Export registrations with conference information, one page per request.
 
-                registrations.append(reg)
-
-            # Sort by submission date (newest first)
-            registrations.sort(key=lambda x: x.get('submission_date', ''), reverse=True)
-
-        return jsonify(registrations)
+    Returns ``{registrations, next_cursor}``; the client keeps requesting with
+    ``cursor=next_cursor`` until it is null.
+    """
+    try:
+        filters = _registration_filters()
+        conferences = get_conference_summaries()
+        page = fetch_page(
+            'registrations',
+            'submission_date',
+            page_size=parse_page_size(request.args.get('per_page'), 500),
+            cursor=request.args.get('cursor') or None,
+            predicate=_registration_matches(filters),
+        )
+        registrations = [
+            _with_conference_info(key, reg, conferences)
+            for key, reg in page['items']
+        ]
+        return jsonify({'registrations': registrations, 'next_cursor': page['next_cursor']})
 
     except Exception as e:
         print(f"Error exporting registrations: {str(e)}")
@@ -3344,6 +3357,7 @@ def update_registration_status(registration_id):
             update_data['rejection_reason'] = rejection_reason
         
         registration_ref.update(update_data)
+        record_registration_change(registration_data, update_data)
         
         # Sync update to nested conference registrations index
         conference_id = registration_data.get('conference_id')
@@ -3415,7 +3429,14 @@ def reassign_registration_conference(registration_id):
                 'email_sent': False,
             }), 200
 
-        moved_paper_ids = move_paper_submissions_for_registration_reassign(
+        # Read everything the move depends on up front (in parallel), plan every
+        # node's new state locally, then apply it in one atomic multi-path write.
+        now_iso = datetime.now().isoformat()
+        new_conference_name = new_conference['basic_info']['name']
+        snapshot = load_reassignment_snapshot(user_id, old_conference_id, new_conference_id)
+        fees = get_pricing_table()
+
+        reassign_updates, moved_papers = plan_paper_submissions_for_registration_reassign(
             old_conference_id,
             new_conference_id,
             registration_id,
@@ -3423,16 +3444,18 @@ def reassign_registration_conference(registration_id):
             registration,
             new_conference,
             current_user.email,
+            snapshot,
+            now_iso,
         )
-
-        now_iso = datetime.now().isoformat()
+        # Workflow and pricing see the target conference as it will be after the write
+        new_conference_papers = project_conference_papers(snapshot['new_papers'], moved_papers)
         workflow_updates = compute_registration_workflow_for_conference(
-            user_id, new_conference_id, registration
+            user_id, new_conference_id, registration, submissions=new_conference_papers
         )
 
         base_updates = {
             'conference_id': new_conference_id,
-            'conference_name': new_conference['basic_info']['name'],
+            'conference_name': new_conference_name,
             'conference_code': new_conference.get('conference_code', ''),
             'payment_status': 'pending',
             'rejection_reason': None,
@@ -3445,39 +3468,37 @@ def reassign_registration_conference(registration_id):
             'updated_by': current_user.email,
             **workflow_updates,
         }
+        pricing_updates = compute_conference_registration_pricing_updates(
+            {**registration, **base_updates}, user_id, new_conference_id, fees,
+            submissions=new_conference_papers
+        )
 
-        registration_ref.update(base_updates)
-
-        merged = registration_ref.get() or {}
-        fees = get_registration_fees() or {}
-        merged = sync_conference_registration_pricing(
-            registration_id=registration_id,
-            registration_data=merged,
-            user_id=user_id,
-            conference_id=new_conference_id,
-            fees=fees
-        ) or merged
-
-        final_reg = registration_ref.get() or merged
-
-        old_conf_reg = db.reference(f'conferences/{old_conference_id}/registrations/{registration_id}')
-        if old_conf_reg.get():
-            old_conf_reg.delete()
-
-        db.reference(f'conferences/{new_conference_id}/registrations/{registration_id}').set(final_reg)
+        registration_updates, final_reg = plan_registration_move(
+            registration_id,
+            user_id,
+            registration,
+            {**base_updates, **pricing_updates},
+            old_conference_id,
+            new_conference_id,
+            snapshot['user_registrations'],
+            {
+                'conference_id': new_conference_id,
+                'conference_name': new_conference_name,
+                'status': 'pending',
+            },
+            snapshot['registrations'],
+        )
+        reassign_updates.update(registration_updates)
 
-        try:
-            user_reg_ref = db.reference(f'user_registrations/{user_id}')
-            user_reg_entries = user_reg_ref.get() or {}
-            for entry_key, entry in user_reg_entries.items():
-                if entry and entry.get('registration_id') == registration_id:
-                    user_reg_ref.child(entry_key).update({
-                        'conference_id': new_conference_id,
-                        'conference_name': new_conference['basic_info']['name'],
-                        'status': 'pending',
-                    })
-        except Exception as sync_err:
-            print(f"Warning: could not sync user_registrations index: {sync_err}")
+        db.reference('/').update(reassign_updates)
+        for path in (
+            f'registrations/{registration_id}',
+            f'conferences/{old_conference_id}',
+            f'conferences/{new_conference_id}',
+        ):
+            invalidate_path(path)
+        record_registration_change(registration, {**base_updates, **pricing_updates})
+        moved_paper_ids = list(moved_papers)
 
         old_conference_name = registration.get('conference_name') or ''
         if not old_conference_name.strip() and old_conference_id:
@@ -3521,12 +3542,23 @@ def get_payment_proof(registration_id):
         if not registration.get('payment_proof'):
             return jsonify({'error': 'No payment proof uploaded'}), 404
             
-        # Clean up the file path
+        # New uploads store {url, filename, path, type}; legacy ones a bare file name
         payment_proof = registration['payment_proof']
-        if not payment_proof.startswith('payments/'):
-            payment_proof = f'payments/{payment_proof}'
-            
-        return jsonify({'url': payment_proof})
+        if isinstance(payment_proof, dict):
+            storage_path = payment_proof.get('path') or ''
+            filename = payment_proof.get('filename') or os.path.basename(storage_path)
+            mimetype = payment_proof.get('type')
+        else:
+            storage_path = str(payment_proof)
+            if not storage_path.startswith('payments/'):
+                storage_path = f'payments/{storage_path}'
+            filename = os.path.basename(storage_path)
+            mimetype = None
+        if not storage_path:
+            return jsonify({'error': 'No payment proof uploaded'}), 404
+
+        mimetype = mimetype or mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+        return send_storage_file(storage_path, secure_filename(filename) or 'payment_proof', mimetype)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -4909,6 +4941,8 @@ def admin_home_content():
                             except Exception as theme_err:
                                 print(f"Warning: could not write theme back to conference {cid}: {theme_err}")
                 update_data['conference_theme_overrides'] = existing_overrides
+                if edited_theme:
+                    invalidate_conference_cache()
 
                 if 'hero' in current_content and 'images' in current_content['hero']:
                     update_data['hero']['images'] = current_content['hero']['images']
@@ -4988,6 +5022,7 @@ def admin_home_content():
 
                 # Save the updated content
                 content_ref.set(update_data)
+                invalidate_site_snapshot()
                 
                 # Check if request wants JSON response
                 if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
@@ -5253,6 +5288,7 @@ def admin_design():
             # Save theme data to Firebase
             design_ref = db.reference('site_design')
             design_ref.set(theme_data)
+            invalidate_site_snapshot()
             
             flash('Site design updated successfully!', 'success')
             return redirect(url_for('admin_design'))
@@ -5597,171 +5633,70 @@ def admin_about_content():
         except:
             return redirect(url_for('admin_dashboard'))
 
+def _load_registration_fees(conference_id=None):
+    """Read the fee configuration for a conference, falling back to the root node and then defaults."""
+    if conference_id:
+        fees = db.reference(f'conferences/{conference_id}/registration_fees').get()
+        if fees:
+            return fees
+
+    # Fallback to root registration_fees if conference-specific fees not found
+    root_fees = db.reference('registration_fees').get()
+    if root_fees:
+        return root_fees
+
+    # Return default structure if no fees exist anywhere
+    global_payment = db.reference('global_settings/payment_details').get() or {}
+    return default_registration_fees(global_payment)
+
+# One compiled pricing table per conference ('' is the root node), shared by
+# every request in the worker. All tables use the same version key, so a save
+# in admin_registration_fees (which can also change the root fallback and the
+# default payment details) reloads them all.
+_pricing_caches = {}
+_pricing_caches_lock = threading.Lock()
+
+def _pricing_cache(conference_id):
+    key = conference_id or ''
+    with _pricing_caches_lock:
+        cache = _pricing_caches.get(key)
+        if cache is None:
+            cache = VersionedCache(
+                'registration_fees',
+                lambda: compile_pricing(_load_registration_fees(key or None)),
+                ttl_seconds=app.config.get('PRICING_CACHE_TTL', 600),
+                version_check_seconds=app.config.get('CONFERENCE_CACHE_VERSION_CHECK_SECONDS', 5),
+                copy_values=False,
+            )
+            _pricing_caches[key] = cache
+        return cache
+
+def get_pricing_table(conference_id=None):
+    """Compiled, immutable pricing for a conference (root fees when conference_id is None)."""
+    try:
+        return _pricing_cache(conference_id).get()
+    except Exception as e:
+        print(f"Error loading registration pricing: {e}")
+        return compile_pricing({})
+
+def invalidate_pricing_tables():
+    """Bump the shared pricing version after registration fees change."""
+    _pricing_cache(None).bump()
+    with _pricing_caches_lock:
+        caches = list(_pricing_caches.values())
+    for cache in caches:
+        cache.invalidate_local()
+
 def get_registration_fees(conference_id=None):
     """
     Helper function to fetch registration fees from Firebase.
     Returns a dictionary containing registration fee information for the specified conference.
     If conference_id is None, logs a deprecation warning and falls back to root registration_fees.
+    The dictionary is a private copy of the cached pricing table's configuration.
     """
-    try:
-        if not conference_id:
-            logger.warning("DEPRECATION WARNING: get_registration_fees called without conference_id. Falling back to root node.")
-            fees_ref = db.reference('registration_fees')
-            fees = fees_ref.get()
-            if fees:
-                return fees
-        else:
-            fees_ref = db.reference(f'conferences/{conference_id}/registration_fees')
-            fees = fees_ref.get()
-            if fees:
-                return fees
-
-        # Fallback to root registration_fees if conference-specific fees not found
-        if conference_id:
-            root_fees = db.reference('registration_fees').get()
-            if root_fees:
-                return root_fees
-
-        # Return default structure if no fees exist anywhere
-        global_payment = db.reference('global_settings/payment_details').get() or {}
-        return {
-            'currency': {
-                'code': 'ZAR',
-                'symbol': 'R'
-            },
-            'early_bird': {
-                'enabled': False,
-                'deadline': '',
-                'seats': {
-                    'total': 100,
-                    'remaining': 100,
-                    'show_remaining': True
-                },
-                'fees': {
-                    'student_author': 0,
-                    'regular_author': 0,
-                    'physical_delegate': 0,
-                    'listener': 0
-                },
-                'benefits': []
-            },
-            'regular': {
-                'deadline': '',
-                'fees': {
-                    'student_author': 0,
-                    'regular_author': 0,
-                    'physical_delegate': 0,
-                    'listener': 0
-                },
-                'benefits': []
-            },
-            'late': {
-                'deadline': '',
-                'fees': {
-                    'student_author': 0,
-                    'regular_author': 0,
-                    'physical_delegate': 0,
-                    'listener': 0
-                },
-                'benefits': []
-            },
-            'additional_items': {
-                'extra_paper': {
-                    'enabled': False,
-                    'fee': 0,
-                    'description': 'Submit an additional paper',
-                    'virtual_eligible': True
-                },
-                'workshop': {
-                    'enabled': False,
-                    'fee': 0,
-                    'description': 'Attend the conference workshop',
-                    'virtual_eligible': True
-                },
-                'banquet': {
-                    'enabled': False,
-                    'fee': 0,
-                    'description': 'Join the conference banquet',
-                    'virtual_eligible': False
-                }
-            },
-            'payment_details': global_payment
-        }
-    except Exception as e:
-        print(f"Error in get_registration_fees: {e}")
-        return {}
-        
-        # Ensure the fees structure is correct
-        if 'currency' not in fees:
-            fees['currency'] = {
-                'code': 'ZAR',
-                'symbol': 'R'
-            }
-        
-        # Ensure each period has the correct structure
-        for period in ['early_bird', 'early', 'regular', 'late']:
-            if period in fees:
-                if 'fees' not in fees[period]:
-                    fees[period]['fees'] = {}
-                
-                # Ensure all registration types have a fee
-                for reg_type in ['student_author', 'regular_author', 'physical_delegate', 'listener']:
-                    if reg_type not in fees[period]['fees']:
-                        fees[period]['fees'][reg_type] = 0
-                
-                # Ensure benefits list exists
-                if 'benefits' not in fees[period]:
-                    fees[period]['benefits'] = []
-                
-                # Ensure early bird has seats info
-                if period == 'early_bird':
-                    if 'seats' not in fees[period]:
-                        fees[period]['seats'] = {
-                            'total': 100,
-                            'remaining': 100,
-                            'show_remaining': True
-                        }
-        
-        # Ensure additional items structure is correct
-        if 'additional_items' not in fees:
-            fees['additional_items'] = {
-                'extra_paper': {
-                    'enabled': False,
-                    'fee': 0,
-                    'description': 'Submit an additional paper',
-                    'virtual_eligible': True
-                },
-                'workshop': {
-                    'enabled': False,
-                    'fee': 0,
-                    'description': 'Attend the conference workshop',
-                    'virtual_eligible': True
-                },
-                'banquet': {
-                    'enabled': False,
-                    'fee': 0,
-                    'description': 'Join the conference banquet',
-                    'virtual_eligible': False
-                }
-            }
-        else:
-            # Ensure each additional item has the correct structure
-            for item in ['extra_paper', 'workshop', 'banquet']:
-                if item not in fees['additional_items']:
-                    fees['additional_items'][item] = {
-                        'enabled': False,
-                        'fee': 0,
-                        'description': '',
-                        'virtual_eligible': item != 'banquet'
-                    }
-                else:
-                    if 'virtual_eligible' not in fees['additional_items'][item]:
-                        fees['additional_items'][item]['virtual_eligible'] = item != 'banquet'
-        
-        return fees
-    except Exception as e:
-        print(f"Error fetching registration fees: {str(e)}")
-        return None
+    if not conference_id:
+        logger.warning("DEPRECATION WARNING: get_registration_fees called without conference_id. Falling back to root node.")
+    return get_pricing_table(conference_id).fees_dict()
 
 def get_current_registration_period():
     """
@@ -5769,75 +5704,9 @@ def get_current_registration_period():
     Returns: 'early_bird', 'regular', 'late', or 'closed'
     """
     try:
-        fees = get_registration_fees()
-        if not fees:
-            return 'closed'
-
-        current_date = datetime.now().date()
-        has_valid_deadline = False
-        
-        # Check Early Bird period
-        if fees.get('early_bird', {}).get('enabled'):
-            early_bird_deadline_str = fees['early_bird'].get('deadline', '').strip()
-            if early_bird_deadline_str:
-                try:
-                    early_bird_deadline = datetime.strptime(early_bird_deadline_str, '%Y-%m-%d').date()
-                    has_valid_deadline = True
-                    if current_date <= early_bird_deadline:
-                        # Check if seats are available
-                        seats = fees['early_bird'].get('seats', {})
-                        if seats.get('remaining', 0) > 0:
-                            return 'early_bird'
-                except (ValueError, TypeError):
-                    pass
-                
-        # Check Regular period
-        regular_deadline_str = fees.get('regular', {}).get('deadline', '').strip()
-        if regular_deadline_str:
-            try:
-                regular_deadline = datetime.strptime(regular_deadline_str, '%Y-%m-%d').date()
-                has_valid_deadline = True
-                if current_date <= regular_deadline:
-                    return 'regular'
-            except (ValueError, TypeError):
-                pass
-                
-        # Check Late period
-        late_deadline_str = fees.get('late', {}).get('deadline', '').strip()
-        if late_deadline_str:
-            try:
-                late_deadline = datetime.strptime(late_deadline_str, '%Y-%m-%d').date()
-                has_valid_deadline = True
-                if current_date <= late_deadline:
-                    return 'late'
-            except (ValueError, TypeError):
-                pass
-        
-        # If no valid deadlines are set, default to 'regular' period
-        # This allows registration even when deadlines aren't configured
-        if not has_valid_deadline:
-            # Check if regular period has fees configured
-            if fees.get('regular', {}).get('fees'):
-                return 'regular'
-            # Otherwise check if any period has fees
-            for period in ['early_bird', 'early', 'regular', 'late']:
-                if fees.get(period, {}).get('fees'):
-                    return period if period != 'early_bird' or fees.get('early_bird', {}).get('enabled') else 'regular'
-        
-        # If all deadlines have passed but fees exist, still allow 'regular' registration
-        # This prevents closing registration prematurely
-        if fees.get('regular', {}).get('fees'):
-            return 'regular'
-        
-        return 'closed'
+        return get_pricing_table().current_period()
     except Exception as e:
         print(f"Error determining registration period: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        # Fallback to 'regular' if fees exist
-        fees = get_registration_fees()
-        if fees and fees.get('regular', {}).get('fees'):
-            return 'regular'
         return 'closed'
 
 def format_currency(amount, currency_info):
@@ -6012,12 +5881,33 @@ def serve_upload(filename):
         print(f"Error serving file: {str(e)}")
         return "Error accessing file", 500
 
+# Storage prefixes whose objects are public (make_public on upload), so they may
+# be read with the app's credentials when a download only names them by URL
+PUBLIC_STORAGE_PREFIXES = ('downloads/', 'guidelines/', 'speakers/')
+
+def stream_public_storage_url(url, download_name, mimetype=None, allow_redirects=False):
+    """
+    Stream the file behind a public download URL, honouring Range and conditional requests.
+
+    Public objects in our bucket are read through the Storage client (ranged
+    reads, ETag/Last-Modified from the object); anything else is relayed over
+    HTTPS.  Returns None when the file cannot be fetched.
+    """
+    chunk_size = app.config.get('STORAGE_STREAM_CHUNK_SIZE', 1024 * 1024)
+    location = storage_location(url)
+    if location and location[1].startswith(PUBLIC_STORAGE_PREFIXES):
+        bucket = storage.bucket()
+        if location[0] == bucket.name:
+            blob = bucket.get_blob(location[1])
+            if blob is not None:
+                return stream_blob(blob, download_name, mimetype or blob.content_type or 'application/octet-stream', chunk_size)
+    return proxy_url(url, download_name, mimetype, chunk_size, allow_redirects=allow_redirects)
+
 @app.route('/download-firebase-file')
 def download_firebase_file():
     """Download files from Firebase Storage URLs with proper headers"""
     try:
         from urllib.parse import urlparse, unquote
-        import requests
         
         file_url = request.args.get('url')
         if not file_url:
@@ -6061,121 +5951,145 @@ def download_firebase_file():
         if not filename or filename == '.':
             filename = "download"
         
-        # Download the file from Firebase Storage with timeout and redirect disabled
-        response = requests.get(
-            file_url, 
-            stream=True, 
-            timeout=30,  # Prevent hanging
-            allow_redirects=False  # Prevent redirect-based SSRF
-        )
-        
-        if response.status_code != 200:
+        # Stream in chunks with Range/conditional support; redirects are not followed (SSRF)
+        response = stream_public_storage_url(file_url, filename)
+        if response is None:
             return "File not found", 404
-        
-        # Create a Flask response with proper headers for download
-        from flask import Response
-        
-        def generate():
-            for chunk in response.iter_content(chunk_size=8192):
-                yield chunk
-        
-        # Set headers to force download
-        headers = {
-            'Content-Disposition': f'attachment; filename="{filename}"',
-            'Content-Type': response.headers.get('Content-Type', 'application/octet-stream')
-        }
-        
-        return Response(
-            generate(),
-            headers=headers,
-            status=200
-        )
+        return response
         
     except Exception as e:
         print(f"Error downloading Firebase file: {str(e)}")
         return "Error downloading file", 500
 
 # Admin paper management routes
-@app.route('/admin/submissions')
-@login_required
-@admin_required
-def admin_submissions():
-    try:
-        all_submissions = {}
+def _admin_page_args():
+    """Cursor, direction and page size from the query string of an admin list page."""
+    return {
+        'cursor': request.args.get('cursor') or None,
+        'direction': 'newer' if request.args.get('direction') == 'newer' else 'older',
+        'page_size': parse_page_size(request.args.get('per_page'), app.config.get('ADMIN_PAGE_SIZE', 50)),
+    }
 
-        # Legacy/global paper submissions
-        papers = db.reference('papers').get() or {}
-        for paper_id, paper in papers.items():
-            if not paper:
-                continue
-            enriched = dict(paper)
-            enriched['_paper_id'] = paper_id
-            enriched['_conference_id'] = ''
-            enriched['_conference_name'] = 'General Submissions'
-            # Strip heavy base64 data for template rendering
-            enriched['file_data'] = bool(paper.get('file_data'))
-            file_history = paper.get('file_history', []) or []
-            if isinstance(file_history, dict):
-                file_history = list(file_history.values())
-            enriched['file_history'] = [
-                {k: v for k, v in entry.items() if k != 'file_data'}
-                for entry in file_history
-            ]
-            all_submissions[f'global::{paper_id}'] = enriched
+def _strip_file_data(paper):
+    """Copy of a paper without base64 payloads (the template only needs to know they exist)."""
+    enriched = dict(paper)
+    enriched['file_data'] = bool(paper.get('file_data'))
+    file_history = paper.get('file_history', []) or []
+    if isinstance(file_history, dict):
+        file_history = list(file_history.values())
+    enriched['file_history'] = [
+        {k: v for k, v in entry.items() if k != 'file_data'}
+        for entry in file_history
+        if isinstance(entry, dict)
+    ]
+    return enriched
 
-        # Conference-scoped submissions (new workflow)
-        conferences = get_all_conferences()
-        for conference_id, conference in conferences.items():
-            if not conference:
-                continue
-            conference_name = conference.get('basic_info', {}).get('name', 'Conference')
-            conference_papers = conference.get('paper_submissions', {}) or {}
+def _is_active_submission(paper):
+    return not paper.get('is_deleted') and (paper.get('status') or '').lower() != 'withdrawn'
 
-            for paper_id, paper in conference_papers.items():
-                if not paper:
-                    continue
-                if paper.get('is_deleted') or (paper.get('status') or '').lower() == 'withdrawn':
-                    continue
-                enriched = dict(paper)
-                enriched['_paper_id'] = paper_id
+def get_user_submission_summary(user_id, conference_id):
+    """Return {count, has_accepted} for a user's active submissions in a conference ('' = general)."""
+    if conference_id:
+        papers = query_by_child(f'conferences/{conference_id}/paper_submissions', 'user_id', user_id)
+    else:
+        papers = query_by_child('papers', 'user_id', user_id)
+    active = [paper for paper in papers.values() if isinstance(paper, dict) and _is_active_submission(paper)]
+    return {
+        'count': len(active),
+        'has_accepted': any((paper.get('status') or '').lower() == 'accepted' for paper in active),
+    }
+
+@app.route('/admin/submissions')
+@login_required
+@admin_required
+def admin_submissions():
+    conferences = get_conference_summaries()
+    filters = {
+        'conference': (request.args.get('conference') or '').strip(),
+        'status': (request.args.get('status') or '').strip().lower(),
+    }
+    submission_totals = {}
+    try:
+        submission_totals = get_stats().get('submissions') or {}
+        page_args = _admin_page_args()
+
+        # Conference filter picks the collections; status is applied per batch
+        if filters['conference'] == 'general':
+            paths = ['papers']
+        elif filters['conference']:
+            paths = [f"conferences/{filters['conference']}/paper_submissions"]
+        else:
+            paths = ['papers'] + [f'conferences/{conference_id}/paper_submissions' for conference_id in conferences]
+
+        def _matches(paper_id, paper):
+            if not _is_active_submission(paper):
+                return False
+            return not filters['status'] or (paper.get('status') or 'pending').lower() == filters['status']
+
+        page = fetch_merged_page(
+            paths,
+            'submitted_at',
+            predicate=_matches,
+            max_workers=app.config.get('CONFERENCE_SUMMARY_MAX_WORKERS', 8),
+            **page_args
+        )
+
+        sorted_papers = {}
+        for path, paper_id, paper in page['items']:
+            enriched = _strip_file_data(paper)
+            enriched['_paper_id'] = paper_id
+            if path == 'papers':
+                enriched['_conference_id'] = ''
+                enriched['_conference_name'] = 'General Submissions'
+                sorted_papers[f'global::{paper_id}'] = enriched
+            else:
+                conference_id = path.split('/')[1]
+                conference = conferences.get(conference_id) or {}
                 enriched['_conference_id'] = conference_id
-                enriched['_conference_name'] = conference_name
-                # Strip heavy base64 data for template rendering
-                enriched['file_data'] = bool(paper.get('file_data'))
-                file_history = paper.get('file_history', []) or []
-                if isinstance(file_history, dict):
-                    file_history = list(file_history.values())
-                enriched['file_history'] = [
-                    {k: v for k, v in entry.items() if k != 'file_data'}
-                    for entry in file_history
-                ]
-                all_submissions[f'{conference_id}::{paper_id}'] = enriched
-
-        # Sort papers by submission date (newest first)
-        sorted_papers = dict(sorted(
-            all_submissions.items(),
-            key=lambda x: x[1].get('submitted_at', ''),
-            reverse=True
-        ))
+                enriched['_conference_name'] = (conference.get('basic_info') or {}).get('name', 'Conference')
+                sorted_papers[f'{conference_id}::{paper_id}'] = enriched
 
-        # Calculate per-user submission counts & accepted status per conference
+        # Per-user submission counts & accepted status, only for the authors on this page
         user_conference_counts = {}  # (user_id, conference_id) -> {count, has_accepted}
-        for key, paper in sorted_papers.items():
-            user_id = paper.get('user_id') or paper.get('submitted_by') or ''
-            conf_id = paper.get('_conference_id', '')
-            uc_key = (user_id, conf_id)
-            if uc_key not in user_conference_counts:
-                user_conference_counts[uc_key] = {'count': 0, 'has_accepted': False}
-            user_conference_counts[uc_key]['count'] += 1
-            if (paper.get('status') or '').lower() == 'accepted':
-                user_conference_counts[uc_key]['has_accepted'] = True
+        for paper in sorted_papers.values():
+            user_id = paper.get('user_id') or ''
+            if user_id:
+                user_conference_counts.setdefault((user_id, paper.get('_conference_id', '')), None)
+        if user_conference_counts:
+            pairs = list(user_conference_counts)
+            with ThreadPoolExecutor(max_workers=min(len(pairs), app.config.get('CONFERENCE_SUMMARY_MAX_WORKERS', 8))) as executor:
+                for pair, summary in zip(pairs, executor.map(lambda uc: get_user_submission_summary(*uc), pairs)):
+                    user_conference_counts[pair] = summary
+
+        # Papers without a registration_id are linked through registration_index:
+        # prefetch each author's index node, then the registrations it points at,
+        # into the request cache so the lookups below are served locally
+        unlinked = {
+            (paper.get('user_id') or paper.get('submitted_by'), paper.get('_conference_id'))
+            for paper in sorted_papers.values()
+            if not (paper.get('registration_id') or '').strip()
+            and (paper.get('user_id') or paper.get('submitted_by')) and paper.get('_conference_id')
+        }
+        if unlinked:
+            max_workers = app.config.get('CONFERENCE_SUMMARY_MAX_WORKERS', 8)
+            indexes = cached_get_many(
+                [f'{REGISTRATION_INDEX_ROOT}/{user_id}' for user_id in sorted({user_id for user_id, _ in unlinked})],
+                max_workers=max_workers,
+            )
+            registration_ids = set()
+            for user_id, conference_id in unlinked:
+                index = indexes.get(f'{REGISTRATION_INDEX_ROOT}/{user_id}')
+                registration_id = index.get(conference_id) if isinstance(index, dict) else None
+                if isinstance(registration_id, str) and registration_id:
+                    registration_ids.add(registration_id)
+            cached_get_many([f'registrations/{registration_id}' for registration_id in sorted(registration_ids)], max_workers=max_workers)
 
         # Inject counts and linked registration id (for admin reassignment from submissions list)
         for key, paper in sorted_papers.items():
             user_id = paper.get('user_id') or paper.get('submitted_by') or ''
             conf_id = paper.get('_conference_id', '')
             uc_key = (user_id, conf_id)
-            info = user_conference_counts.get(uc_key, {'count': 1, 'has_accepted': False})
+            info = user_conference_counts.get(uc_key) or {'count': 1, 'has_accepted': False}
             paper['_user_submission_count'] = info['count']
             paper['_user_has_accepted'] = info['has_accepted']
             reg_id = (paper.get('registration_id') or '').strip()
@@ -6187,7 +6101,10 @@ def admin_submissions():
         return render_template(
             'admin/submissions.html',
             submissions=sorted_papers,
-            conferences=get_all_conferences(),
+            page=page,
+            filters=filters,
+            submission_totals=submission_totals,
+            conferences=conferences,
             site_design=get_site_design()
         )
     except Exception as e:
@@ -6196,143 +6113,276 @@ def admin_submissions():
         return render_template(
             'admin/submissions.html',
             submissions={},
-            conferences=get_all_conferences(),
+            page=None,
+            filters=filters,
+            submission_totals=submission_totals,
+            conferences=conferences,
             site_design=get_site_design()
         )
 
-@app.route('/admin/submissions/download-all')
-@login_required
-@admin_required
-def download_all_submissions():
-    try:
-        import zipfile
-        
-        all_submissions = {}
+def _submission_archive_filters():
+    return {
+        'conference': (request.args.get('conference') or '').strip(),
+        'status': (request.args.get('status') or '').strip().lower(),
+    }
 
-        # 1. Legacy/global paper submissions
-        papers = db.reference('papers').get() or {}
-        for paper_id, paper in papers.items():
-            if not paper:
-                continue
-            all_submissions[f'global::{paper_id}'] = {
-                'paper': paper,
-                'paper_id': paper_id,
-                'conference_id': ''
-            }
+# Paper fields an archive entry depends on (filters, entry name, file version);
+# file_data and file_history are never read to build the item list
+SUBMISSION_ARCHIVE_META_FIELDS = (
+    'is_deleted', 'status', 'authors', 'user_email', 'paper_title',
+    'file_name', 'updated_at', 'submitted_at', 'file_storage_path',
+)
 
-        # 2. Conference-scoped submissions
-        conferences = get_all_conferences()
-        for conference_id, conference in conferences.items():
-            if not conference:
+def _collect_submission_archive_items(filters):
+    """
+    ``[(path, paper_id, meta)]`` for the submissions an archive should contain.
+
+    Conference collections are read whole, one read each (their files live
+    in Storage).  Legacy papers/ records are listed shallowly; those still
+    carrying ``file_data`` or ``file_history`` get SUBMISSION_ARCHIVE_META_FIELDS
+    read one by one so no base64 payload is downloaded, the rest are read
+    whole.  ``meta['has_file_data']`` says whether the paper has an inline file.
+    """
+    # Conference filter picks the collections ('general' = legacy papers/)
+    if filters['conference'] == 'general':
+        conference_ids = []
+    elif filters['conference']:
+        conference_ids = [filters['conference']]
+    else:
+        conference_ids = list(get_conference_summaries())
+    paths = [f'conferences/{conference_id}/paper_submissions' for conference_id in conference_ids]
+
+    def _meta(paper):
+        meta = {field: paper[field] for field in SUBMISSION_ARCHIVE_META_FIELDS if paper.get(field) is not None}
+        meta['has_file_data'] = bool(paper.get('file_data'))
+        return meta
+
+    def _legacy_meta(paper_id):
+        keys = db.reference(f'papers/{paper_id}').get(shallow=True)
+        if not isinstance(keys, dict):
+            return None
+        if 'file_data' not in keys and 'file_history' not in keys:
+            paper = db.reference(f'papers/{paper_id}').get()
+            return _meta(paper) if isinstance(paper, dict) else None
+        meta = {'has_file_data': 'file_data' in keys}
+        for field in SUBMISSION_ARCHIVE_META_FIELDS:
+            if field in keys:
+                value = db.reference(f'papers/{paper_id}/{field}').get()
+                if value is not None:
+                    meta[field] = value
+        return meta
+
+    records = []
+    max_workers = app.config.get('BULK_READ_MAX_WORKERS', 16)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        collections = executor.map(lambda path: db.reference(path).get(), paths)
+        if filters['conference'] in ('', 'general'):
+            paper_ids = sorted(db.reference('papers').get(shallow=True) or {})
+            for paper_id, meta in zip(paper_ids, executor.map(_legacy_meta, paper_ids)):
+                if meta is not None:
+                    records.append(('papers', paper_id, meta))
+        for path, papers in zip(paths, collections):
+            if not isinstance(papers, dict):
                 continue
-            conference_papers = conference.get('paper_submissions', {}) or {}
-            for paper_id, paper in conference_papers.items():
-                if not paper or paper.get('is_deleted') or (paper.get('status') or '').lower() == 'withdrawn':
-                    continue
-                all_submissions[f'{conference_id}::{paper_id}'] = {
-                    'paper': paper,
-                    'paper_id': paper_id,
-                    'conference_id': conference_id
-                }
+            for paper_id in sorted(papers):
+                if isinstance(papers[paper_id], dict):
+                    records.append((path, paper_id, _meta(papers[paper_id])))
 
-        if not all_submissions:
-            flash('No submissions found to download.', 'error')
-            return redirect(url_for('admin_submissions'))
+    items = []
+    for path, paper_id, meta in records:
+        if not _is_active_submission(meta):
+            continue
+        if filters['status'] and (meta.get('status') or 'pending').lower() != filters['status']:
+            continue
+        if meta.get('file_storage_path') or meta['has_file_data']:
+            items.append((path, paper_id, meta))
+    return items
+
+def _load_submission_archive_entry(item, bucket):
+    """``(entry name, file bytes)`` for one archive item, or None to skip it."""
+    path, paper_id, meta = item
+    paper = meta
+    if not meta.get('file_storage_path'):
+        paper = dict(meta, file_data=db.reference(f'{path}/{paper_id}/file_data').get())
+    file_bytes = read_paper_file(paper, bucket, paper_id)
+    if file_bytes is None:
+        return None
+    return paper_archive_name(meta, paper_id), file_bytes
 
-        # 3. Create ZIP archive in-memory
-        zip_buffer = io.BytesIO()
-        added_filenames = set()
-        
-        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-            bucket = storage.bucket()
-            for key, data in all_submissions.items():
-                paper = data['paper']
-                paper_id = data['paper_id']
-                file_bytes = None
-                
-                file_storage_path = paper.get('file_storage_path')
-                if file_storage_path:
-                    try:
-                        blob = bucket.blob(file_storage_path)
-                        file_bytes = blob.download_as_bytes()
-                    except Exception as storage_err:
-                        print(f"Error downloading paper {paper_id} from Firebase Storage: {storage_err}")
-                        continue
-                else:
-                    file_base64 = paper.get('file_data')
-                    if not file_base64:
-                        continue
-                    try:
-                        file_bytes = base64.b64decode(file_base64)
-                    except Exception as e:
-                        print(f"Error decoding file for paper {paper_id}: {str(e)}")
-                        continue
+def _submission_archive_manifest(items):
+    """What the archive's bytes depend on: entry order, names and file versions."""
+    return [
+        [path, paper_id, paper_archive_name(meta, paper_id),
+         meta.get('updated_at') or meta.get('submitted_at') or '',
+         meta.get('file_storage_path') or 'inline']
+        for path, paper_id, meta in items
+    ]
 
-                # Get author name
-                author_name = "unknown"
-                authors = paper.get('authors')
-                if authors:
-                    if isinstance(authors, list) and len(authors) > 0 and isinstance(authors[0], dict):
-                        author_name = authors[0].get('name', 'unknown')
-                    elif isinstance(authors, dict):
-                        first_author = next(iter(authors.values()), {})
-                        if isinstance(first_author, dict):
-                            author_name = first_author.get('name', 'unknown')
-                elif paper.get('user_email'):
-                    author_name = paper.get('user_email').split('@')[0]
-
-                paper_title = paper.get('paper_title', 'untitled')
-
-                # Sanitize components for safe file name in ZIP
-                safe_author = secure_filename(author_name) or 'unknown'
-                safe_title = secure_filename(paper_title) or 'untitled'
-                safe_paper_id = secure_filename(paper_id)
-
-                original_filename = paper.get('file_name', 'paper.pdf')
-                _, ext = os.path.splitext(original_filename)
-                if not ext or len(ext) > 10:
-                    ext = '.pdf'
-
-                zip_filename = f"{safe_author}_{safe_title}_{safe_paper_id}{ext}"
-                if len(zip_filename) > 120:
-                    name_part = f"{safe_author[:30]}_{safe_title[:50]}_{safe_paper_id}"
-                    zip_filename = f"{name_part}{ext}"
-
-                # Ensure unique filename within the archive
-                counter = 1
-                base_zip_filename = zip_filename
-                while zip_filename in added_filenames:
-                    name_part, ext_part = os.path.splitext(base_zip_filename)
-                    zip_filename = f"{name_part}_{counter}{ext_part}"
-                    counter += 1
-
-                added_filenames.add(zip_filename)
-                zip_file.writestr(zip_filename, file_bytes)
-
-        if not added_filenames:
-            flash('No attachments found with valid file data.', 'error')
+def send_storage_file(storage_path, download_name, mimetype, as_attachment=True):
+    """Serve a Storage file as a signed-URL redirect, or chunked through the worker when disabled."""
+    return send_blob(
+        storage.bucket().blob(storage_path),
+        download_name,
+        mimetype,
+        use_signed_url=app.config.get('STORAGE_SIGNED_URLS_ENABLED', True),
+        expiration_minutes=app.config.get('SIGNED_URL_EXPIRATION_MINUTES', 15),
+        chunk_size=app.config.get('STORAGE_STREAM_CHUNK_SIZE', 1024 * 1024),
+        as_attachment=as_attachment,
+    )
+
+def paper_download_as_attachment(mimetype):
+    """?inline=1 previews PDFs in the browser; any other type is always downloaded.
+
+    The stored file type comes from the uploader, so rendering e.g. text/html
+    inline would serve attacker-controlled markup from this origin.
+    """
+    return not (request.args.get('inline') == '1' and mimetype == 'application/pdf')
+
+def _submission_archive_download_name():
+    return f"GIIP_submissions_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip"
+
+def _stream_submission_archive(items):
+    """Stream a ZIP of ``items`` straight to the client (no cached artifact)."""
+    bucket = storage.bucket()
+    stats = {}
+    chunks = stream_zip(
+        items,
+        lambda item: _load_submission_archive_entry(item, bucket),
+        max_workers=app.config.get('SUBMISSION_ARCHIVE_MAX_WORKERS', 4),
+        prefetch=app.config.get('SUBMISSION_ARCHIVE_PREFETCH', 8),
+        stats=stats,
+    )
+    # Runs until the first entry is written (or every item was skipped)
+    first_chunk = next(chunks)
+    if not stats['entries']:
+        chunks.close()
+        flash('No attachments found with valid file data.', 'error')
+        return redirect(url_for('admin_submissions'))
+
+    def _generate():
+        yield first_chunk
+        try:
+            yield from chunks
+        finally:
+            chunks.close()
+            print(f"Streamed submissions archive: {stats['entries']} files, {stats['skipped']} skipped")
+
+    response = app.response_class(_generate(), mimetype='application/zip', direct_passthrough=True)
+    response.headers['Content-Disposition'] = f'attachment; filename="{_submission_archive_download_name()}"'
+    response.headers['X-Content-Type-Options'] = 'nosniff'
+    response.headers['Cache-Control'] = 'no-cache, no-store, must-revalidate'
+    # Let nginx pass chunks through instead of buffering the whole archive
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
+
+def _archive_job_payload(job):
+    total = job.get('total') or 0
+    payload = {
+        'key': job.get('key'),
+        'status': job.get('status'),
+        'total': total,
+        'done': job.get('done') or 0,
+        'entries': job.get('entries') or 0,
+        'skipped': job.get('skipped') or 0,
+        'percent': int((job.get('done') or 0) * 100 / total) if total else 100,
+        'error': job.get('error'),
+    }
+    if job.get('status') == STATUS_READY:
+        payload['download_url'] = url_for('download_submissions_archive', key=job.get('key'))
+    return payload
+
+@app.route('/admin/submissions/download-all')
+@login_required
+@admin_required
+def download_all_submissions():
+    """
+    Download a ZIP of submission files, optionally filtered by ?conference= and ?status=.
+
+    With SUBMISSION_ARCHIVE_JOBS_ENABLED the archive is built by a background
+    job and cached in Storage (repeat downloads of unchanged papers redirect
+    straight to it); otherwise, or with ?stream=1, it is streamed directly.
+    """
+    filters = _submission_archive_filters()
+    try:
+        items = _collect_submission_archive_items(filters)
+        if not items:
+            flash('No submissions found to download.', 'error')
             return redirect(url_for('admin_submissions'))
 
-        zip_buffer.seek(0)
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        download_name = f"GIIP_submissions_{timestamp}.zip"
+        if not app.config.get('SUBMISSION_ARCHIVE_JOBS_ENABLED', True) or request.args.get('stream') == '1':
+            return _stream_submission_archive(items)
 
-        response = send_file(
-            zip_buffer,
-            mimetype='application/zip',
-            as_attachment=True,
-            download_name=download_name,
-            max_age=0
+        bucket = storage.bucket()
+        job = start_archive_job(
+            manifest_key(_submission_archive_manifest(items)),
+            items,
+            lambda item: _load_submission_archive_entry(item, bucket),
+            bucket,
+            created_by=current_user.id,
+            filters=filters,
+            max_workers=app.config.get('SUBMISSION_ARCHIVE_MAX_WORKERS', 4),
+            prefetch=app.config.get('SUBMISSION_ARCHIVE_PREFETCH', 8),
+            stale_seconds=app.config.get('SUBMISSION_ARCHIVE_JOB_STALE_SECONDS', 600),
         )
-        response.headers['X-Content-Type-Options'] = 'nosniff'
-        response.headers['Cache-Control'] = 'no-cache, no-store, must-revalidate'
-        return response
+        if job.get('status') == STATUS_READY:
+            return redirect(url_for('download_submissions_archive', key=job['key']))
+        return redirect(url_for('submissions_archive_job', key=job['key']))
 
     except Exception as e:
         print(f"Error bulk downloading papers: {str(e)}")
         flash(f'Error bulk downloading papers: {str(e)}', 'error')
         return redirect(url_for('admin_submissions'))
 
+@app.route('/admin/submissions/archives/<key>')
+@login_required
+@admin_required
+def submissions_archive_job(key):
+    job = get_archive_job(key)
+    if not job:
+        flash('Archive not found. Start a new download.', 'error')
+        return redirect(url_for('admin_submissions'))
+    return render_template(
+        'admin/submissions_archive.html',
+        job=_archive_job_payload(job),
+        site_design=get_site_design()
+    )
+
+@app.route('/admin/submissions/archives/<key>/status')
+@login_required
+@admin_required
+def submissions_archive_job_status(key):
+    job = get_archive_job(key)
+    if not job:
+        return jsonify({'success': False, 'error': 'Archive not found'}), 404
+    return jsonify({'success': True, 'job': _archive_job_payload(job)})
+
+@app.route('/admin/submissions/archives/<key>/download')
+@login_required
+@admin_required
+def download_submissions_archive(key):
+    job = get_archive_job(key)
+    if not job or job.get('status') != STATUS_READY:
+        flash('This archive is not ready yet.', 'error')
+        return redirect(url_for('admin_submissions'))
+    try:
+        signed_url = signed_archive_url(
+            storage.bucket(),
+            job,
+            _submission_archive_download_name(),
+            expiration_minutes=app.config.get('SIGNED_URL_EXPIRATION_MINUTES', 15),
+        )
+    except Exception as e:
+        # e.g. credentials without a private key cannot sign; build it inline instead
+        print(f"Error signing submissions archive URL: {str(e)}")
+        filters = job.get('filters') or {}
+        return redirect(url_for(
+            'download_all_submissions',
+            conference=filters.get('conference') or None,
+            status=filters.get('status') or None,
+            stream='1',
+        ))
+    return redirect(signed_url)
+
 @app.route('/admin/papers/<paper_id>/delete-attachment', methods=['POST'])
 @login_required
 @admin_required
@@ -6427,25 +6477,17 @@ def delete_paper_attachment(paper_id):
         
         # Also sync to user submissions index if conference-scoped
         if conference_id and paper.get('user_id'):
-            user_submissions_ref = db.reference(f'user_paper_submissions/{paper.get("user_id")}')
-            user_submissions = user_submissions_ref.get() or {}
-            for submission_id, submission in user_submissions.items():
-                if (
-                    submission
-                    and submission.get('conference_id') == conference_id
-                    and submission.get('paper_id') == paper_id
-                ):
-                    user_submissions_ref.child(submission_id).update({
-                        'file_data': None,
-                        'file_storage_path': None,
-                        'file_url': None,
-                        'full_paper_url': None,
-                        'full_paper_storage_path': None,
-                        'full_paper_name': None,
-                        'full_paper_size': None,
-                        'full_paper_submitted_at': None,
-                        'updated_at': datetime.now().isoformat()
-                    })
+            update_submission_index_entry(paper.get('user_id'), conference_id, paper_id, {
+                'file_data': None,
+                'file_storage_path': None,
+                'file_url': None,
+                'full_paper_url': None,
+                'full_paper_storage_path': None,
+                'full_paper_name': None,
+                'full_paper_size': None,
+                'full_paper_submitted_at': None,
+                'updated_at': datetime.now().isoformat()
+            })
                     
         return jsonify({'success': True, 'message': 'Attachment successfully deleted.'})
         
@@ -6567,25 +6609,17 @@ def delete_all_attachments():
             
             # Update user submissions index
             if conference_id and user_id:
-                user_subs_ref = db.reference(f'user_paper_submissions/{user_id}')
-                user_submissions = user_subs_ref.get() or {}
-                for sub_key, submission in user_submissions.items():
-                    if (
-                        submission
-                        and submission.get('conference_id') == conference_id
-                        and submission.get('paper_id') == paper_id
-                    ):
-                        user_subs_ref.child(sub_key).update({
-                            'file_data': None,
-                            'file_storage_path': None,
-                            'file_url': None,
-                            'full_paper_url': None,
-                            'full_paper_storage_path': None,
-                            'full_paper_name': None,
-                            'full_paper_size': None,
-                            'full_paper_submitted_at': None,
-                            'updated_at': datetime.now().isoformat()
-                        })
+                update_submission_index_entry(user_id, conference_id, paper_id, {
+                    'file_data': None,
+                    'file_storage_path': None,
+                    'file_url': None,
+                    'full_paper_url': None,
+                    'full_paper_storage_path': None,
+                    'full_paper_name': None,
+                    'full_paper_size': None,
+                    'full_paper_submitted_at': None,
+                    'updated_at': datetime.now().isoformat()
+                })
             count += 1
             
         return jsonify({
@@ -6627,6 +6661,7 @@ def update_paper_status(paper_id):
         }
         
         paper_ref.update(update_data)
+        record_submission_change(paper, update_data)
         
         # Get updated paper data for email
         updated_paper = paper_ref.get()
@@ -6637,24 +6672,16 @@ def update_paper_status(paper_id):
 
         # Keep user submission index in sync for conference submissions
         if conference_id and paper.get('user_id'):
-            user_submissions_ref = db.reference(f'user_paper_submissions/{paper.get("user_id")}')
-            user_submissions = user_submissions_ref.get() or {}
-            for submission_id, submission in user_submissions.items():
-                if (
-                    submission
-                    and submission.get('conference_id') == conference_id
-                    and submission.get('paper_id') == paper_id
-                ):
-                    user_submissions_ref.child(submission_id).update({
-                        'status': new_status,
-                        'updated_at': datetime.now().isoformat(),
-                        'reviewed_by': current_user.email
-                    })
+            update_submission_index_entry(paper.get('user_id'), conference_id, paper_id, {
+                'status': new_status,
+                'updated_at': datetime.now().isoformat(),
+                'reviewed_by': current_user.email
+            })
 
         # Unlock/lock conference payment based on paper review decision
         ensured_registration = None
         if conference_id and paper.get('user_id'):
-            registrations = db.reference('registrations').get() or {}
+            registrations = query_by_child('registrations', 'user_id', paper.get('user_id'))
             target_registration_id = (paper.get('registration_id') or '').strip()
             for registration_id, registration in registrations.items():
                 if not registration:
@@ -7158,6 +7185,7 @@ def submit_paper():
             print(f"Error uploading paper to Firebase Storage: {str(storage_err)}")
             new_paper.delete()
             raise Exception(f"Failed to upload paper file to storage: {str(storage_err)}")
+        record_submission_change(None, paper_data)
         
         # Add reference to user's papers
         user_papers_ref = db.reference(f'users/{current_user.id}/papers/{paper_id}')
@@ -7618,31 +7646,6 @@ def download_paper(paper_id):
             flash('Paper not found.', 'error')
             return redirect(url_for('admin_submissions'))
             
-        file_bytes = None
-        file_storage_path = paper.get('file_storage_path')
-        if file_storage_path:
-            try:
-                bucket = storage.bucket()
-                blob = bucket.blob(file_storage_path)
-                file_bytes = blob.download_as_bytes()
-            except Exception as storage_err:
-                print(f"Error downloading paper from Firebase Storage: {storage_err}")
-                flash('Could not download file from storage.', 'error')
-                return redirect(url_for('admin_submissions'))
-        else:
-            file_data = paper.get('file_data')
-            if not file_data:
-                flash('Paper file not found.', 'error')
-                return redirect(url_for('admin_submissions'))
-            try:
-                file_bytes = base64.b64decode(file_data)
-            except Exception as e:
-                print(f"Error decoding base64 file data: {e}")
-                flash('Error processing file data.', 'error')
-                return redirect(url_for('admin_submissions'))
-
-        file_obj = io.BytesIO(file_bytes)
-        
         # Generate a clean filename
         original_filename = paper.get('file_name', 'paper.pdf')
         safe_filename = secure_filename(original_filename)
@@ -7657,12 +7660,36 @@ def download_paper(paper_id):
         
         # Log download attempt
         print(f"Downloading paper {paper_id}: {safe_filename} ({mimetype})")
+
+        as_attachment = paper_download_as_attachment(mimetype)
+
+        file_storage_path = paper.get('file_storage_path')
+        if file_storage_path:
+            try:
+                return send_storage_file(file_storage_path, safe_filename, mimetype, as_attachment=as_attachment)
+            except Exception as storage_err:
+                print(f"Error downloading paper from Firebase Storage: {storage_err}")
+                flash('Could not download file from storage.', 'error')
+                return redirect(url_for('admin_submissions'))
+
+        file_data = paper.get('file_data')
+        if not file_data:
+            flash('Paper file not found.', 'error')
+            return redirect(url_for('admin_submissions'))
+        try:
+            file_bytes = base64.b64decode(file_data)
+        except Exception as e:
+            print(f"Error decoding base64 file data: {e}")
+            flash('Error processing file data.', 'error')
+            return redirect(url_for('admin_submissions'))
+
+        file_obj = io.BytesIO(file_bytes)
         
         # Send file with proper headers
         response = send_file(
             file_obj,
             mimetype=mimetype,
-            as_attachment=True,
+            as_attachment=as_attachment,
             download_name=safe_filename,
             max_age=0  # Prevent caching
         )
@@ -7735,27 +7762,6 @@ def download_paper_version(paper_id, version):
             file_name = history_entry.get('file_name', 'paper.pdf')
             file_type = history_entry.get('file_type', 'application/pdf')
 
-        if file_storage_path:
-            try:
-                bucket = storage.bucket()
-                blob = bucket.blob(file_storage_path)
-                file_bytes = blob.download_as_bytes()
-            except Exception as storage_err:
-                print(f"Error downloading paper version from Firebase Storage: {storage_err}")
-                flash('Could not download file version from storage.', 'error')
-                return redirect(url_for('admin_submissions'))
-        else:
-            if not file_data:
-                flash('Paper file not found for this version.', 'error')
-                return redirect(url_for('admin_submissions'))
-            try:
-                file_bytes = base64.b64decode(file_data)
-            except Exception as e:
-                print(f"Error decoding file data: {str(e)}")
-                flash('Error processing file data.', 'error')
-                return redirect(url_for('admin_submissions'))
-
-        file_obj = io.BytesIO(file_bytes)
         safe_filename_str = secure_filename(file_name)
 
         # Prefix version to filename for clarity
@@ -7769,10 +7775,32 @@ def download_paper_version(paper_id, version):
             if not mimetype:
                 mimetype = 'application/pdf'
 
+        as_attachment = paper_download_as_attachment(mimetype)
+
+        if file_storage_path:
+            try:
+                return send_storage_file(file_storage_path, safe_filename_str, mimetype, as_attachment=as_attachment)
+            except Exception as storage_err:
+                print(f"Error downloading paper version from Firebase Storage: {storage_err}")
+                flash('Could not download file version from storage.', 'error')
+                return redirect(url_for('admin_submissions'))
+
+        if not file_data:
+            flash('Paper file not found for this version.', 'error')
+            return redirect(url_for('admin_submissions'))
+        try:
+            file_bytes = base64.b64decode(file_data)
+        except Exception as e:
+            print(f"Error decoding file data: {str(e)}")
+            flash('Error processing file data.', 'error')
+            return redirect(url_for('admin_submissions'))
+
+        file_obj = io.BytesIO(file_bytes)
+
         response = send_file(
             file_obj,
             mimetype=mimetype,
-            as_attachment=True,
+            as_attachment=as_attachment,
             download_name=safe_filename_str,
             max_age=0
         )
@@ -7816,6 +7844,7 @@ default_content = {
         'images': [],
         'conference': {
             'name': 'Global Institute on Innovative Research',
+            'theme': 'Global Institute on Innovative Research',
             'date': 'TBA',
             'time': 'TBA',
             'city': 'TBA',
@@ -7846,66 +7875,150 @@ default_content = {
 def inject_year():
     return {'now': datetime.now()}
 
-@app.context_processor
-def inject_home_content():
+def _merge_home_content_defaults(home_content):
+    """Fill missing home_content fields with default_content."""
+    # A malformed section (wrong type) falls back to its defaults on its own
+    for key in ('welcome', 'hero', 'vmo', 'footer'):
+        if not isinstance(home_content.get(key), dict):
+            home_content[key] = {}
+    for key in ('associates', 'downloads'):
+        if key in home_content and not isinstance(home_content[key], (list, dict)):
+            del home_content[key]
+    if not isinstance(home_content['hero'].get('conference'), dict):
+        home_content['hero']['conference'] = {}
+    if 'images' in home_content['hero'] and not isinstance(home_content['hero']['images'], (list, dict)):
+        del home_content['hero']['images']
+    if not isinstance(home_content['footer'].get('social_media'), dict):
+        home_content['footer']['social_media'] = {}
+
+    # Ensure all required fields exist with defaults
+    home_content['welcome'].setdefault('title', default_content['welcome']['title'])
+    home_content['welcome'].setdefault('subtitle', default_content['welcome']['subtitle'])
+    home_content['welcome'].setdefault('conference_date', default_content['welcome']['conference_date'])
+    home_content['welcome'].setdefault('message', default_content['welcome']['message'])
+    home_content['welcome'].setdefault('subtitle_marquee', False)
+    
+    if 'hero' not in home_content:
+        home_content['hero'] = {}
+    if 'images' not in home_content['hero']:
+        home_content['hero']['images'] = []
+    if 'conference' not in home_content['hero']:
+        home_content['hero']['conference'] = {}
+    home_content['hero']['conference'].setdefault('name', default_content['hero']['conference']['name'])
+    # Migrate: populate 'theme' from old 'name' field if 'theme' not yet saved
+    if not home_content['hero']['conference'].get('theme'):
+        home_content['hero']['conference']['theme'] = home_content['hero']['conference'].get('name') or default_content['hero']['conference']['theme']
+    home_content['hero']['conference'].setdefault('theme', default_content['hero']['conference']['theme'])
+    home_content['hero']['conference'].setdefault('date', default_content['hero']['conference']['date'])
+    home_content['hero']['conference'].setdefault('time', default_content['hero']['conference']['time'])
+    home_content['hero']['conference'].setdefault('city', default_content['hero']['conference']['city'])
+    home_content['hero']['conference'].setdefault('highlights', default_content['hero']['conference']['highlights'])
+    home_content['hero']['conference'].setdefault('show_countdown', False)
+    
+    if 'vmo' not in home_content:
+        home_content['vmo'] = {}
+    home_content['vmo'].setdefault('vision', default_content['vmo']['vision'])
+    home_content['vmo'].setdefault('mission', default_content['vmo']['mission'])
+    home_content['vmo'].setdefault('objectives', default_content['vmo']['objectives'])
+    
+    if 'associates' not in home_content:
+        home_content['associates'] = []
+    if 'downloads' not in home_content:
+        home_content['downloads'] = []
+    
+    if 'footer' not in home_content:
+        home_content['footer'] = {}
+    home_content['footer'].setdefault('contact_email', '')
+    home_content['footer'].setdefault('contact_phone', '')
+    home_content['footer'].setdefault('address', '')
+    home_content['footer'].setdefault('copyright', default_content['footer']['copyright'])
+    if 'social_media' not in home_content['footer']:
+        home_content['footer']['social_media'] = {}
+    home_content['footer']['social_media'].setdefault('facebook', '')
+    home_content['footer']['social_media'].setdefault('twitter', '')
+    home_content['footer']['social_media'].setdefault('linkedin', '')
+    return home_content
+
+def _load_site_snapshot():
+    """Build the chrome every page renders: home content, design theme, speaker and publications flags."""
+    data = cached_get_many(
+        ['home_content', 'site_design', 'speakers', 'publications_settings/visible'],
+        max_workers=4,
+    )
+    snapshot = _default_site_snapshot()
+
+    # Each part falls back on its own so one malformed node doesn't discard the rest
     try:
-        # Get home content from Firebase
-        content_ref = db.reference('home_content')
-        home_content = content_ref.get() or {}
-        
-        # Ensure all required fields exist with defaults
-        if not home_content or 'welcome' not in home_content:
-            home_content.setdefault('welcome', {})
-        home_content['welcome'].setdefault('title', default_content['welcome']['title'])
-        home_content['welcome'].setdefault('subtitle', default_content['welcome']['subtitle'])
-        home_content['welcome'].setdefault('conference_date', default_content['welcome']['conference_date'])
-        home_content['welcome'].setdefault('message', default_content['welcome']['message'])
-        home_content['welcome'].setdefault('subtitle_marquee', False)
-        
-        if 'hero' not in home_content:
-            home_content['hero'] = {}
-        if 'images' not in home_content['hero']:
-            home_content['hero']['images'] = []
-        if 'conference' not in home_content['hero']:
-            home_content['hero']['conference'] = {}
-        home_content['hero']['conference'].setdefault('name', default_content['hero']['conference']['name'])
-        # Migrate: populate 'theme' from old 'name' field if 'theme' not yet saved
-        if not home_content['hero']['conference'].get('theme'):
-            home_content['hero']['conference']['theme'] = home_content['hero']['conference'].get('name', default_content['hero']['conference']['theme'])
-        home_content['hero']['conference'].setdefault('theme', default_content['hero']['conference']['theme'])
-        home_content['hero']['conference'].setdefault('date', default_content['hero']['conference']['date'])
-        home_content['hero']['conference'].setdefault('time', default_content['hero']['conference']['time'])
-        home_content['hero']['conference'].setdefault('city', default_content['hero']['conference']['city'])
-        home_content['hero']['conference'].setdefault('highlights', default_content['hero']['conference']['highlights'])
-        home_content['hero']['conference'].setdefault('show_countdown', False)
-        
-        if 'vmo' not in home_content:
-            home_content['vmo'] = {}
-        home_content['vmo'].setdefault('vision', default_content['vmo']['vision'])
-        home_content['vmo'].setdefault('mission', default_content['vmo']['mission'])
-        home_content['vmo'].setdefault('objectives', default_content['vmo']['objectives'])
-        
-        if 'associates' not in home_content:
-            home_content['associates'] = []
-        if 'downloads' not in home_content:
-            home_content['downloads'] = []
-        
-        if 'footer' not in home_content:
-            home_content['footer'] = {}
-        home_content['footer'].setdefault('contact_email', '')
-        home_content['footer'].setdefault('contact_phone', '')
-        home_content['footer'].setdefault('address', '')
-        home_content['footer'].setdefault('copyright', default_content['footer']['copyright'])
-        if 'social_media' not in home_content['footer']:
-            home_content['footer']['social_media'] = {}
-        home_content['footer']['social_media'].setdefault('facebook', '')
-        home_content['footer']['social_media'].setdefault('twitter', '')
-        home_content['footer']['social_media'].setdefault('linkedin', '')
-        
-        return {'home_content': home_content}
+        home_content = data.get('home_content')
+        snapshot['home_content'] = _merge_home_content_defaults(
+            copy.deepcopy(home_content) if isinstance(home_content, dict) else {}
+        )
+    except Exception as e:
+        print(f"Error merging home content defaults: {str(e)}")
+
+    snapshot['site_design'] = data.get('site_design') or DEFAULT_THEME
+
+    speakers_data = data.get('speakers')
+    if isinstance(speakers_data, dict):
+        statuses = [s.get('status') for s in speakers_data.values() if isinstance(s, dict)]
+        snapshot['has_speakers'] = len(speakers_data) > 0
+        snapshot['has_current_speakers'] = any(status != 'past' for status in statuses)
+        snapshot['has_past_speakers'] = any(status == 'past' for status in statuses)
+
+    # Default to True when the key hasn't been set yet
+    visible = data.get('publications_settings/visible')
+    snapshot['publications_page_visible'] = visible if visible is not None else True
+    return snapshot
+
+def _default_site_snapshot():
+    return {
+        'home_content': copy.deepcopy(default_content),
+        'site_design': DEFAULT_THEME,
+        'has_speakers': False,
+        'has_current_speakers': False,
+        'has_past_speakers': False,
+        'publications_page_visible': True,
+    }
+
+# Shared by every worker request; admin routes that edit home content, the
+# design, speakers or publications settings call invalidate_site_snapshot().
+site_snapshot_cache = VersionedCache(
+    'site',
+    _load_site_snapshot,
+    ttl_seconds=app.config.get('SITE_SNAPSHOT_TTL', 300),
+    version_check_seconds=app.config.get('SITE_SNAPSHOT_VERSION_CHECK_SECONDS', 5),
+)
+
+def get_site_snapshot():
+    """Site snapshot for the current request (one copy of the worker cache per request)."""
+    if has_request_context() and getattr(g, '_site_snapshot', None) is not None:
+        return g._site_snapshot
+    try:
+        snapshot = site_snapshot_cache.get() or _default_site_snapshot()
     except Exception as e:
-        print(f"Error loading home content: {str(e)}")
-        return {'home_content': default_content}
+        print(f"Error loading site snapshot: {str(e)}")
+        snapshot = _default_site_snapshot()
+    if has_request_context():
+        g._site_snapshot = snapshot
+    return snapshot
+
+def invalidate_site_snapshot():
+    """Bump the shared site snapshot version after an admin edit."""
+    site_snapshot_cache.bump()
+    if has_request_context():
+        g._site_snapshot = None
+
+@app.context_processor
+def inject_site_snapshot():
+    """Home content, speaker flags and publications visibility for every template."""
+    snapshot = get_site_snapshot()
+    return {
+        'home_content': snapshot['home_content'],
+        'has_speakers': snapshot['has_speakers'],
+        'has_current_speakers': snapshot['has_current_speakers'],
+        'has_past_speakers': snapshot['has_past_speakers'],
+        'publications_page_visible': snapshot['publications_page_visible'],
+    }
 
 @app.context_processor
 def inject_seo_defaults():
@@ -8169,6 +8282,7 @@ def add_speaker():
             # Save speaker to Firebase
             speakers_ref = db.reference('speakers')
             speakers_ref.push(speaker_data)
+            invalidate_site_snapshot()
             
             flash('Speaker added successfully!', 'success')
             return redirect(url_for('admin_speakers'))
@@ -8264,6 +8378,7 @@ def edit_speaker(speaker_id):
             
             # Update speaker in Firebase
             speaker_ref.update(speaker_data)
+            invalidate_site_snapshot()
             
             flash('Speaker updated successfully!', 'success')
             return redirect(url_for('admin_speakers'))
@@ -8325,48 +8440,13 @@ def delete_speaker(speaker_id):
         
         # Delete speaker from Firebase
         speaker_ref.delete()
+        invalidate_site_snapshot()
         
         return jsonify({'success': True})
     except Exception as e:
         print(f"Error deleting speaker: {str(e)}")
         return jsonify({'success': False, 'error': str(e)}), 500
 
-# Add this context processor after existing ones
-@app.context_processor
-def inject_has_speakers():
-    try:
-        # Check if there are any speakers in Firebase
-        speakers_ref = db.reference('speakers')
-        speakers_data = speakers_ref.get() or {}
-        has_speakers = len(speakers_data) > 0
-        
-        # Count current and past speakers
-        current_speakers_count = sum(1 for s in speakers_data.values() if s.get('status') != 'past')
-        past_speakers_count = sum(1 for s in speakers_data.values() if s.get('status') == 'past')
-        
-        return {
-            'has_speakers': has_speakers,
-            'has_current_speakers': current_speakers_count > 0,
-            'has_past_speakers': past_speakers_count > 0
-        }
-    except Exception as e:
-        print(f"Error checking speakers: {str(e)}")
-        return {
-            'has_speakers': False,
-            'has_current_speakers': False,
-            'has_past_speakers': False
-        }
-
-@app.context_processor
-def inject_publications_visibility():
-    """Expose publications page visibility flag to every template."""
-    try:
-        visible = db.reference('publications_settings/visible').get()
-        # Default to True when the key hasn't been set yet
-        return dict(publications_page_visible=visible if visible is not None else True)
-    except Exception:
-        return dict(publications_page_visible=True)
-
 @app.context_processor
 def inject_admin_menu():
     admin_menu = [
@@ -8505,7 +8585,6 @@ def download_template(download_id):
         file_type = item.get('file_type', '')
         original_filename = f"{secure_filename(title)}.{file_type}" if file_type else secure_filename(title)
 
-        import urllib.request
         import mimetypes
         mime_type, _ = mimetypes.guess_type(original_filename)
         mime_type = mime_type or 'application/octet-stream'
@@ -8513,13 +8592,10 @@ def download_template(download_id):
         # 1. Firebase Storage public URL — most reliable
         if firebase_url and firebase_url.startswith('http'):
             try:
-                req = urllib.request.Request(firebase_url, headers={'User-Agent': 'Mozilla/5.0'})
-                with urllib.request.urlopen(req, timeout=15) as resp:
-                    file_data = resp.read()
-                response = make_response(file_data)
-                response.headers['Content-Type'] = mime_type
-                response.headers['Content-Disposition'] = f'attachment; filename="{original_filename}"'
-                return response
+                response = stream_public_storage_url(firebase_url, original_filename, mime_type)
+                if response is not None:
+                    return response
+                print(f"Firebase proxy error for {download_id}: file not available")
             except Exception as proxy_err:
                 print(f"Firebase proxy error for {download_id}: {proxy_err}")
 
@@ -8541,13 +8617,10 @@ def download_template(download_id):
         for candidate in [file_url, external_url]:
             if candidate and candidate.startswith('http'):
                 try:
-                    req = urllib.request.Request(candidate, headers={'User-Agent': 'Mozilla/5.0'})
-                    with urllib.request.urlopen(req, timeout=15) as resp:
-                        file_data = resp.read()
-                    response = make_response(file_data)
-                    response.headers['Content-Type'] = mime_type
-                    response.headers['Content-Disposition'] = f'attachment; filename="{original_filename}"'
-                    return response
+                    response = stream_public_storage_url(candidate, original_filename, mime_type, allow_redirects=True)
+                    if response is not None:
+                        return response
+                    print(f"Proxy download error for {download_id} ({candidate}): file not available")
                 except Exception as proxy_err:
                     print(f"Proxy download error for {download_id} ({candidate}): {proxy_err}")
 
@@ -8566,13 +8639,11 @@ def download_template(download_id):
                     download_ref = db.reference(f'downloads/{download_id}')
                     download_ref.update({'firebase_url': fb_url})
                     print(f"Auto-recovered firebase_url for {download_id}: {fb_url}")
-                    req = urllib.request.Request(fb_url, headers={'User-Agent': 'Mozilla/5.0'})
-                    with urllib.request.urlopen(req, timeout=15) as resp:
-                        file_data = resp.read()
-                    response = make_response(file_data)
-                    response.headers['Content-Type'] = mime_type
-                    response.headers['Content-Disposition'] = f'attachment; filename="{original_filename}"'
-                    return response
+                    blob.reload()
+                    return stream_blob(
+                        blob, original_filename, mime_type,
+                        app.config.get('STORAGE_STREAM_CHUNK_SIZE', 1024 * 1024)
+                    )
             except Exception as fb_err:
                 print(f"Firebase Storage fallback failed for {download_id}: {fb_err}")
 
@@ -9041,7 +9112,7 @@ def get_public_gallery_images(conference_id):
 def galleries():
     """Public gallery view showing all conference galleries"""
     try:
-        conferences = get_all_conferences()
+        conferences = get_conference_summaries()
 
         # Filter conferences to only show those with enabled galleries
         visible_conferences = {}
@@ -9148,6 +9219,7 @@ def toggle_gallery_visibility(conference_id):
         # Update conference settings
         conference_ref = db.reference(f'conferences/{conference_id}')
         conference_ref.child('settings').child('gallery_enabled').set(enabled)
+        invalidate_conference_cache()
 
         return jsonify({'success': True, 'message': 'Gallery visibility updated'})
 
@@ -9193,6 +9265,7 @@ def save_gallery_summary(conference_id):
         # Save to Firebase
         summary_ref = db.reference(f'conferences/{conference_id}/gallery_summary')
         summary_ref.set(summary_data)
+        invalidate_conference_cache()
         
         print(f"Gallery summary saved for conference {conference_id}")
         return jsonify({'success': True, 'message': 'Gallery summary saved successfully'})
@@ -9528,6 +9601,7 @@ def edit_user_info(user_id):
             # Update in Firebase
             user_ref = db.reference(f'users/{user_id}')
             user_ref.update(updated_data)
+            invalidate_user_profile(user_id)
 
             print(f"DEBUG: User {user_id} updated successfully")
             return jsonify({'success': True, 'message': 'User information updated successfully'})
@@ -9774,6 +9848,8 @@ def clean_all_galleries():
             
             if gallery_images or attendees or summary_data:
                 deleted_count['conferences'] += 1
+
+        invalidate_conference_cache()
         
         flash(f'Gallery cleanup complete! Deleted {deleted_count["images"]} images, {deleted_count["attendees"]} attendees, {deleted_count["summaries"]} summaries from {deleted_count["conferences"]} conferences.', 'success')
         return redirect(url_for('admin_conference_galleries'))
@@ -9812,40 +9888,73 @@ def generate_gradient_colors(conference_id):
 def get_all_conferences():
     """Get all conferences from Firebase"""
     try:
-        conferences_ref = db.reference('conferences')
-        conferences = conferences_ref.get() or {}
+        conferences = cached_get('conferences') or {}
         return conferences
     except Exception as e:
         print(f"Error getting conferences: {e}")
         return {}
 
+def _load_conference_summaries():
+    """Load the projected conference listing (basic_info, settings, code, gallery summary)."""
+    return fetch_conference_summaries(
+        max_workers=app.config.get('CONFERENCE_SUMMARY_MAX_WORKERS', 8)
+    )
+
+# Summaries only hold admin-edited fields, so the cache only needs
+# invalidating from admin routes (see invalidate_conference_cache).
+conference_summary_cache = VersionedCache(
+    'conferences',
+    _load_conference_summaries,
+    ttl_seconds=app.config.get('CONFERENCE_CACHE_TTL', 300),
+    version_check_seconds=app.config.get('CONFERENCE_CACHE_VERSION_CHECK_SECONDS', 5),
+)
+
+def get_conference_summaries():
+    """Get projected conference data for listing pages from the worker cache.
+
+    Each entry only carries basic_info, settings, conference_code, gallery_summary
+    and display fields; use get_all_conferences() when submissions or
+    registrations are needed.
+    """
+    try:
+        return conference_summary_cache.get() or {}
+    except Exception as e:
+        print(f"Error getting conference summaries: {e}")
+        return {}
+
+def invalidate_conference_cache():
+    """Bump the shared conference cache version after an admin edit."""
+    conference_summary_cache.bump()
+
 def get_user_conference_registration(user_id, conference_id):
     """Return the latest registration tuple (registration_id, data) for a user and conference."""
     try:
-        registrations = db.reference('registrations').get() or {}
-        matches = []
+        if not user_id or not conference_id:
+            return None, None
 
-        for registration_id, registration in registrations.items():
+        # Fast path: registration_index/{user_id}/{conference_id} -> registration_id
+        indexed_id = cached_get(registration_index_path(user_id, conference_id))
+        if indexed_id:
+            registration = cached_get(f'registrations/{indexed_id}')
             if (
                 registration
                 and registration.get('user_id') == user_id
                 and registration.get('conference_id') == conference_id
             ):
-                matches.append((registration_id, registration))
-
-        if not matches:
+                return indexed_id, registration
+        elif is_registration_index_ready():
             return None, None
 
-        matches.sort(
-            key=lambda item: (
-                item[1].get('updated_at')
-                or item[1].get('created_at')
-                or item[1].get('submission_date')
-                or ''
-            ),
-            reverse=True
-        )
-        return matches[0]
+        # Index not built yet or pointing at a moved registration: query and repair
+        registrations = query_by_child('registrations', 'user_id', user_id)
+        registration_id, registration = find_latest_registration(registrations, user_id, conference_id)
+        if registration_id != indexed_id:
+            try:
+                refresh_registration_index(user_id, conference_id, registrations)
+                invalidate_path(registration_index_path(user_id, conference_id))
+            except Exception as index_err:
+                print(f"Warning: could not repair registration index: {index_err}")
+        return registration_id, registration
     except Exception as e:
         print(f"Error getting user conference registration: {e}")
         return None, None
@@ -9897,20 +10006,7 @@ def get_latest_user_conference_submission(user_id, conference_id):
 def upsert_user_conference_submission_index(user_id, conference_id, paper_id, payload):
     """Create or update user submission index entry for a conference paper."""
     try:
-        user_submissions_ref = db.reference(f'user_paper_submissions/{user_id}')
-        indexed_submissions = user_submissions_ref.get() or {}
-
-        for index_id, indexed_submission in indexed_submissions.items():
-            if (
-                indexed_submission
-                and indexed_submission.get('conference_id') == conference_id
-                and indexed_submission.get('paper_id') == paper_id
-            ):
-                user_submissions_ref.child(index_id).update(payload)
-                return index_id
-
-        new_ref = user_submissions_ref.push(payload)
-        return new_ref.key
+        return upsert_submission_index_entry(user_id, conference_id, paper_id, payload)
     except Exception as e:
         print(f"Error upserting user submission index: {e}")
         return None
@@ -9933,7 +10029,7 @@ def get_conference_submission_for_user(user_id, conference_id, paper_id, include
 def get_active_registration_submission(user_id, conference_id, registration_id=None):
     """Return latest active (not withdrawn/deleted) submission for a registration."""
     try:
-        submissions = db.reference(f'conferences/{conference_id}/paper_submissions').get() or {}
+        submissions = query_by_child(f'conferences/{conference_id}/paper_submissions', 'user_id', user_id)
         matches = []
 
         for paper_id, submission in submissions.items():
@@ -9972,10 +10068,15 @@ def _safe_float(value, default=0.0):
     except (TypeError, ValueError):
         return default
 
-def get_latest_accepted_conference_submission(user_id, conference_id):
-    """Return latest accepted conference submission tuple (paper_id, data) for a user."""
+def get_latest_accepted_conference_submission(user_id, conference_id, submissions=None):
+    """Return latest accepted conference submission tuple (paper_id, data) for a user.
+
+    ``submissions`` is an optional snapshot of the user's rows in the conference
+    (used when planning a write that has not been applied yet).
+    """
     try:
-        submissions = db.reference(f'conferences/{conference_id}/paper_submissions').get() or {}
+        if submissions is None:
+            submissions = query_by_child(f'conferences/{conference_id}/paper_submissions', 'user_id', user_id)
         matches = []
 
         for paper_id, submission in submissions.items():
@@ -10005,7 +10106,7 @@ def get_latest_accepted_conference_submission(user_id, conference_id):
         print(f"Error getting latest accepted conference submission: {e}")
         return None, None
 
-def move_paper_submissions_for_registration_reassign(
+def plan_paper_submissions_for_registration_reassign(
     old_conference_id,
     new_conference_id,
     registration_id,
@@ -10013,121 +10114,93 @@ def move_paper_submissions_for_registration_reassign(
     registration,
     new_conference,
     admin_email,
+    snapshot,
+    now_iso,
 ):
-    """Move conference paper_submissions rows linked to this registration from old conference to new.
+    """Plan moving conference paper_submissions rows linked to this registration from old conference to new.
 
     Without this, only the registration record moves; admin submissions still list the paper under the
     wrong conference and workflow/pricing see no submissions in the target conference.
-    """
-    moved_ids = []
-    try:
-        if (
-            not old_conference_id
-            or not new_conference_id
-            or old_conference_id == new_conference_id
-            or not user_id
-        ):
-            return moved_ids
 
-        old_papers = (
-            db.reference(f'conferences/{old_conference_id}/paper_submissions').get() or {}
+    Returns ``(updates, moved)``: root-relative update entries for the paper rows and their
+    user_paper_submissions entries, and ``{paper_id: new_paper}``. Nothing is written here.
+    """
+    if (
+        not old_conference_id
+        or not new_conference_id
+        or old_conference_id == new_conference_id
+        or not user_id
+    ):
+        return {}, {}
+
+    new_name = (new_conference.get('basic_info') or {}).get('name', 'Conference')
+    updates, moved = plan_paper_moves(
+        user_id,
+        registration_id,
+        registration,
+        old_conference_id,
+        new_conference_id,
+        new_name,
+        snapshot['old_papers'],
+        snapshot['new_papers'],
+        admin_email,
+        now_iso,
+    )
+    if moved:
+        updates.update(plan_submission_index_updates(
+            user_id,
+            snapshot['submission_index'],
+            old_conference_id,
+            new_conference_id,
+            moved,
+            now_iso,
+        ))
+    for paper_id in moved:
+        print(
+            f"[reassign] Moving paper {paper_id} from conference {old_conference_id} "
+            f"to {new_conference_id} (registration {registration_id})"
         )
-        new_name = (new_conference.get('basic_info') or {}).get('name', 'Conference')
-        linked_ids = set()
-        for key in ('paper_submission_id', 'paper_id'):
-            val = registration.get(key)
-            if val is not None and str(val).strip():
-                linked_ids.add(str(val).strip())
-
-        for paper_id, paper in old_papers.items():
-            if not paper:
-                continue
-            if paper.get('user_id') != user_id:
-                continue
-
-            pr = (paper.get('registration_id') or '').strip()
-            match_reg = pr == registration_id
-            match_id = paper_id in linked_ids
-            if not match_reg and not match_id:
-                continue
-
-            new_path = db.reference(f'conferences/{new_conference_id}/paper_submissions/{paper_id}')
-            if new_path.get():
-                print(
-                    f"[reassign] Target already has paper {paper_id}; not overwriting. "
-                    'Manual cleanup may be needed.'
-                )
-                continue
+    return updates, moved
+
+def _latest_active_submission(submissions):
+    """Latest non-deleted, non-withdrawn (paper_id, data) in a snapshot of conference paper rows."""
+    active = [
+        (paper_id, paper) for paper_id, paper in (submissions or {}).items()
+        if paper
+        and not paper.get('is_deleted')
+        and (paper.get('status') or '').lower() != 'withdrawn'
+    ]
+    if not active:
+        return None, None
+    paper_id, paper = max(active, key=lambda item: item[1].get('submitted_at', ''))
+    paper = dict(paper)
+    paper['paper_id'] = paper_id
+    paper.setdefault('status', 'pending')
+    return paper_id, paper
 
-            now_iso = datetime.now().isoformat()
-            new_paper = dict(paper)
-            new_paper['conference_id'] = new_conference_id
-            new_paper['conference_name'] = new_name
-            new_paper['registration_id'] = registration_id
-            new_paper['updated_at'] = now_iso
-            new_paper['reassigned_from_conference_id'] = old_conference_id
-            new_paper['reassigned_at'] = now_iso
-            new_paper['reassigned_by'] = admin_email
-
-            new_path.set(new_paper)
-            db.reference(f'conferences/{old_conference_id}/paper_submissions/{paper_id}').delete()
-            moved_ids.append(paper_id)
-
-            user_submissions_ref = db.reference(f'user_paper_submissions/{user_id}')
-            indexed = user_submissions_ref.get() or {}
-            for idx_id, sub in indexed.items():
-                if (
-                    sub
-                    and sub.get('paper_id') == paper_id
-                    and sub.get('conference_id') == old_conference_id
-                ):
-                    user_submissions_ref.child(idx_id).update({
-                        'conference_id': new_conference_id,
-                        'conference_name': new_name,
-                        'updated_at': now_iso,
-                    })
-            upsert_user_conference_submission_index(
-                user_id,
-                new_conference_id,
-                paper_id,
-                {
-                    'conference_id': new_conference_id,
-                    'paper_id': paper_id,
-                    'registration_id': registration_id,
-                    'conference_name': new_name,
-                    'paper_title': new_paper.get('paper_title', 'Untitled'),
-                    'status': (new_paper.get('status') or 'pending'),
-                    'is_deleted': False,
-                    'submitted_at': new_paper.get('submitted_at', now_iso),
-                    'updated_at': now_iso,
-                },
-            )
-            print(
-                f"[reassign] Moved paper {paper_id} from conference {old_conference_id} "
-                f"to {new_conference_id} (registration {registration_id})"
-            )
-    except Exception as e:
-        print(f"Error moving paper submissions for registration reassign: {e}")
-        import traceback
-        traceback.print_exc()
-    return moved_ids
+def compute_registration_workflow_for_conference(user_id, conference_id, registration_data, submissions=None):
+    """Recompute paper / payment-unlock fields for a user after a registration is moved to another conference.
 
-def compute_registration_workflow_for_conference(user_id, conference_id, registration_data):
-    """Recompute paper / payment-unlock fields for a user after a registration is moved to another conference."""
+    Pass ``submissions`` (the user's rows in the conference's paper_submissions)
+    to compute against a planned state instead of reading the database.
+    """
     if not user_id or not conference_id:
         return {}
 
     accepted_submission_id, accepted_submission = get_latest_accepted_conference_submission(
-        user_id, conference_id
+        user_id, conference_id, submissions
     )
     has_accepted_submission = bool(accepted_submission_id and accepted_submission)
     reg_type = registration_data.get('registration_type') or 'regular_author'
     is_delegate_type = reg_type in ['physical_delegate', 'listener']
     payment_unlocked = has_accepted_submission or is_delegate_type
 
-    latest_submission_id, latest_submission = get_latest_user_conference_submission(
-        user_id, conference_id
-    )
+    if submissions is None:
+        latest_submission_id, latest_submission = get_latest_user_conference_submission(
+            user_id, conference_id
+        )
+    else:
+        latest_submission_id, latest_submission = _latest_active_submission(submissions)
 
     if has_accepted_submission:
         paper_status = 'accepted'
@@ -10162,42 +10235,26 @@ def compute_registration_workflow_for_conference(user_id, conference_id, registr
 
     return out
 
+def _as_pricing_table(fees):
+    """Accept a compiled PricingTable or a raw fees dict."""
+    if isinstance(fees, PricingTable):
+        return fees
+    return compile_pricing(fees if isinstance(fees, dict) else {})
+
 def _select_registration_period_for_fees(fees):
     """Select an available registration period for fee lookup."""
-    if not fees:
+    table = _as_pricing_table(fees)
+    if not table:
         return 'regular'
-
-    current_period = get_current_registration_period()
-    candidate_periods = []
-    if current_period and current_period != 'closed':
-        candidate_periods.append(current_period)
-    candidate_periods.extend(['regular', 'early_bird', 'early', 'late'])
-
-    for period in candidate_periods:
-        period_data = fees.get(period) if isinstance(fees, dict) else None
-        if isinstance(period_data, dict) and isinstance(period_data.get('fees'), dict):
-            return period
-    return 'regular'
+    return table.select_period(get_current_registration_period())
 
 def _select_default_registration_type(fees, registration_period):
     """Pick a sensible default registration type for auto-created registrations."""
-    preferred_types = [
-        'regular_author',
-        'student_author',
-        'physical_delegate',
-        'listener',
-        'listener'
-    ]
-    period_fees = ((fees or {}).get(registration_period) or {}).get('fees') or {}
-    for registration_type in preferred_types:
-        if registration_type in period_fees:
-            return registration_type
-    return 'regular_author'
+    return _as_pricing_table(fees).default_registration_type(registration_period)
 
 def _calculate_registration_amount(fees, registration_period, registration_type):
     """Calculate registration amount from configured fees."""
-    period_fees = ((fees or {}).get(registration_period) or {}).get('fees') or {}
-    return _safe_float(period_fees.get(registration_type), 0.0)
+    return _as_pricing_table(fees).base_price(registration_period, registration_type)
 
 def _as_bool(value):
     """Normalize booleans from mixed payload formats."""
@@ -10209,10 +10266,11 @@ def _as_bool(value):
         return value.strip().lower() in ['1', 'true', 'yes', 'on', 'y']
     return False
 
-def get_conference_submission_count(user_id, conference_id):
+def get_conference_submission_count(user_id, conference_id, submissions=None):
     """Count active (non-withdrawn) submissions for a user in a conference."""
     try:
-        submissions = db.reference(f'conferences/{conference_id}/paper_submissions').get() or {}
+        if submissions is None:
+            submissions = query_by_child(f'conferences/{conference_id}/paper_submissions', 'user_id', user_id)
         count = 0
         for _, submission in submissions.items():
             if not submission:
@@ -10229,16 +10287,18 @@ def get_conference_submission_count(user_id, conference_id):
         print(f"Error counting conference submissions: {e}")
         return 0
 
-def get_multi_submit_fee_info(user_id, conference_id):
+def get_multi_submit_fee_info(user_id, conference_id, submissions=None):
     """Return extra-paper pricing info for multi submissions.
     
     The $50 extra paper fee is waived when at least one paper is accepted.
     """
-    submission_count = get_conference_submission_count(user_id, conference_id)
+    if submissions is None:
+        submissions = query_by_child(f'conferences/{conference_id}/paper_submissions', 'user_id', user_id)
+    submission_count = get_conference_submission_count(user_id, conference_id, submissions)
     extra_paper_count = max(submission_count - 1, 0)
 
     # Check if user has at least one accepted paper -> waive extra fee
-    accepted_id, accepted_data = get_latest_accepted_conference_submission(user_id, conference_id)
+    accepted_id, accepted_data = get_latest_accepted_conference_submission(user_id, conference_id, submissions)
     fee_waived = bool(accepted_id and accepted_data)
 
     if fee_waived:
@@ -10257,17 +10317,7 @@ def get_multi_submit_fee_info(user_id, conference_id):
 
 def _calculate_optional_additional_amount(fees, workshop=False, banquet=False):
     """Calculate configured workshop/banquet add-ons (excludes extra-paper pricing)."""
-    additional_items = (fees or {}).get('additional_items') or {}
-    total = 0.0
-
-    for item_name, selected in [('workshop', workshop), ('banquet', banquet)]:
-        if not _as_bool(selected):
-            continue
-        item_data = additional_items.get(item_name) or {}
-        if item_data.get('enabled', False):
-            total += _safe_float(item_data.get('fee'), 0.0)
-
-    return round(total, 2)
+    return _as_pricing_table(fees).addons_amount(_as_bool(workshop), _as_bool(banquet))
 
 def calculate_conference_registration_pricing(
     user_id,
@@ -10276,16 +10326,21 @@ def calculate_conference_registration_pricing(
     registration_period,
     registration_type,
     workshop=False,
-    banquet=False
+    banquet=False,
+    submissions=None
 ):
-    """Calculate conference total with mandatory extra-paper surcharge for multi submissions."""
-    base_amount = _calculate_registration_amount(fees, registration_period, registration_type)
-    additional_amount = _calculate_optional_additional_amount(
-        fees,
-        workshop=workshop,
-        banquet=banquet
+    """Calculate conference total with mandatory extra-paper surcharge for multi submissions.
+
+    ``fees`` is preferably the conference's PricingTable (get_pricing_table);
+    a raw fees dict is compiled on the fly.
+    """
+    base_amount, additional_amount = _as_pricing_table(fees).price(
+        registration_period,
+        registration_type,
+        workshop=_as_bool(workshop),
+        banquet=_as_bool(banquet)
     )
-    extra_info = get_multi_submit_fee_info(user_id, conference_id)
+    extra_info = get_multi_submit_fee_info(user_id, conference_id, submissions)
     total_amount = round(base_amount + additional_amount + extra_info['extra_paper_fee_total'], 2)
 
     return {
@@ -10295,6 +10350,41 @@ def calculate_conference_registration_pricing(
         **extra_info
     }
 
+def compute_conference_registration_pricing_updates(registration_data, user_id, conference_id, fees, submissions=None):
+    """Pricing fields for a registration, or {} when it is already paid (no I/O beyond the submissions read)."""
+    payment_status = (registration_data.get('payment_status') or '').lower()
+    if payment_status == 'paid':
+        return {}
+
+    registration_period = (
+        registration_data.get('registration_period')
+        or _select_registration_period_for_fees(fees)
+    )
+    registration_type = (
+        registration_data.get('registration_type')
+        or _select_default_registration_type(fees, registration_period)
+    )
+    pricing = calculate_conference_registration_pricing(
+        user_id=user_id,
+        conference_id=conference_id,
+        fees=fees,
+        registration_period=registration_period,
+        registration_type=registration_type,
+        workshop=_as_bool(registration_data.get('workshop', False)),
+        banquet=_as_bool(registration_data.get('banquet', False)),
+        submissions=submissions
+    )
+    return {
+        'registration_period': registration_period,
+        'registration_type': registration_type,
+        'total_amount': pricing['total_amount'],
+        'extra_paper': pricing['extra_paper_count'] > 0,
+        'extra_paper_count': pricing['extra_paper_count'],
+        'extra_paper_fee_per_item': pricing['extra_paper_fee_per_item'],
+        'extra_paper_fee_total': pricing['extra_paper_fee_total'],
+        'updated_at': datetime.now().isoformat()
+    }
+
 def sync_conference_registration_pricing(registration_id, registration_data, user_id, conference_id, fees=None):
     """Persist pricing fields so dashboard/payment always use current multi-submit totals."""
     try:
@@ -10305,40 +10395,13 @@ def sync_conference_registration_pricing(registration_id, registration_data, use
         if payment_status == 'paid':
             return registration_data
 
-        fees = fees or get_registration_fees(conference_id) or {}
-        registration_period = (
-            registration_data.get('registration_period')
-            or _select_registration_period_for_fees(fees)
-        )
-        registration_type = (
-            registration_data.get('registration_type')
-            or _select_default_registration_type(fees, registration_period)
-        )
-        workshop_selected = _as_bool(registration_data.get('workshop', False))
-        banquet_selected = _as_bool(registration_data.get('banquet', False))
-
-        pricing = calculate_conference_registration_pricing(
-            user_id=user_id,
-            conference_id=conference_id,
-            fees=fees,
-            registration_period=registration_period,
-            registration_type=registration_type,
-            workshop=workshop_selected,
-            banquet=banquet_selected
+        fees = fees or get_pricing_table(conference_id)
+        update_data = compute_conference_registration_pricing_updates(
+            registration_data, user_id, conference_id, fees
         )
 
-        update_data = {
-            'registration_period': registration_period,
-            'registration_type': registration_type,
-            'total_amount': pricing['total_amount'],
-            'extra_paper': pricing['extra_paper_count'] > 0,
-            'extra_paper_count': pricing['extra_paper_count'],
-            'extra_paper_fee_per_item': pricing['extra_paper_fee_per_item'],
-            'extra_paper_fee_total': pricing['extra_paper_fee_total'],
-            'updated_at': datetime.now().isoformat()
-        }
-
-        db.reference(f'registrations/{registration_id}').update(update_data)
+        cached_update(f'registrations/{registration_id}', update_data)
+        record_registration_change(registration_data, update_data)
         merged = dict(registration_data)
         merged.update(update_data)
         return merged
@@ -10366,7 +10429,7 @@ def ensure_conference_registration_for_accepted_paper(user_id, conference_id, pa
             return None, None, False
 
         now_iso = datetime.now().isoformat()
-        fees = get_registration_fees(conference_id) or {}
+        fees = get_pricing_table(conference_id)
         registration_period = _select_registration_period_for_fees(fees)
         default_registration_type = _select_default_registration_type(fees, registration_period)
         default_pricing = calculate_conference_registration_pricing(
@@ -10466,7 +10529,8 @@ def ensure_conference_registration_for_accepted_paper(user_id, conference_id, pa
             else:
                 registration_update['workflow_status'] = 'paper_accepted_payment_unlocked'
 
-            db.reference(f'registrations/{registration_id}').update(registration_update)
+            cached_update(f'registrations/{registration_id}', registration_update)
+            record_registration_change(existing_registration, registration_update)
         else:
             registration_payload = {
                 'user_id': user_id,
@@ -10501,11 +10565,15 @@ def ensure_conference_registration_for_accepted_paper(user_id, conference_id, pa
             }
             new_registration_ref = db.reference('registrations').push(registration_payload)
             registration_id = new_registration_ref.key
+            set_registration_index(registration_id, user_id, conference_id)
+            record_registration_change(None, registration_payload)
+            invalidate_path(f'registrations/{registration_id}')
+            invalidate_path(registration_index_path(user_id, conference_id))
             created_new = True
 
         registration = db.reference(f'registrations/{registration_id}').get() or {}
 
-        db.reference(f'conferences/{conference_id}/paper_submissions/{paper_id}').update({
+        cached_update(f'conferences/{conference_id}/paper_submissions/{paper_id}', {
             'registration_id': registration_id,
             'updated_at': now_iso
         })
@@ -11549,7 +11617,7 @@ globalconferences.co.za
 def conference_discover():
     """Conference discovery page - list all available conferences from Firebase"""
     try:
-        conferences = get_all_conferences()
+        conferences = get_conference_summaries()
         
         # Normalize, compute status, and sort
         normalized_conferences = {}
@@ -11831,7 +11899,8 @@ def conference_registration(conference_id):
             pass  # Allow access to the form for all types
 
         if request.method == 'GET':
-            fees = get_registration_fees(conference_id)
+            pricing_table = get_pricing_table(conference_id)
+            fees = pricing_table.fees_dict()
             current_period = get_current_registration_period()
             form_registration_period = (
                 (existing_registration or {}).get('registration_period')
@@ -11845,7 +11914,7 @@ def conference_registration(conference_id):
                     registration_data=existing_registration,
                     user_id=current_user.id,
                     conference_id=conference_id,
-                    fees=fees
+                    fees=pricing_table
                 )
 
             can_pay = bool(
@@ -11920,7 +11989,7 @@ def conference_registration(conference_id):
                     'error': 'Payment has already started for this registration. Please complete payment first.'
                 }), 400
 
-            fees = get_registration_fees(conference_id)
+            fees = get_pricing_table(conference_id)
             if not fees:
                 return jsonify({
                     'success': False,
@@ -11929,8 +11998,7 @@ def conference_registration(conference_id):
 
             period = registration_data['registration_period']
             reg_type = registration_data['registration_type']
-            period_fees = (fees.get(period) or {}).get('fees') or {}
-            if reg_type not in period_fees:
+            if not fees.has_type(period, reg_type):
                 return jsonify({
                     'success': False,
                     'error': 'Invalid registration type for selected fee period.'
@@ -12019,6 +12087,8 @@ def conference_registration(conference_id):
             else:
                 new_registration_ref = registrations_ref.push(registration_record)
                 registration_id = new_registration_ref.key
+            set_registration_index(registration_id, current_user.id, conference_id)
+            record_registration_change(existing_registration, registration_record)
 
             stay_on_registration_raw = registration_data.get('stay_on_registration', False)
             if isinstance(stay_on_registration_raw, str):
@@ -12121,7 +12191,7 @@ def conference_create_payment(conference_id):
                 'error': 'Payment is locked until your paper is approved by admin.'
             }), 400
 
-        fees = get_registration_fees() or {}
+        fees = get_pricing_table()
         registration = sync_conference_registration_pricing(
             registration_id=registration_id,
             registration_data=registration,
@@ -12168,14 +12238,24 @@ def conference_create_payment(conference_id):
             }), 500
 
         transaction_reference = payment_result.get('transaction_reference', '')
-        db.reference(f'registrations/{registration_id}').update({
-            'payment_status': 'pending',
-            'payment_method': 'yoco',
-            'transaction_reference': transaction_reference,
-            'payment_id': payment_result.get('payment_id'),
-            'workflow_status': 'payment_initiated',
-            'updated_at': datetime.now().isoformat()
-        })
+        payment_updates = {
+            f'registrations/{registration_id}/{key}': value
+            for key, value in {
+                'payment_status': 'pending',
+                'payment_method': 'yoco',
+                'transaction_reference': transaction_reference,
+                'payment_id': payment_result.get('payment_id'),
+                'workflow_status': 'payment_initiated',
+                'updated_at': datetime.now().isoformat()
+            }.items()
+        }
+        # Record the reference -> registration mapping in the same write
+        payment_updates.update(payment_index_updates(
+            transaction_reference,
+            payment_index_entry(registration_id, current_user.id, conference_id, payment_result.get('payment_id'))
+        ))
+        db.reference('/').update(payment_updates)
+        record_registration_change(registration, {'payment_status': 'pending'})
 
         session['pending_conference_registration'] = {
             'conference_id': conference_id,
@@ -12439,6 +12519,7 @@ def conference_paper_submission(conference_id):
                 print(f"Error uploading paper to Firebase Storage: {str(storage_err)}")
                 new_paper.delete()
                 raise Exception(f"Failed to upload paper file to storage: {str(storage_err)}")
+            record_submission_change(None, paper_data)
 
             # Store in user's submissions index for easy access
             upsert_user_conference_submission_index(current_user.id, conference_id, paper_id, {
@@ -12754,6 +12835,7 @@ def edit_conference_submission(conference_id, paper_id):
         }
         update_data.update(file_update)
         paper_ref.update(update_data)
+        record_submission_change(paper, {'status': 'pending'})
 
         upsert_user_conference_submission_index(current_user.id, conference_id, paper_id, {
             'conference_id': conference_id,
@@ -12814,20 +12896,13 @@ def withdraw_conference_submission(conference_id, paper_id):
             'deleted_at': now_iso,
             'updated_at': now_iso
         })
+        record_submission_change(paper, {'status': 'withdrawn'})
 
-        user_submissions_ref = db.reference(f'user_paper_submissions/{current_user.id}')
-        indexed_submissions = user_submissions_ref.get() or {}
-        for index_id, indexed_submission in indexed_submissions.items():
-            if (
-                indexed_submission
-                and indexed_submission.get('conference_id') == conference_id
-                and indexed_submission.get('paper_id') == paper_id
-            ):
-                user_submissions_ref.child(index_id).update({
-                    'status': 'withdrawn',
-                    'is_deleted': True,
-                    'updated_at': now_iso
-                })
+        update_submission_index_entry(current_user.id, conference_id, paper_id, {
+            'status': 'withdrawn',
+            'is_deleted': True,
+            'updated_at': now_iso
+        })
 
         if registration_id and payment_status != 'paid':
             db.reference(f'registrations/{registration_id}').update({
@@ -12867,37 +12942,35 @@ def download_conference_submission(conference_id, paper_id):
             flash('Submission not found.', 'error')
             return redirect(url_for('conference_registration', conference_id=conference_id))
 
-        file_bytes = None
+        original_filename = paper.get('file_name', 'paper.pdf')
+        safe_filename = secure_filename(original_filename)
+
+        mimetype = paper.get('file_type')
+        if not mimetype or mimetype == 'application/octet-stream':
+            guessed_mimetype, _ = mimetypes.guess_type(original_filename)
+            mimetype = guessed_mimetype or 'application/pdf'
+
         file_storage_path = paper.get('file_storage_path')
         if file_storage_path:
             try:
-                bucket = storage.bucket()
-                blob = bucket.blob(file_storage_path)
-                file_bytes = blob.download_as_bytes()
+                return send_storage_file(file_storage_path, safe_filename, mimetype)
             except Exception as storage_err:
                 print(f"Error downloading file from Firebase Storage: {storage_err}")
                 flash('Could not download file from storage.', 'error')
                 return redirect(url_for('conference_submission_details', conference_id=conference_id, paper_id=paper_id))
-        else:
-            file_data = paper.get('file_data')
-            if not file_data:
-                flash('Paper file not found.', 'error')
-                return redirect(url_for('conference_submission_details', conference_id=conference_id, paper_id=paper_id))
-            try:
-                file_bytes = base64.b64decode(file_data)
-            except Exception as e:
-                print(f"Error decoding base64 file data: {e}")
-                flash('Error processing file data.', 'error')
-                return redirect(url_for('conference_submission_details', conference_id=conference_id, paper_id=paper_id))
 
-        file_obj = io.BytesIO(file_bytes)
-        original_filename = paper.get('file_name', 'paper.pdf')
-        safe_filename = secure_filename(original_filename)
+        file_data = paper.get('file_data')
+        if not file_data:
+            flash('Paper file not found.', 'error')
+            return redirect(url_for('conference_submission_details', conference_id=conference_id, paper_id=paper_id))
+        try:
+            file_bytes = base64.b64decode(file_data)
+        except Exception as e:
+            print(f"Error decoding base64 file data: {e}")
+            flash('Error processing file data.', 'error')
+            return redirect(url_for('conference_submission_details', conference_id=conference_id, paper_id=paper_id))
 
-        mimetype = paper.get('file_type')
-        if not mimetype or mimetype == 'application/octet-stream':
-            guessed_mimetype, _ = mimetypes.guess_type(original_filename)
-            mimetype = guessed_mimetype or 'application/pdf'
+        file_obj = io.BytesIO(file_bytes)
 
         response = send_file(
             file_obj,
@@ -13050,36 +13123,21 @@ def download_full_paper(conference_id, paper_id):
             flash('Submission not found.', 'error')
             return redirect(url_for('conference_registration', conference_id=conference_id))
 
-        file_bytes = None
         file_storage_path = paper.get('full_paper_storage_path')
         
         if not file_storage_path:
             flash('Full paper not found.', 'error')
             return redirect(url_for('conference_submission_details', conference_id=conference_id, paper_id=paper_id))
 
+        original_filename = paper.get('full_paper_name', 'full_paper.pdf')
+        safe_filename = secure_filename(original_filename)
+
         try:
-            bucket = storage.bucket()
-            blob = bucket.blob(file_storage_path)
-            file_bytes = blob.download_as_bytes()
+            return send_storage_file(file_storage_path, safe_filename, 'application/pdf')
         except Exception as storage_err:
             print(f"Error downloading full paper from Firebase Storage: {storage_err}")
             flash('Could not download file from storage.', 'error')
             return redirect(url_for('conference_submission_details', conference_id=conference_id, paper_id=paper_id))
-
-        file_obj = io.BytesIO(file_bytes)
-        original_filename = paper.get('full_paper_name', 'full_paper.pdf')
-        safe_filename = secure_filename(original_filename)
-
-        response = send_file(
-            file_obj,
-            mimetype='application/pdf',
-            as_attachment=True,
-            download_name=safe_filename,
-            max_age=0
-        )
-        response.headers['X-Content-Type-Options'] = 'nosniff'
-        response.headers['Cache-Control'] = 'no-cache, no-store, must-revalidate'
-        return response
     except Exception as e:
         print(f"Error downloading full paper: {e}")
         flash('Could not download full paper.', 'error')
@@ -13374,9 +13432,8 @@ def admin_conference_details(conference_id):
             flash('Conference not found.', 'error')
             return redirect(url_for('admin_conferences'))
         
-        # Get all registrations from the global registrations node
-        all_registrations_ref = db.reference('registrations')
-        all_registrations = all_registrations_ref.get() or {}
+        # Get this conference's registrations from the global registrations node
+        all_registrations = query_by_child('registrations', 'conference_id', conference_id)
         
         # Filter registrations for this specific conference
         conference_registrations = {}
@@ -13451,22 +13508,18 @@ def delete_conference(conference_id):
             return jsonify({'success': False, 'error': 'Conference not found'}), 404
         
         # Check if conference has registrations from global registrations node
-        all_registrations_ref = db.reference('registrations')
-        all_registrations = all_registrations_ref.get() or {}
-        
-        # Count registrations for this conference
-        has_registrations = False
-        for reg_id, reg_data in all_registrations.items():
-            if reg_data and reg_data.get('conference_id') == conference_id:
-                has_registrations = True
-                break
+        has_registrations = bool(query_by_child('registrations', 'conference_id', conference_id, limit=1))
         
         if has_registrations:
             return jsonify({'success': False, 'error': 'Cannot delete conference with existing registrations'}), 400
         
-        # Delete conference
-        conference_ref = db.reference(f'conferences/{conference_id}')
-        conference_ref.delete()
+        # Delete conference and release its code
+        delete_updates = {f'conferences/{conference_id}': None}
+        delete_updates.update(conference_code_index_updates(
+            conference_id, None, conference.get('conference_code')
+        ))
+        db.reference('/').update(delete_updates)
+        invalidate_conference_cache()
         
         return jsonify({'success': True, 'message': 'Conference deleted successfully'})
         
@@ -13498,6 +13551,7 @@ def update_conference_settings(conference_id):
         }
         
         settings_ref.update(settings_data)
+        invalidate_conference_cache()
         flash('Conference settings updated successfully.', 'success')
         
     except Exception as e:
@@ -13611,6 +13665,7 @@ def edit_conference(conference_id):
                 'updated_at': datetime.now().isoformat(),
                 'updated_by': current_user.email
             })
+            invalidate_conference_cache()
             
             flash(f'Conference "{basic_info["name"]}" updated successfully.', 'success')
             return redirect(url_for('admin_conference_details', conference_id=conference_id))
@@ -13643,12 +13698,16 @@ def regenerate_conference_code(conference_id):
         year = conference['basic_info'].get('year', datetime.now().year)
         new_code = generate_conference_code(abbr, year)
         
-        # Update conference code
-        conference_ref = db.reference(f'conferences/{conference_id}')
-        conference_ref.update({
-            'conference_code': new_code,
-            'code_generated_at': datetime.now().isoformat()
-        })
+        # Update the conference code and the code index in one write
+        code_updates = {
+            f'conferences/{conference_id}/conference_code': new_code,
+            f'conferences/{conference_id}/code_generated_at': datetime.now().isoformat(),
+        }
+        code_updates.update(conference_code_index_updates(
+            conference_id, new_code, conference.get('conference_code')
+        ))
+        db.reference('/').update(code_updates)
+        invalidate_conference_cache()
         
         return jsonify({'success': True, 'conference_code': new_code})
         
@@ -13676,35 +13735,46 @@ def assign_registrations_to_conference(conference_id):
                 flash('No registrations selected.', 'warning')
                 return redirect(url_for('admin_conference_details', conference_id=conference_id))
             
-            # Update registrations to assign them to this conference
-            updated_count = 0
-            for reg_id in selected_registrations:
-                # Get the registration from main collection
-                main_reg_ref = db.reference(f'registrations/{reg_id}')
-                registration_data = main_reg_ref.get()
-                
-                if registration_data:
-                    # Add assignment metadata
-                    registration_data['conference_id'] = conference_id
-                    registration_data['conference_name'] = conference['basic_info']['name']
-                    registration_data['assigned_at'] = datetime.now().isoformat()
-                    registration_data['assigned_by'] = current_user.email
-                    
-                    # Copy to conference-specific collection
-                    conference_reg_ref = db.reference(f'conferences/{conference_id}/registrations/{reg_id}')
-                    conference_reg_ref.set(registration_data)
-                    
-                    # Update main registration to mark as assigned
-                    main_reg_ref.update({
-                        'conference_id': conference_id,
-                        'conference_name': conference['basic_info']['name'],
-                        'assigned_at': datetime.now().isoformat(),
-                        'assigned_by': current_user.email
-                    })
-                    
-                    updated_count += 1
-            
+            # Read the selection concurrently, then assign everything in one write
+            max_workers = app.config.get('BULK_READ_MAX_WORKERS', 16)
+            registrations = fetch_registrations(selected_registrations, max_workers=max_workers)
+            moving_users = [
+                reg.get('user_id') for reg in registrations.values()
+                if isinstance(reg, dict) and reg.get('user_id')
+            ]
+            assign_updates, results = plan_bulk_assignment(
+                registrations,
+                conference_id,
+                conference['basic_info']['name'],
+                current_user.email,
+                datetime.now().isoformat(),
+                user_registrations=fetch_user_registrations(moving_users, max_workers=max_workers),
+            )
+            if assign_updates:
+                db.reference('/').update(assign_updates)
+                invalidate_path(f'conferences/{conference_id}')
+
+            updated_count = sum(1 for result in results if result['status'] == 'assigned')
+            failed = [result for result in results if result['status'] != 'assigned']
+            for result in failed:
+                print(f"[assign] Registration {result['registration_id']}: {result['status']} {result.get('error', '')}")
+
+            if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+                return jsonify({
+                    'success': not failed,
+                    'assigned': updated_count,
+                    'failed': len(failed),
+                    'results': results,
+                })
+
             flash(f'Successfully assigned {updated_count} registration(s) to {conference["basic_info"]["name"]}.', 'success')
+            if failed:
+                flash(
+                    f'{len(failed)} registration(s) could not be assigned: '
+                    + ', '.join(f"{result['registration_id']} ({result['status']})" for result in failed[:10])
+                    + (' ...' if len(failed) > 10 else ''),
+                    'warning'
+                )
             return redirect(url_for('admin_conference_details', conference_id=conference_id))
         
         # GET request - show available registrations
@@ -13772,12 +13842,14 @@ def unassign_registration_from_conference(conference_id):
         
         # Remove conference assignment from registration
         registration_ref = db.reference(f'registrations/{registration_id}')
+        registration_user_id = (registration_ref.child('user_id').get() or '')
         registration_ref.update({
             'conference_id': None,
             'conference_name': None,
             'unassigned_at': datetime.now().isoformat(),
             'unassigned_by': current_user.email
         })
+        refresh_registration_index(registration_user_id, conference_id)
         
         # Remove from conference-specific collection
         conference_reg_ref = db.reference(f'conferences/{conference_id}/registrations/{registration_id}')
@@ -13803,9 +13875,12 @@ def export_conference_registrations(conference_id):
             flash('Conference not found.', 'error')
             return redirect(url_for('admin_conference_details', conference_id=conference_id))
         
-        # Get registrations for this conference
-        registrations_ref = db.reference(f'conferences/{conference_id}/registrations')
-        registrations_data = registrations_ref.get() or {}
+        # Get registrations for this conference (global node, plus any legacy per-conference copies)
+        registrations_data = query_by_child('registrations', 'conference_id', conference_id)
+        legacy_registrations = db.reference(f'conferences/{conference_id}/registrations').get() or {}
+        for reg_id, reg in legacy_registrations.items():
+            if reg and reg_id not in registrations_data:
+                registrations_data[reg_id] = reg
         
         # Create CSV content
         import csv
@@ -13855,20 +13930,67 @@ def dashboard():
     try:
         user_registrations = {}
         user_submissions = {}
-        
-        # Get user's registrations from global registrations node
-        all_registrations_ref = db.reference('registrations')
-        all_registrations = all_registrations_ref.get() or {}
-        
+        user_id = current_user.id
+        max_workers = app.config.get('DASHBOARD_MAX_WORKERS', 8)
+
+        # Registrations, legacy submissions and the submission index are
+        # independent lookups, so they are issued together
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            registrations_future = executor.submit(query_by_child, 'registrations', 'user_id', user_id)
+            legacy_future = executor.submit(query_by_child, 'paper_submissions', 'user_id', user_id)
+            index_future = executor.submit(lambda: db.reference(f'user_paper_submissions/{user_id}').get() or {})
+            all_registrations = registrations_future.result()
+            all_submissions = legacy_future.result()
+            indexed_submissions = index_future.result()
+
+        # Every per-item read the page needs, fetched concurrently and once per path:
+        # conference headers, indexed papers and session chair records
+        conference_ids = {
+            registration.get('conference_id')
+            for registration in all_registrations.values()
+            if registration and registration.get('user_id') == user_id
+        }
+        submission_conference_ids = {
+            submission.get('conference_id')
+            for submission in list(all_submissions.values()) + list(indexed_submissions.values())
+            if isinstance(submission, dict)
+        }
+        paths = [f'conferences/{cid}/basic_info' for cid in conference_ids | submission_conference_ids if cid]
+        paths += [f'conferences/{cid}/session_chairs/{user_id}' for cid in submission_conference_ids if cid]
+        paths += [
+            f'conferences/{entry.get("conference_id")}/paper_submissions/{entry.get("paper_id")}'
+            for entry in indexed_submissions.values()
+            if isinstance(entry, dict) and entry.get('conference_id') and entry.get('paper_id')
+        ]
+        prefetched = cached_get_many(paths, max_workers=max_workers)
+
+        # Legacy fallback for indexed papers missing from their conference
+        fallback_paths = [
+            f'papers/{entry.get("paper_id")}'
+            for entry in indexed_submissions.values()
+            if isinstance(entry, dict) and entry.get('paper_id') and not prefetched.get(
+                f'conferences/{entry.get("conference_id")}/paper_submissions/{entry.get("paper_id")}'
+            )
+        ]
+        if fallback_paths:
+            prefetched.update(cached_get_many(fallback_paths, max_workers=max_workers))
+
+        def _dashboard_conference(conference_id):
+            basic_info = prefetched.get(f'conferences/{conference_id}/basic_info')
+            if basic_info:
+                return {'basic_info': basic_info}
+            # About Content synthetic ids have no conferences/ node
+            return get_conference_data(conference_id)
+
         # Filter registrations for current user
         for reg_id, registration in all_registrations.items():
-            if registration and registration.get('user_id') == current_user.id:
+            if registration and registration.get('user_id') == user_id:
                 # Get conference details if available
                 conference_id = registration.get('conference_id')
                 if not conference_id:
                     continue
                 if conference_id:
-                    conference = get_conference_data(conference_id)
+                    conference = _dashboard_conference(conference_id)
                     if conference:
                         registration['conference_details'] = {
                             'name': conference.get('basic_info', {}).get('name', 'Unknown'),
@@ -13889,24 +14011,22 @@ def dashboard():
             reverse=True
         ))
         
-        # Get user's legacy/global paper submissions
-        all_submissions = db.reference('paper_submissions').get() or {}
+        # User's legacy/global paper submissions
         for sub_id, submission in all_submissions.items():
-            if submission and submission.get('user_id') == current_user.id:
+            if submission and submission.get('user_id') == user_id:
                 user_submissions[f'legacy::{sub_id}'] = submission
 
-        # Get user's conference submissions via user index
-        indexed_submissions = db.reference(f'user_paper_submissions/{current_user.id}').get() or {}
+        # User's conference submissions via the user index
         for index_id, indexed_submission in indexed_submissions.items():
             conference_id = indexed_submission.get('conference_id')
             paper_id = indexed_submission.get('paper_id')
 
             submission_data = None
             if conference_id and paper_id:
-                submission_data = db.reference(f'conferences/{conference_id}/paper_submissions/{paper_id}').get()
+                submission_data = prefetched.get(f'conferences/{conference_id}/paper_submissions/{paper_id}')
 
             if not submission_data and paper_id:
-                submission_data = db.reference(f'papers/{paper_id}').get()
+                submission_data = prefetched.get(f'papers/{paper_id}')
 
             if submission_data:
                 submission_data = dict(submission_data)
@@ -13978,7 +14098,7 @@ def dashboard():
                 cid = sub.get('conference_id')
                 pid = sub.get('paper_id') or sub_key.split('::')[-1]
                 
-                sc_key = f"{cid}_{current_user.id}"
+                sc_key = f"{cid}_{user_id}"
                 if sc_key in seen_sc:
                     continue
                 seen_sc.add(sc_key)
@@ -13987,12 +14107,12 @@ def dashboard():
                 
                 sc_details = {}
                 if cid:
-                    sc_db = db.reference(f'conferences/{cid}/session_chairs/{current_user.id}').get()
+                    sc_db = prefetched.get(f'conferences/{cid}/session_chairs/{user_id}')
                     if sc_db and isinstance(sc_db, dict):
                         sc_details = sc_db
                         sc_status = sc_db.get('status', sc_status)
                         
-                conf_data = get_conference_data(cid) if cid else None
+                conf_data = _dashboard_conference(cid) if cid else None
                 conf_name = conf_data.get('basic_info', {}).get('name', 'Conference') if conf_data else sub.get('conference_name', 'Conference')
                 
                 session_chair_invitations.append({
@@ -14093,7 +14213,7 @@ def respond_session_chair():
             db.reference(f'conferences/{conference_id}/paper_submissions/{paper_id}').update({
                 'session_chair_status': status_val
             })
-            db.reference(f'user_paper_submissions/{current_user.id}/{paper_id}').update({
+            update_submission_index_entry(current_user.id, conference_id, paper_id, {
                 'session_chair_status': status_val
             })
 
@@ -14131,7 +14251,7 @@ def admin_update_session_chair_status(conference_id, user_id):
             db.reference(f'conferences/{conference_id}/paper_submissions/{paper_id}').update({
                 'session_chair_status': new_status
             })
-            db.reference(f'user_paper_submissions/{user_id}/{paper_id}').update({
+            update_submission_index_entry(user_id, conference_id, paper_id, {
                 'session_chair_status': new_status
             })
 
@@ -14450,10 +14570,12 @@ def get_conference_data(conference_id):
         dict: Conference data or None
     """
     try:
-        # Try to get from explicit conferences first
-        conferences = get_all_conferences()
-        if conference_id in conferences:
-            return conferences[conference_id]
+        # Try to get from explicit conferences first (served from the request
+        # cache when the whole tree has already been fetched)
+        if conference_id:
+            conference = cached_get(f'conferences/{conference_id}')
+            if conference:
+                return conference
 
         # Try resolving from Admin About Content synthetic entries
         return _get_about_content_conference(conference_id)
@@ -14461,25 +14583,6 @@ def get_conference_data(conference_id):
         print(f"Error getting conference data: {e}")
         return None
 
-def generate_conference_code(conference_abbr, year):
-    """
-    Generate a unique conference code for a conference
-
-    Args:
-        conference_abbr: Conference abbreviation (e.g., 'ETL', 'STM', 'TBME', 'SAT')
-        year: Conference year
-
-    Returns:
-        str: Unique conference code
-    """
-    import random
-    import string
-
-    # Generate 8-character alphanumeric unique ID
-    unique_id = ''.join(random.choices(string.ascii_uppercase + string.digits, k=8))
-
-    return f"CONF-{year}-{conference_abbr}-{unique_id}"
-
 def create_conference_with_code(conference_data):
     """
     Create a new conference with an auto-generated unique code
@@ -14503,6 +14606,8 @@ def create_conference_with_code(conference_data):
         # Save to Firebase
         conferences_ref = db.reference('conferences')
         new_conference_ref = conferences_ref.push(conference_data)
+        db.reference('/').update(conference_code_index_updates(new_conference_ref.key, conference_code))
+        invalidate_conference_cache()
 
         return {
             'conference_id': new_conference_ref.key,
@@ -14539,12 +14644,16 @@ def update_conference_code(conference_id, new_abbreviation=None):
         # Generate new conference code
         conference_code = generate_conference_code(abbr, year)
 
-        # Update in Firebase
-        conference_ref = db.reference(f'conferences/{conference_id}')
-        conference_ref.update({
-            'conference_code': conference_code,
-            'code_generated_at': datetime.now().isoformat()
-        })
+        # Update the conference and the code index in one write
+        code_updates = {
+            f'conferences/{conference_id}/conference_code': conference_code,
+            f'conferences/{conference_id}/code_generated_at': datetime.now().isoformat(),
+        }
+        code_updates.update(conference_code_index_updates(
+            conference_id, conference_code, conference.get('conference_code')
+        ))
+        db.reference('/').update(code_updates)
+        invalidate_conference_cache()
 
         return {
             'conference_code': conference_code,
@@ -14614,7 +14723,7 @@ def validate_conference_code():
         if not code:
             return jsonify({'valid': False, 'error': 'No code provided'}), 400
 
-        result = validate_conference_code(code)
+        result = check_conference_code(code)
 
         return jsonify(result)
 
@@ -14876,6 +14985,7 @@ def update_guest_speaker_status(application_id):
                 # Save speaker to Firebase
                 speakers_ref = db.reference('speakers')
                 speakers_ref.push(speaker_data)
+                invalidate_site_snapshot()
 
                 # Add speaker_created flag to application
                 application_ref.update({'speaker_created': True})
@@ -15282,6 +15392,7 @@ def admin_publications_settings():
             visible = request.form.get('visible', 'true').lower() == 'true'
 
         db.reference('publications_settings').set({'visible': visible})
+        invalidate_site_snapshot()
 
         if request.is_json:
             return jsonify({'success': True, 'visible': visible})
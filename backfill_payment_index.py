@@ -0,0 +1,29 @@
+"""
+Backfill payments_by_reference/{reference} from existing registrations.
+
+Every registration that already carries a transaction_reference gets an index
+entry; entries written since the index went live are left untouched.
+
+Usage:
+    python backfill_payment_index.py --dry-run
+    python backfill_payment_index.py
+"""
+import argparse
+import json
+
+from services.firebase_init import init_firebase
+from services.payment_index import backfill_payment_index
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backfill the Yoco payment reference index.")
+    parser.add_argument("--dry-run", action="store_true", help="Report what would be written without writing.")
+    args = parser.parse_args()
+
+    init_firebase()
+
+    print(json.dumps(backfill_payment_index(dry_run=args.dry_run), indent=2))
+
+
+if __name__ == "__main__":
+    main()
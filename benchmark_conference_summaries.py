@@ -0,0 +1,83 @@
+"""
+Benchmark the projected conference listing against the full-tree read.
+
+Compares ``db.reference('conferences').get()`` (what get_all_conferences()
+does) with services.conference_summaries.fetch_conference_summaries() and
+reports payload size and latency for both.
+
+Payload size is the compact JSON encoding of the returned data, which is what
+the REST API sends over the wire before compression.
+
+Usage:
+    python benchmark_conference_summaries.py --iterations 5 --workers 8
+"""
+import argparse
+import json
+import statistics
+import time
+
+from firebase_admin import db
+
+from services.conference_summaries import fetch_conference_summaries
+from services.firebase_init import init_firebase
+
+
+def _payload_bytes(value) -> int:
+    return len(json.dumps(value, separators=(",", ":"), default=str).encode("utf-8"))
+
+
+def _measure(label, fn, iterations):
+    timings = []
+    result = None
+    for _ in range(iterations):
+        started = time.perf_counter()
+        result = fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    return {
+        "label": label,
+        "conferences": len(result or {}),
+        "payload_bytes": _payload_bytes(result),
+        "latency_ms_min": round(min(timings), 1),
+        "latency_ms_median": round(statistics.median(timings), 1),
+        "latency_ms_max": round(max(timings), 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare full conferences read with projected summaries.")
+    parser.add_argument("--iterations", type=int, default=5, help="Timed runs per strategy.")
+    parser.add_argument("--workers", type=int, default=8, help="Thread pool size for the projected reads.")
+    parser.add_argument("--json", action="store_true", help="Print the results as JSON.")
+    args = parser.parse_args()
+
+    init_firebase()
+
+    full = _measure(
+        "full_tree",
+        lambda: db.reference("conferences").get() or {},
+        args.iterations,
+    )
+    projected = _measure(
+        "summaries",
+        lambda: fetch_conference_summaries(max_workers=args.workers),
+        args.iterations,
+    )
+    results = [full, projected]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'strategy':<12} {'confs':>6} {'bytes':>12} {'min ms':>9} {'median ms':>10} {'max ms':>9}")
+    for row in results:
+        print(
+            f"{row['label']:<12} {row['conferences']:>6} {row['payload_bytes']:>12,} "
+            f"{row['latency_ms_min']:>9} {row['latency_ms_median']:>10} {row['latency_ms_max']:>9}"
+        )
+    if projected["payload_bytes"]:
+        ratio = full["payload_bytes"] / projected["payload_bytes"]
+        print(f"\nsummaries transfer {ratio:.1f}x fewer bytes than the full tree")
+
+
+if __name__ == "__main__":
+    main()
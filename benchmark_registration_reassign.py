@@ -0,0 +1,273 @@
+"""
+Benchmark registration reassignment: per-node writes vs. one fan-out update.
+
+Seeds a synthetic user with one registration and ``--papers`` linked papers in
+a scratch conference, moves the registration to a second scratch conference
+and reports round trips and latency for:
+
+* ``sequential`` - the call pattern reassign_registration_conference used to
+  make (one get/set/update/delete per node and per paper);
+* ``fan_out``    - services.registration_reassign: parallel snapshot reads
+  and a single multi-location ``db.reference('/').update(...)``.
+
+Workflow/pricing recomputation is not part of either flow here; it is pure
+computation over the same snapshot in the fan-out path.
+
+Everything is written under ``bench_reassign_*`` ids and removed afterwards.
+Point FIREBASE_DATABASE_URL at a development database or the emulator.
+
+Usage:
+    python benchmark_registration_reassign.py --papers 5 --iterations 3
+"""
+import argparse
+import json
+import statistics
+import time
+import uuid
+from datetime import datetime
+
+from firebase_admin import db
+
+from services.firebase_init import init_firebase
+from services.registration_index import find_latest_registration, index_path
+from services.registration_reassign import (
+    load_reassignment_snapshot,
+    plan_paper_moves,
+    plan_registration_move,
+    plan_submission_index_updates,
+)
+from services.user_submission_index import submission_index_path
+
+
+OLD_CONFERENCE = "bench_reassign_old"
+NEW_CONFERENCE = "bench_reassign_new"
+ADMIN_EMAIL = "benchmark@example.com"
+
+
+class _RoundTripCounter:
+    """Counts Reference/Query network calls while active."""
+
+    METHODS = [
+        (db.Reference, "get"), (db.Reference, "set"), (db.Reference, "update"),
+        (db.Reference, "delete"), (db.Reference, "push"), (db.Query, "get"),
+    ]
+
+    def __init__(self):
+        self.calls = 0
+        self._originals = []
+
+    def __enter__(self):
+        for owner, name in self.METHODS:
+            original = getattr(owner, name)
+            self._originals.append((owner, name, original))
+
+            def counted(*args, _original=original, **kwargs):
+                self.calls += 1
+                return _original(*args, **kwargs)
+
+            setattr(owner, name, counted)
+        return self
+
+    def __exit__(self, *exc):
+        for owner, name, original in self._originals:
+            setattr(owner, name, original)
+        self._originals = []
+
+
+def _seed(paper_count):
+    """Write a synthetic user, registration and papers; returns (user_id, registration_id)."""
+    suffix = uuid.uuid4().hex[:8]
+    user_id = f"bench_reassign_user_{suffix}"
+    registration_id = f"bench_reassign_reg_{suffix}"
+    now_iso = datetime.now().isoformat()
+    registration = {
+        "user_id": user_id,
+        "conference_id": OLD_CONFERENCE,
+        "conference_name": "Benchmark (old)",
+        "payment_status": "approved",
+        "registration_type": "regular_author",
+        "created_at": now_iso,
+    }
+    updates = {
+        f"registrations/{registration_id}": registration,
+        f"conferences/{OLD_CONFERENCE}/registrations/{registration_id}": registration,
+        f"conferences/{OLD_CONFERENCE}/basic_info": {"name": "Benchmark (old)"},
+        f"conferences/{NEW_CONFERENCE}/basic_info": {"name": "Benchmark (new)"},
+        f"user_registrations/{user_id}/entry": {"registration_id": registration_id, "conference_id": OLD_CONFERENCE},
+        index_path(user_id, OLD_CONFERENCE): registration_id,
+    }
+    for number in range(paper_count):
+        paper_id = f"bench_paper_{suffix}_{number}"
+        paper = {
+            "user_id": user_id,
+            "registration_id": registration_id,
+            "conference_id": OLD_CONFERENCE,
+            "paper_title": f"Synthetic paper {number}",
+            "status": "pending",
+            "submitted_at": now_iso,
+        }
+        updates[f"conferences/{OLD_CONFERENCE}/paper_submissions/{paper_id}"] = paper
+        updates[submission_index_path(user_id, OLD_CONFERENCE, paper_id)] = {
+            "conference_id": OLD_CONFERENCE, "paper_id": paper_id, "status": "pending",
+        }
+    db.reference("/").update(updates)
+    return user_id, registration_id
+
+
+def _cleanup(user_id, registration_id):
+    db.reference("/").update({
+        f"registrations/{registration_id}": None,
+        f"user_registrations/{user_id}": None,
+        f"user_paper_submissions/{user_id}": None,
+        f"registration_index/{user_id}": None,
+    })
+
+
+def _cleanup_conferences():
+    db.reference("/").update({
+        f"conferences/{OLD_CONFERENCE}": None,
+        f"conferences/{NEW_CONFERENCE}": None,
+    })
+
+
+def _changes(now_iso):
+    return {
+        "conference_id": NEW_CONFERENCE,
+        "conference_name": "Benchmark (new)",
+        "payment_status": "pending",
+        "reassigned_at": now_iso,
+        "reassigned_by": ADMIN_EMAIL,
+        "previous_conference_id": OLD_CONFERENCE,
+        "updated_at": now_iso,
+    }
+
+
+def reassign_sequential(user_id, registration_id):
+    """The per-node call pattern used before the fan-out rewrite."""
+    now_iso = datetime.now().isoformat()
+    registration_ref = db.reference(f"registrations/{registration_id}")
+    registration_ref.get()  # the old route read the record up front
+
+    old_papers = db.reference(f"conferences/{OLD_CONFERENCE}/paper_submissions").order_by_child("user_id") \
+        .equal_to(user_id).get() or {}
+    for paper_id, paper in old_papers.items():
+        if paper.get("registration_id") != registration_id:
+            continue
+        new_path = db.reference(f"conferences/{NEW_CONFERENCE}/paper_submissions/{paper_id}")
+        if new_path.get():
+            continue
+        new_path.set({**paper, "conference_id": NEW_CONFERENCE, "updated_at": now_iso})
+        db.reference(f"conferences/{OLD_CONFERENCE}/paper_submissions/{paper_id}").delete()
+        existing = db.reference(submission_index_path(user_id, OLD_CONFERENCE, paper_id)).get() or {}
+        target = db.reference(submission_index_path(user_id, NEW_CONFERENCE, paper_id)).get() or {}
+        db.reference("/").update({
+            submission_index_path(user_id, NEW_CONFERENCE, paper_id): {
+                **existing, **target, "conference_id": NEW_CONFERENCE, "updated_at": now_iso,
+            },
+            submission_index_path(user_id, OLD_CONFERENCE, paper_id): None,
+        })
+
+    changes = _changes(now_iso)
+    db.reference("/").update({
+        **{f"registrations/{registration_id}/{key}": value for key, value in changes.items()},
+        index_path(user_id, NEW_CONFERENCE): registration_id,
+    })
+    registrations = db.reference("registrations").order_by_child("user_id").equal_to(user_id).get() or {}
+    previous_id, _ = find_latest_registration(registrations, user_id, OLD_CONFERENCE)
+    db.reference(index_path(user_id, OLD_CONFERENCE)).set(previous_id)
+
+    merged = registration_ref.get() or {}
+    registration_ref.update({"total_amount": 0, "updated_at": now_iso})
+    final_registration = registration_ref.get() or merged
+
+    old_copy = db.reference(f"conferences/{OLD_CONFERENCE}/registrations/{registration_id}")
+    if old_copy.get():
+        old_copy.delete()
+    db.reference(f"conferences/{NEW_CONFERENCE}/registrations/{registration_id}").set(final_registration)
+
+    user_registrations_ref = db.reference(f"user_registrations/{user_id}")
+    for entry_key, entry in (user_registrations_ref.get() or {}).items():
+        if entry and entry.get("registration_id") == registration_id:
+            user_registrations_ref.child(entry_key).update({"conference_id": NEW_CONFERENCE, "status": "pending"})
+
+
+def reassign_fan_out(user_id, registration_id):
+    """Parallel snapshot, local planning, one multi-location update."""
+    now_iso = datetime.now().isoformat()
+    registration = db.reference(f"registrations/{registration_id}").get()
+    snapshot = load_reassignment_snapshot(user_id, OLD_CONFERENCE, NEW_CONFERENCE)
+
+    updates, moved = plan_paper_moves(
+        user_id, registration_id, registration, OLD_CONFERENCE, NEW_CONFERENCE, "Benchmark (new)",
+        snapshot["old_papers"], snapshot["new_papers"], ADMIN_EMAIL, now_iso,
+    )
+    updates.update(plan_submission_index_updates(
+        user_id, snapshot["submission_index"], OLD_CONFERENCE, NEW_CONFERENCE, moved, now_iso,
+    ))
+    registration_updates, _ = plan_registration_move(
+        registration_id, user_id, registration, {**_changes(now_iso), "total_amount": 0},
+        OLD_CONFERENCE, NEW_CONFERENCE, snapshot["user_registrations"],
+        {"conference_id": NEW_CONFERENCE, "status": "pending"}, snapshot["registrations"],
+    )
+    updates.update(registration_updates)
+    db.reference("/").update(updates)
+
+
+def _measure(label, flow, papers, iterations):
+    timings = []
+    round_trips = 0
+    for _ in range(iterations):
+        user_id, registration_id = _seed(papers)
+        try:
+            with _RoundTripCounter() as counter:
+                started = time.perf_counter()
+                flow(user_id, registration_id)
+                timings.append((time.perf_counter() - started) * 1000)
+            round_trips = counter.calls
+        finally:
+            _cleanup(user_id, registration_id)
+    return {
+        "label": label,
+        "papers": papers,
+        "round_trips": round_trips,
+        "latency_ms_min": round(min(timings), 1),
+        "latency_ms_median": round(statistics.median(timings), 1),
+        "latency_ms_max": round(max(timings), 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare sequential and fan-out registration reassignment.")
+    parser.add_argument("--papers", type=int, default=5, help="Papers linked to the synthetic registration.")
+    parser.add_argument("--iterations", type=int, default=3, help="Timed runs per strategy.")
+    parser.add_argument("--json", action="store_true", help="Print the results as JSON.")
+    args = parser.parse_args()
+
+    init_firebase()
+    try:
+        results = [
+            _measure("sequential", reassign_sequential, args.papers, args.iterations),
+            _measure("fan_out", reassign_fan_out, args.papers, args.iterations),
+        ]
+    finally:
+        _cleanup_conferences()
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'strategy':<12} {'papers':>6} {'trips':>6} {'min ms':>9} {'median ms':>10} {'max ms':>9}")
+    for row in results:
+        print(
+            f"{row['label']:<12} {row['papers']:>6} {row['round_trips']:>6} "
+            f"{row['latency_ms_min']:>9} {row['latency_ms_median']:>10} {row['latency_ms_max']:>9}"
+        )
+    sequential, fan_out = results
+    if fan_out["latency_ms_median"]:
+        ratio = sequential["latency_ms_median"] / fan_out["latency_ms_median"]
+        print(f"\nfan-out is {ratio:.1f}x faster (median) with "
+              f"{sequential['round_trips'] - fan_out['round_trips']} fewer round trips")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,337 @@
+"""
+Benchmark the hottest public and admin pages through the Flask test client.
+
+Boots the app on the in-memory data backend (DATA_BACKEND=memory), seeds it
+with a synthetic production-shaped dataset (generate_synthetic_dataset.py) or
+an RTDB JSON export, and requests each route repeatedly.  Per route it reports:
+
+* p50 / p95 latency of the full request (routing, data access, rendering);
+* backend reads and bytes read per request (BackendStats on the memory
+  backend - one read is one round trip on the live database);
+* peak RSS of the process serving the route.
+
+Each route runs in its own forked worker (on platforms with fork), so the RSS
+figure belongs to that route rather than everything measured before it.
+Warm-up requests are made first and excluded, so per-worker caches are in the
+state a long-running gunicorn worker would see.
+
+Results are written as JSON.  Pass --baseline with an earlier result file to
+flag routes whose latency, reads, bytes or RSS grew by more than --threshold
+percent; the exit code is 1 when any regression is found.
+
+Firebase Auth is not contacted: the user loader's auth.get_user() call is
+answered from the dataset's users node.
+
+Usage:
+    python benchmark_routes.py --output bench/baseline.json
+    python benchmark_routes.py --baseline bench/baseline.json --output bench/current.json
+    python benchmark_routes.py --dataset export.json --routes home dashboard --iterations 50
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+from datetime import datetime
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# The app picks its backend at import time
+os.environ['DATA_BACKEND'] = 'memory'
+os.environ.pop('MEMORY_BACKEND_SEED', None)
+
+from generate_synthetic_dataset import generate_dataset  # noqa: E402
+
+ROUTES = [
+    'home',
+    'conference_discover',
+    'conference_details',
+    'galleries',
+    'sitemap_xml',
+    'dashboard',
+    'admin_dashboard',
+    'admin_submissions',
+]
+# Routes that need a signed-in user, and which one
+AUTHENTICATED_ROUTES = {'dashboard': 'user', 'admin_dashboard': 'admin', 'admin_submissions': 'admin'}
+# Metrics compared against the baseline
+COMPARED_METRICS = ['p50_ms', 'p95_ms', 'reads', 'bytes_read', 'peak_rss_kb']
+# Latency changes below this are treated as noise regardless of the percentage
+LATENCY_NOISE_MS = 1.0
+
+_state = {}
+
+
+def _percentile(values, pct):
+    """Nearest-rank percentile of ``values`` (0 when empty)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, int(round(pct / 100.0 * len(ordered))))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def _rss_kb():
+    # ru_maxrss is KiB on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def _git_revision():
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'], stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except Exception:
+        return None
+
+
+def _pick_users(data):
+    """(admin user id, user id with the most registrations) from a dataset."""
+    users = data.get('users') or {}
+    admin_id = next((uid for uid, user in users.items() if isinstance(user, dict) and user.get('is_admin')), None)
+    counts = {}
+    for registration in (data.get('registrations') or {}).values():
+        if isinstance(registration, dict) and registration.get('user_id') in users:
+            counts[registration['user_id']] = counts.get(registration['user_id'], 0) + 1
+    user_id = max(counts, key=counts.get) if counts else next(iter(users), None)
+    return admin_id, user_id
+
+
+def _pick_conference(data):
+    """The conference with the most paper submissions (the heaviest details page)."""
+    conferences = data.get('conferences') or {}
+    if not conferences:
+        return None
+    return max(
+        conferences,
+        key=lambda cid: len((conferences[cid] or {}).get('paper_submissions') or {})
+        if isinstance(conferences[cid], dict) else 0,
+    )
+
+
+def _install_local_auth(users):
+    """Answer auth.get_user() from the dataset instead of Firebase Auth."""
+    from firebase_admin import auth
+
+    def get_user(uid, app=None):
+        user = users.get(uid)
+        if not isinstance(user, dict):
+            raise auth.UserNotFoundError(f'No user record found for the provided user ID: {uid}.')
+        return SimpleNamespace(uid=uid, email=user.get('email'), display_name=user.get('full_name'))
+
+    auth.get_user = get_user
+
+
+def _setup(data):
+    """Import the app, load ``data`` into its backend and resolve the URLs to benchmark."""
+    import app as app_module
+    from services.data_backend import get_backend
+
+    backend = get_backend()
+    backend.load(data)
+    _install_local_auth(data.get('users') or {})
+
+    flask_app = app_module.app
+    flask_app.config.update(TESTING=True, WTF_CSRF_ENABLED=False)
+    admin_id, user_id = _pick_users(data)
+    conference_id = _pick_conference(data)
+
+    from flask import url_for
+    urls = {}
+    with flask_app.test_request_context():
+        for route in ROUTES:
+            if route == 'conference_details':
+                if conference_id:
+                    urls[route] = url_for(route, conference_id=conference_id)
+            else:
+                urls[route] = url_for(route)
+
+    _state.update(
+        app=flask_app, backend=backend, urls=urls,
+        users={'admin': admin_id, 'user': user_id},
+    )
+
+
+def _client_for(route):
+    client = _state['app'].test_client()
+    role = AUTHENTICATED_ROUTES.get(route)
+    if role:
+        user_id = _state['users'].get(role)
+        if not user_id:
+            return None
+        with client.session_transaction() as session:
+            session['_user_id'] = user_id
+            session['_fresh'] = True
+    return client
+
+
+def _run_route(route, iterations, warmup):
+    """Measure one route; runs inside the worker process."""
+    url = _state['urls'].get(route)
+    client = _client_for(route) if url else None
+    if client is None:
+        return {'route': route, 'skipped': 'no url or user for this route in the dataset'}
+
+    backend = _state['backend']
+    rss_start = _rss_kb()
+    statuses = set()
+    for _ in range(warmup):
+        statuses.add(client.get(url).status_code)
+
+    timings, reads, bytes_read, writes = [], [], [], []
+    for _ in range(iterations):
+        backend.stats.reset()
+        started = time.perf_counter()
+        response = client.get(url)
+        response.get_data()
+        timings.append((time.perf_counter() - started) * 1000)
+        stats = backend.stats.snapshot()
+        reads.append(stats['reads'])
+        bytes_read.append(stats['bytes_read'])
+        writes.append(stats['writes'])
+        statuses.add(response.status_code)
+
+    peak = _rss_kb()
+    return {
+        'route': route,
+        'url': url,
+        'status_codes': sorted(statuses),
+        'iterations': iterations,
+        'p50_ms': round(_percentile(timings, 50), 2),
+        'p95_ms': round(_percentile(timings, 95), 2),
+        'max_ms': round(max(timings), 2),
+        'reads': round(sum(reads) / len(reads), 1),
+        'writes': round(sum(writes) / len(writes), 1),
+        'bytes_read': int(sum(bytes_read) / len(bytes_read)),
+        'peak_rss_kb': peak,
+        'rss_growth_kb': max(0, peak - rss_start),
+    }
+
+
+def _run_route_isolated(route, iterations, warmup):
+    """Run :func:`_run_route` in a forked child so peak RSS is per route."""
+    try:
+        context = multiprocessing.get_context('fork')
+    except ValueError:
+        return _run_route(route, iterations, warmup)
+    with context.Pool(1) as pool:
+        return pool.apply(_run_route, (route, iterations, warmup))
+
+
+def compare(current, baseline, threshold):
+    """Rows of ``{route, metric, baseline, current, change_pct}`` that regressed beyond ``threshold`` percent."""
+    regressions = []
+    for route, row in current.get('routes', {}).items():
+        before = (baseline.get('routes') or {}).get(route)
+        if not before or 'skipped' in row or 'skipped' in before:
+            continue
+        for metric in COMPARED_METRICS:
+            old, new = before.get(metric), row.get(metric)
+            if old is None or new is None or new <= old:
+                continue
+            if metric.endswith('_ms') and new - old < LATENCY_NOISE_MS:
+                continue
+            change = ((new - old) / old * 100.0) if old else float('inf')
+            if change > threshold:
+                regressions.append({
+                    'route': route, 'metric': metric, 'baseline': old, 'current': new,
+                    'change_pct': round(change, 1),
+                })
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark hot routes on the in-memory backend.")
+    parser.add_argument("--dataset", help="RTDB JSON export or generated dataset (default: generate one).")
+    parser.add_argument("--conferences", type=int, default=5, help="Generated conferences.")
+    parser.add_argument("--papers", type=int, default=500, help="Generated paper submissions per conference.")
+    parser.add_argument("--registrations", type=int, default=500, help="Generated registrations per conference.")
+    parser.add_argument("--seed", type=int, default=42, help="Dataset generator seed.")
+    parser.add_argument("--routes", nargs="+", choices=ROUTES, default=ROUTES)
+    parser.add_argument("--iterations", type=int, default=20, help="Measured requests per route.")
+    parser.add_argument("--warmup", type=int, default=2, help="Unmeasured requests per route first.")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Simulated backend round-trip latency.")
+    parser.add_argument("--no-isolate", action="store_true", help="Run all routes in this process.")
+    parser.add_argument("--output", default="benchmark_routes.json", help="Where to write the results.")
+    parser.add_argument("--baseline", help="Earlier result file to compare against.")
+    parser.add_argument("--threshold", type=float, default=20.0, help="Regression threshold in percent.")
+    args = parser.parse_args()
+
+    if args.dataset:
+        with open(args.dataset, 'r', encoding='utf-8') as handle:
+            data = json.load(handle)
+        dataset_info = {'source': args.dataset}
+    else:
+        data = generate_dataset(
+            conferences=args.conferences,
+            papers_per_conference=args.papers,
+            registrations_per_conference=args.registrations,
+            seed=args.seed,
+        )
+        dataset_info = {
+            'source': 'generated', 'conferences': args.conferences, 'papers': args.papers,
+            'registrations': args.registrations, 'seed': args.seed,
+        }
+
+    _setup(data)
+    _state['backend'].latency_ms = args.latency_ms
+    del data
+
+    run = _run_route if args.no_isolate else _run_route_isolated
+    results = {}
+    for route in args.routes:
+        results[route] = run(route, args.iterations, args.warmup)
+
+    report = {
+        'meta': {
+            'created_at': datetime.now().isoformat(),
+            'git_revision': _git_revision(),
+            'python': platform.python_version(),
+            'iterations': args.iterations,
+            'warmup': args.warmup,
+            'latency_ms': args.latency_ms,
+            'dataset': dataset_info,
+        },
+        'routes': results,
+    }
+    output_dir = os.path.dirname(os.path.abspath(args.output))
+    os.makedirs(output_dir, exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as handle:
+        json.dump(report, handle, indent=2)
+
+    print(f"{'route':<20} {'status':>8} {'p50 ms':>8} {'p95 ms':>8} {'reads':>7} {'KiB read':>10} {'RSS MiB':>8}")
+    for route, row in results.items():
+        if 'skipped' in row:
+            print(f"{route:<20} skipped: {row['skipped']}")
+            continue
+        status = ','.join(str(code) for code in row['status_codes'])
+        print(
+            f"{route:<20} {status:>8} {row['p50_ms']:>8} {row['p95_ms']:>8} {row['reads']:>7} "
+            f"{row['bytes_read'] / 1024:>10.1f} {row['peak_rss_kb'] / 1024:>8.1f}"
+        )
+    print(f"\nResults written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as handle:
+            baseline = json.load(handle)
+        regressions = compare(report, baseline, args.threshold)
+        if not regressions:
+            print(f"No regressions above {args.threshold:g}% against {args.baseline}")
+            return
+        print(f"\nREGRESSIONS (> {args.threshold:g}% against {args.baseline}):")
+        for row in regressions:
+            print(
+                f"  {row['route']:<20} {row['metric']:<12} {row['baseline']} -> {row['current']} "
+                f"(+{row['change_pct']}%)"
+            )
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -129,6 +129,11 @@ def clean_realtime_database(admin_uid):
         'conference_proceedings_content',
         'guest_speaker_applications',
         'user_registrations',
+        'registration_index',
+        'payments_by_reference',
+        'conference_codes',
+        'stats',
+        'index_status',
         'submissions',
         'paper_submissions',
         'test_connection',
@@ -74,5 +74,68 @@ class Config:
     # Exchange rate configuration (exchangerate-api.com)
     EXCHANGE_RATE_API_KEY = os.environ.get('EXCHANGE_RATE_API_KEY', '')
 
+    # Conference metadata cache (per gunicorn worker). Entries expire after the
+    # TTL and are reloaded sooner when an admin edit bumps cache_versions/conferences.
+    CONFERENCE_CACHE_TTL = int(os.environ.get('CONFERENCE_CACHE_TTL', '300'))
+    CONFERENCE_CACHE_VERSION_CHECK_SECONDS = float(os.environ.get('CONFERENCE_CACHE_VERSION_CHECK_SECONDS', '5'))
+    # Page chrome shared by every render (home content, design, speaker and
+    # publications flags); reloaded after the TTL or when an admin edit bumps
+    # cache_versions/site.
+    SITE_SNAPSHOT_TTL = int(os.environ.get('SITE_SNAPSHOT_TTL', '300'))
+    SITE_SNAPSHOT_VERSION_CHECK_SECONDS = float(os.environ.get('SITE_SNAPSHOT_VERSION_CHECK_SECONDS', '5'))
+    # Compiled registration pricing tables (per conference, per worker);
+    # admin_registration_fees bumps cache_versions/registration_fees.
+    PRICING_CACHE_TTL = int(os.environ.get('PRICING_CACHE_TTL', '600'))
+    # Thread pool size for the per-conference reads behind get_conference_summaries()
+    CONFERENCE_SUMMARY_MAX_WORKERS = int(os.environ.get('CONFERENCE_SUMMARY_MAX_WORKERS', '8'))
+    # Rows per page on the admin submissions / registrations / users lists
+    ADMIN_PAGE_SIZE = int(os.environ.get('ADMIN_PAGE_SIZE', '50'))
+    # Concurrent record reads for bulk admin actions (e.g. assigning registrations)
+    BULK_READ_MAX_WORKERS = int(os.environ.get('BULK_READ_MAX_WORKERS', '16'))
+    # Concurrent per-item reads behind the user dashboard
+    DASHBOARD_MAX_WORKERS = int(os.environ.get('DASHBOARD_MAX_WORKERS', '8'))
+    # Streaming submissions ZIP: concurrent Storage fetches, and how many
+    # files may be fetched ahead of the one being written (bounds memory)
+    SUBMISSION_ARCHIVE_MAX_WORKERS = int(os.environ.get('SUBMISSION_ARCHIVE_MAX_WORKERS', '4'))
+    SUBMISSION_ARCHIVE_PREFETCH = int(os.environ.get('SUBMISSION_ARCHIVE_PREFETCH', '8'))
+    # Build the archive as a background job cached in Storage under a content
+    # key (false = stream it on every request); a job whose heartbeat is older
+    # than the stale limit is restarted by the next request for it
+    SUBMISSION_ARCHIVE_JOBS_ENABLED = os.environ.get('SUBMISSION_ARCHIVE_JOBS_ENABLED', 'true').lower() == 'true'
+    SUBMISSION_ARCHIVE_JOB_STALE_SECONDS = int(os.environ.get('SUBMISSION_ARCHIVE_JOB_STALE_SECONDS', '600'))
+
+    # Paper, full-paper, payment-proof and archive downloads redirect to
+    # short-lived V4 signed Storage URLs; false = proxy them through the
+    # worker in STORAGE_STREAM_CHUNK_SIZE chunks instead
+    STORAGE_SIGNED_URLS_ENABLED = os.environ.get('STORAGE_SIGNED_URLS_ENABLED', 'true').lower() == 'true'
+    SIGNED_URL_EXPIRATION_MINUTES = int(os.environ.get('SIGNED_URL_EXPIRATION_MINUTES', '15'))
+    STORAGE_STREAM_CHUNK_SIZE = int(os.environ.get('STORAGE_STREAM_CHUNK_SIZE', str(1024 * 1024)))
+
+    # Realtime Database backend: 'firebase' (default) or 'memory' for local
+    # benchmarks/profiling (see services/data_backend.py). The memory backend
+    # is seeded from MEMORY_BACKEND_SEED (a JSON export) and can simulate
+    # per-call network latency.
+    DATA_BACKEND = os.environ.get('DATA_BACKEND', 'firebase').lower()
+    MEMORY_BACKEND_SEED = os.environ.get('MEMORY_BACKEND_SEED', '')
+    MEMORY_BACKEND_LATENCY_MS = float(os.environ.get('MEMORY_BACKEND_LATENCY_MS', '0'))
+    MEMORY_BACKEND_JITTER_MS = float(os.environ.get('MEMORY_BACKEND_JITTER_MS', '0'))
+
+    # Signed-in user profiles cached per worker by the Flask-Login user loader.
+    # Edits invalidate the editing worker at once; other workers see them after
+    # the TTL (this bounds how long a revoked admin flag lingers).
+    USER_PROFILE_CACHE_TTL = int(os.environ.get('USER_PROFILE_CACHE_TTL', '60'))
+    USER_PROFILE_CACHE_SIZE = int(os.environ.get('USER_PROFILE_CACHE_SIZE', '1024'))
+
+    # The admin dashboard refreshes the cached Yoco payment summary (stats/yoco)
+    # in the background once it is older than this
+    YOCO_STATS_MAX_AGE_MINUTES = int(os.environ.get('YOCO_STATS_MAX_AGE_MINUTES', '15'))
+
+    # Per-request call instrumentation (services/request_metrics.py): adds a
+    # Server-Timing header and a JSON log line per request, and warns when one
+    # request reads the same RTDB path pattern more than N_PLUS_ONE_THRESHOLD times.
+    # Off by default: the header exposes backend timings to every client.
+    REQUEST_METRICS_ENABLED = os.environ.get('REQUEST_METRICS_ENABLED', 'false').lower() == 'true'
+    N_PLUS_ONE_THRESHOLD = int(os.environ.get('N_PLUS_ONE_THRESHOLD', '5'))
+
     # Session configuration
     PERMANENT_SESSION_LIFETIME = timedelta(minutes=60)
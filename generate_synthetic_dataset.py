@@ -0,0 +1,453 @@
+"""
+Script to generate a synthetic Realtime Database dataset shaped like production
+
+Builds N conferences (basic_info, settings, gallery, gallery_summary, paper
+submissions with file_history revisions), users, global registrations and the
+derived nodes the app reads (user_paper_submissions, user_registrations,
+registration_index, conference_codes, payments_by_reference, stats,
+index_status), plus announcements and registration fees.
+
+The output is deterministic for a given --seed, so load tests and benchmarks
+can be repeated without production data.  It can be written to:
+
+* a JSON file - load it into the Realtime Database emulator with
+      curl -X PUT -d @dataset.json "http://127.0.0.1:9000/.json?ns=<namespace>"
+  or boot the app on it with DATA_BACKEND=memory MEMORY_BACKEND_SEED=dataset.json;
+* an in-memory store - call generate_dataset() / seed_memory_backend() from
+  Python (benchmarks do this).
+
+Usage:
+    python generate_synthetic_dataset.py --conferences 5 --papers 2000 --registrations 2000 --output dataset.json
+    python generate_synthetic_dataset.py --conferences 2 --papers 50 --inline-file-kb 64 --output legacy.json
+"""
+import argparse
+import base64
+import json
+import os
+import random
+import sys
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from services.admin_stats import compute_stats
+from services.data_backend import PUSH_CHARS, InMemoryBackend
+from services.payment_index import build_payment_index
+from services.registration_index import build_registration_index
+from services.user_submission_index import submission_index_key
+from utils import conference_code_index_updates
+
+BASE_TIME = datetime(2025, 1, 6, 9, 0, 0)
+
+TOPICS = [
+    ('ICETL', 'Social Science, Education and Learning'),
+    ('ICBMSE', 'Business Management, Sustainability and Economics'),
+    ('ICIRT', 'Innovation, Robotics and Applied Technology'),
+    ('ICSTM', 'Science, Technology and Management'),
+    ('ICHSS', 'Humanities and Social Sciences'),
+    ('ICEEE', 'Electrical and Electronics Engineering'),
+    ('ICPHM', 'Public Health and Medicine'),
+    ('ICAIDS', 'Artificial Intelligence and Data Science'),
+]
+LOCATIONS = [
+    'Toronto, Ontario, Canada', 'Oxford, UK', 'Paris, France', 'Copenhagen, Denmark',
+    'Cape Town, South Africa', 'Dubai, UAE', 'Singapore', 'Melbourne, Australia',
+]
+FIRST_NAMES = ['Amara', 'Ben', 'Chen', 'Daniela', 'Emeka', 'Fatima', 'Giulia', 'Hiro', 'Ines', 'Jonas',
+               'Kavya', 'Liam', 'Mei', 'Nadia', 'Omar', 'Priya', 'Quinn', 'Ravi', 'Sofia', 'Thabo']
+LAST_NAMES = ['Adeyemi', 'Brown', 'Chen', 'Dlamini', 'Evans', 'Fernandes', 'Garcia', 'Hassan', 'Ito',
+              'Jansen', 'Khan', 'Larsen', 'Mokoena', 'Nguyen', 'Okafor', 'Patel', 'Rossi', 'Silva']
+INSTITUTIONS = ['University of Cape Town', 'University of Toronto', 'Sorbonne University', 'NUS',
+                'University of Melbourne', 'Stellenbosch University', 'KU Leuven', 'University of Oxford']
+COUNTRIES = ['South Africa', 'Canada', 'France', 'Singapore', 'Australia', 'Belgium', 'UK', 'Nigeria']
+RESEARCH_AREAS = ['Education', 'Economics', 'Robotics', 'Public Health', 'Data Science', 'Sociology']
+PRESENTATION_TYPES = ['oral', 'poster', 'virtual']
+PAPER_STATUSES = ['pending'] * 5 + ['accepted'] * 3 + ['rejected', 'withdrawn']
+PAYMENT_STATUSES = ['pending'] * 4 + ['paid'] * 3 + ['approved', 'waived', 'rejected']
+REGISTRATION_TYPES = ['regular_author', 'student_author', 'physical_delegate', 'listener']
+FEES = {'student_author': 250, 'regular_author': 350, 'physical_delegate': 300, 'listener': 150}
+
+
+class _Keys:
+    """Push-style keys that are unique and chronological, but reproducible for a given seed."""
+
+    def __init__(self, rng):
+        self._rng = rng
+
+    def __call__(self, when):
+        millis = int(when.timestamp() * 1000)
+        time_chars = []
+        for _ in range(8):
+            time_chars.append(PUSH_CHARS[millis % 64])
+            millis //= 64
+        return ''.join(reversed(time_chars)) + ''.join(self._rng.choice(PUSH_CHARS) for _ in range(12))
+
+
+def _iso(when):
+    return when.isoformat()
+
+
+def _person(rng):
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    return first, last, f'{first} {last}'
+
+
+def _fake_pdf(rng, size_kb):
+    """Base64 of ``size_kb`` KiB of bytes starting with a PDF header (legacy inline file_data)."""
+    raw = b'%PDF-1.4\n' + bytes(rng.getrandbits(8) for _ in range(max(size_kb * 1024 - 9, 0)))
+    return base64.b64encode(raw).decode('ascii')
+
+
+def _registration_fees():
+    periods = {}
+    for period, multiplier in (('early_bird', 0.8), ('regular', 1.0), ('late', 1.2)):
+        periods[period] = {
+            'deadline': '',
+            'fees': {kind: round(amount * multiplier, 2) for kind, amount in FEES.items()},
+            'benefits': [],
+        }
+    periods['early_bird']['enabled'] = True
+    return {
+        'currency': {'code': 'USD', 'symbol': '$'},
+        **periods,
+        'additional_items': {'workshop': {'price': 50}, 'banquet': {'price': 75}},
+    }
+
+
+def generate_dataset(
+    conferences=3,
+    papers_per_conference=1000,
+    registrations_per_conference=1000,
+    users=None,
+    gallery_images=40,
+    announcements=30,
+    max_revisions=3,
+    inline_file_kb=0,
+    seed=42,
+):
+    """
+    Return the full RTDB tree as a dict.
+
+    ``users`` defaults to roughly one account per two papers.  With
+    ``inline_file_kb`` > 0 papers and revisions carry base64 ``file_data``
+    of that size (the legacy storage format) instead of Storage paths.
+    """
+    rng = random.Random(seed)
+    new_key = _Keys(rng)
+    users = users or max(10, (conferences * papers_per_conference) // 2)
+
+    data = {
+        'users': {},
+        'conferences': {},
+        'registrations': {},
+        'user_paper_submissions': {},
+        'user_registrations': {},
+        'announcements': {},
+        'registration_fees': _registration_fees(),
+    }
+
+    # Users ---------------------------------------------------------------
+    user_ids = []
+    for number in range(users):
+        created = BASE_TIME + timedelta(minutes=number * 7)
+        uid = f'synthetic-user-{number:06d}'
+        first, last, full_name = _person(rng)
+        data['users'][uid] = {
+            'email': f'{first}.{last}.{number}@example.org'.lower(),
+            'full_name': full_name,
+            'institution': rng.choice(INSTITUTIONS),
+            'country': rng.choice(COUNTRIES),
+            'phone': f'+27 21 {rng.randint(1000000, 9999999)}',
+            'created_at': _iso(created),
+            'updated_at': _iso(created),
+            'is_admin': number == 0,
+        }
+        user_ids.append(uid)
+
+    # Conferences ---------------------------------------------------------
+    code_updates = {}
+    for number in range(conferences):
+        abbreviation, topic = TOPICS[number % len(TOPICS)]
+        year = 2025 + number // len(TOPICS) + (number % 3)
+        start = datetime(year, 1 + (number * 3) % 12, 10 + number % 10)
+        conference_id = new_key(BASE_TIME + timedelta(days=number))
+        conference_code = f'CONF-{year}-{abbreviation}-{rng.getrandbits(32):08X}'
+        status = 'active' if number % 3 == 0 else ('upcoming' if number % 3 == 1 else 'completed')
+        conference = {
+            'basic_info': {
+                'name': f'International Conference on {topic} ({abbreviation}-{year})',
+                'description': (f'{abbreviation}-{year} brings together academics and practitioners in '
+                                f'{topic}. ') * 6,
+                'year': year,
+                'abbreviation': abbreviation,
+                'status': status,
+                'event_type': rng.choice(['virtual', 'hybrid', 'physical']),
+                'start_date': start.strftime('%Y-%m-%d'),
+                'end_date': (start + timedelta(days=3)).strftime('%Y-%m-%d'),
+                'location': rng.choice(LOCATIONS),
+                'website': '',
+                'timezone': 'UTC',
+            },
+            'settings': {
+                'registration_enabled': True,
+                'paper_submission_enabled': True,
+                'gallery_enabled': True,
+                'email_notifications': True,
+                'max_registrations': 1000,
+                'max_paper_submissions': 500,
+            },
+            'metadata': {'created_at': _iso(BASE_TIME), 'created_by': 'system', 'version': '1.0.0'},
+            'conference_code': conference_code,
+            'code_generated_at': _iso(BASE_TIME),
+            'registration_fees': _registration_fees(),
+            'gallery': {},
+            'gallery_summary': {
+                'summary': f'Highlights from {abbreviation}-{year}.',
+                'description': f'Photos from the sessions, keynotes and networking events of {abbreviation}-{year}.',
+                'show_summary_public': True,
+                'show_description_public': True,
+                'updated_at': _iso(BASE_TIME),
+                'updated_by': user_ids[0],
+            },
+            'paper_submissions': {},
+        }
+        for image in range(gallery_images):
+            uploaded = start + timedelta(hours=image)
+            filename = f'{uploaded.strftime("%Y%m%d_%H%M%S")}_{image}.jpg'
+            conference['gallery'][new_key(uploaded)] = {
+                'filename': filename,
+                'original_name': f'IMG_{image:04d}.jpg',
+                'url': f'https://storage.googleapis.com/synthetic-bucket/gallery/{conference_id}/{filename}',
+                'uploaded_by': 'admin@example.org',
+                'uploaded_at': _iso(uploaded),
+                'conference_id': conference_id,
+                'file_size': rng.randint(150_000, 2_500_000),
+                'content_type': 'image/jpeg',
+            }
+        data['conferences'][conference_id] = conference
+        code_updates.update(conference_code_index_updates(conference_id, conference_code))
+
+        # Papers
+        for paper_number in range(papers_per_conference):
+            submitted = BASE_TIME + timedelta(days=number, minutes=paper_number * 11)
+            uid = rng.choice(user_ids)
+            user = data['users'][uid]
+            paper_id = new_key(submitted)
+            status = rng.choice(PAPER_STATUSES)
+            file_name = f'paper_{paper_number}.pdf'
+            file_size = rng.randint(200_000, 4_000_000) if not inline_file_kb else inline_file_kb * 1024
+            history = []
+            for revision in range(rng.randint(0, max_revisions)):
+                revised = submitted - timedelta(days=max_revisions - revision)
+                entry = {
+                    'file_name': f'paper_{paper_number}_v{revision + 1}.pdf',
+                    'file_type': 'application/pdf',
+                    'file_size': file_size,
+                    'uploaded_at': _iso(revised),
+                    'version': revision + 1,
+                }
+                if inline_file_kb:
+                    entry['file_data'] = _fake_pdf(rng, inline_file_kb)
+                else:
+                    path = f'papers/{conference_id}/{paper_id}/history_{revision + 1}.pdf'
+                    entry['file_storage_path'] = path
+                    entry['file_url'] = f'https://storage.googleapis.com/synthetic-bucket/{path}'
+                history.append(entry)
+
+            paper = {
+                'conference_id': conference_id,
+                'user_id': uid,
+                'user_email': user['email'],
+                'registration_id': '',
+                'paper_title': f'{rng.choice(RESEARCH_AREAS)} study #{paper_number} of {abbreviation}',
+                'paper_abstract': 'This paper examines ' + ' '.join(rng.choice(RESEARCH_AREAS).lower()
+                                                                      for _ in range(60)) + '.',
+                'presentation_type': rng.choice(PRESENTATION_TYPES),
+                'research_area': rng.choice(RESEARCH_AREAS),
+                'keywords': rng.sample(RESEARCH_AREAS, 3),
+                'submitted_at': _iso(submitted),
+                'created_at': _iso(submitted),
+                'updated_at': _iso(submitted),
+                'status': status,
+                'authors': [
+                    {'name': user['full_name'], 'email': user['email'], 'institution': user['institution']}
+                ] + [
+                    {'name': _person(rng)[2], 'email': f'coauthor{index}@example.org',
+                     'institution': rng.choice(INSTITUTIONS)}
+                    for index in range(rng.randint(0, 3))
+                ],
+                'review_comments': '',
+                'reviewed_by': '',
+                'is_deleted': False,
+                'file_name': file_name,
+                'file_type': 'application/pdf',
+                'file_size': file_size,
+            }
+            if inline_file_kb:
+                paper['file_data'] = _fake_pdf(rng, inline_file_kb)
+            else:
+                path = f'papers/{conference_id}/{paper_id}/{file_name}'
+                paper['file_storage_path'] = path
+                paper['file_url'] = f'https://storage.googleapis.com/synthetic-bucket/{path}'
+            if history:
+                paper['file_history'] = history
+            conference['paper_submissions'][paper_id] = paper
+
+            data['user_paper_submissions'].setdefault(uid, {})[submission_index_key(conference_id, paper_id)] = {
+                'conference_id': conference_id,
+                'paper_id': paper_id,
+                'registration_id': '',
+                'paper_title': paper['paper_title'],
+                'conference_name': conference['basic_info']['name'],
+                'status': status,
+                'is_deleted': False,
+                'submitted_at': paper['submitted_at'],
+                'updated_at': paper['updated_at'],
+            }
+
+        # Registrations
+        for registration_number in range(registrations_per_conference):
+            created = BASE_TIME + timedelta(days=number, minutes=registration_number * 13 + 5)
+            uid = rng.choice(user_ids)
+            user = data['users'][uid]
+            registration_id = new_key(created)
+            registration_type = rng.choice(REGISTRATION_TYPES)
+            payment_status = rng.choice(PAYMENT_STATUSES)
+            reference = f'SYN-{rng.getrandbits(48):012X}'
+            registration = {
+                'user_id': uid,
+                'full_name': user['full_name'],
+                'email': user['email'],
+                'phone': user['phone'],
+                'institution': user['institution'],
+                'country': user['country'],
+                'conference_id': conference_id,
+                'conference_code': conference_code,
+                'conference_name': conference['basic_info']['name'],
+                'registration_type': registration_type,
+                'registration_period': 'regular',
+                'total_amount': FEES[registration_type],
+                'extra_paper': False,
+                'extra_paper_count': 0,
+                'workshop': rng.random() < 0.2,
+                'banquet': rng.random() < 0.3,
+                'payment_status': payment_status,
+                'payment_method': 'yoco' if payment_status in ('paid', 'approved') else '',
+                'transaction_reference': reference,
+                'workflow_status': 'registered',
+                'submission_date': _iso(created),
+                'created_at': _iso(created),
+                'updated_at': _iso(created),
+            }
+            data['registrations'][registration_id] = registration
+            data['user_registrations'].setdefault(uid, {})[new_key(created)] = {
+                'conference_id': conference_id,
+                'registration_id': registration_id,
+                'conference_name': conference['basic_info']['name'],
+                'status': payment_status,
+                'created_at': _iso(created),
+            }
+
+    # Announcements -------------------------------------------------------
+    for number in range(announcements):
+        created = BASE_TIME + timedelta(days=number)
+        data['announcements'][new_key(created)] = {
+            'title': f'Announcement {number + 1}',
+            'content': '<p>' + 'Important conference update. ' * 20 + '</p>',
+            'type': 'important' if number % 5 == 0 else 'general',
+            'is_pinned': number < 2,
+            'image_url': '',
+            'scheduled_date': created.strftime('%Y-%m-%d'),
+            'scheduled_time': '09:00',
+            'timezone': 'UTC',
+            'formatted_datetime': created.strftime('%B %d, %Y 09:00 UTC'),
+            'created_at': _iso(created),
+            'created_by': 'admin@example.org',
+            'updated_at': _iso(created),
+        }
+
+    # Derived indexes and aggregates -----------------------------------------
+    data['registration_index'] = build_registration_index(data['registrations'])
+    data['payments_by_reference'] = build_payment_index(data['registrations'])
+    data['conference_codes'] = {path.split('/', 1)[1]: value for path, value in code_updates.items()}
+    stats = compute_stats(data['users'], data['conferences'], data['registrations'], {})
+    stats['meta'] = {'rebuilt_at': _iso(BASE_TIME), 'synthetic': True}
+    data['stats'] = stats
+    done = {'migrated_at': _iso(BASE_TIME), 'synthetic': True}
+    data['index_status'] = {
+        'registration_index': done,
+        'payments_by_reference': done,
+        'user_paper_submissions': done,
+        'conference_codes': done,
+    }
+    return data
+
+
+def seed_memory_backend(backend=None, **options):
+    """Generate a dataset into an InMemoryBackend (a new one unless ``backend`` is given)."""
+    backend = backend or InMemoryBackend()
+    backend.load(generate_dataset(**options))
+    return backend
+
+
+def _summarize(data):
+    conferences = data.get('conferences') or {}
+    papers = sum(len(conf.get('paper_submissions') or {}) for conf in conferences.values())
+    revisions = sum(
+        len(paper.get('file_history') or [])
+        for conf in conferences.values()
+        for paper in (conf.get('paper_submissions') or {}).values()
+    )
+    return {
+        'conferences': len(conferences),
+        'paper_submissions': papers,
+        'file_history_entries': revisions,
+        'registrations': len(data.get('registrations') or {}),
+        'users': len(data.get('users') or {}),
+        'gallery_images': sum(len(conf.get('gallery') or {}) for conf in conferences.values()),
+        'announcements': len(data.get('announcements') or {}),
+        'json_bytes': len(json.dumps(data, separators=(',', ':')).encode('utf-8')),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic RTDB dataset shaped like production.")
+    parser.add_argument("--conferences", type=int, default=3)
+    parser.add_argument("--papers", type=int, default=1000, help="Paper submissions per conference.")
+    parser.add_argument("--registrations", type=int, default=1000, help="Registrations per conference.")
+    parser.add_argument("--users", type=int, default=None, help="User accounts (default: papers / 2).")
+    parser.add_argument("--gallery-images", type=int, default=40, help="Gallery images per conference.")
+    parser.add_argument("--announcements", type=int, default=30)
+    parser.add_argument("--max-revisions", type=int, default=3, help="Upper bound of file_history entries per paper.")
+    parser.add_argument("--inline-file-kb", type=int, default=0,
+                        help="Store base64 file_data of this size instead of Storage paths (legacy shape).")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed; the same seed gives the same dataset.")
+    parser.add_argument("--output", default="synthetic_dataset.json", help="JSON file to write.")
+    parser.add_argument("--pretty", action="store_true", help="Indent the JSON output.")
+    args = parser.parse_args()
+
+    data = generate_dataset(
+        conferences=args.conferences,
+        papers_per_conference=args.papers,
+        registrations_per_conference=args.registrations,
+        users=args.users,
+        gallery_images=args.gallery_images,
+        announcements=args.announcements,
+        max_revisions=args.max_revisions,
+        inline_file_kb=args.inline_file_kb,
+        seed=args.seed,
+    )
+    with open(args.output, 'w', encoding='utf-8') as handle:
+        json.dump(data, handle, indent=2 if args.pretty else None, separators=None if args.pretty else (',', ':'))
+
+    print("=" * 70)
+    print("SYNTHETIC DATASET")
+    print("=" * 70)
+    for key, value in _summarize(data).items():
+        print(f"{key:<22} {value:>14,}")
+    print("=" * 70)
+    print(f"Written to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""
+Move legacy base64 file_data out of the Realtime Database into Firebase Storage.
+
+Covers papers/* and conferences/*/paper_submissions/*, current files and
+file_history entries alike.  Each file is uploaded under papers/... with its
+MD5 checked by Storage, and the record is rewritten with
+file_storage_path/file_url/file_md5 in place of the inline payload (see
+services/inline_file_migration.py).  Safe to run while the site is live and
+to interrupt: the next run resumes after the last checkpointed paper.
+
+Usage:
+    python migrate_inline_paper_files.py --dry-run                 # count files and bytes to move
+    python migrate_inline_paper_files.py --workers 4 --max-mbps 20  # migrate, throttled
+    python migrate_inline_paper_files.py --legacy-only --limit 50   # papers/* only, 50 papers
+    python migrate_inline_paper_files.py --retry-failed            # retry papers recorded as failed
+    python migrate_inline_paper_files.py --verify                  # compare checksums with Storage
+"""
+import argparse
+import json
+
+from firebase_admin import storage
+
+from services.firebase_init import init_firebase
+from services.inline_file_migration import list_collections, migrate_inline_files, verify_migrated_files
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Move inline base64 paper files from RTDB to Storage.")
+    parser.add_argument("--dry-run", action="store_true", help="Count files and bytes without uploading or writing.")
+    parser.add_argument("--verify", action="store_true", help="Only compare migrated files' checksums with Storage.")
+    parser.add_argument("--workers", type=int, default=4, help="Papers migrated concurrently.")
+    parser.add_argument("--max-mbps", type=float, default=0, help="Upload throughput cap in MB/s (0 = unlimited).")
+    parser.add_argument("--limit", type=int, default=0, help="Stop after this many papers with inline files (0 = all).")
+    parser.add_argument("--conference", action="append", dest="conferences",
+                        help="Only this conference's paper_submissions (repeatable); skips papers/* unless --legacy is given.")
+    parser.add_argument("--legacy", action="store_true", help="With --conference, also migrate papers/*.")
+    parser.add_argument("--legacy-only", action="store_true", help="Only migrate papers/*.")
+    parser.add_argument("--restart", action="store_true", help="Ignore saved checkpoints and rescan everything.")
+    parser.add_argument("--retry-failed", action="store_true",
+                        help="Only retry papers recorded under index_status/inline_file_data/failed.")
+    args = parser.parse_args()
+
+    init_firebase()
+    bucket = storage.bucket()
+
+    if args.legacy_only:
+        collections = list_collections(conference_ids=[])
+    elif args.conferences:
+        collections = list_collections(conference_ids=args.conferences, include_legacy=args.legacy)
+    else:
+        collections = list_collections()
+
+    if args.verify:
+        report = verify_migrated_files(bucket, collections)
+        print(json.dumps(report, indent=2))
+        if report['missing'] or report['mismatched']:
+            raise SystemExit(1)
+        return
+
+    print(json.dumps(migrate_inline_files(
+        bucket,
+        collections,
+        dry_run=args.dry_run,
+        workers=args.workers,
+        bytes_per_second=args.max_mbps * 1024 * 1024,
+        limit=args.limit,
+        resume=not args.restart,
+        retry_failed=args.retry_failed,
+    ), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+"""
+Re-key user_paper_submissions/{user_id} entries from push keys to
+{conference_id}__{paper_id}.
+
+The app reads both key styles and migrates users lazily, so this can run
+while the site is live.  Once it completes it records
+index_status/user_paper_submissions and the app stops looking for push keys.
+
+Usage:
+    python migrate_user_submission_index.py --dry-run   # count entries that would move
+    python migrate_user_submission_index.py             # migrate and mark complete
+"""
+import argparse
+import json
+
+from services.firebase_init import init_firebase
+from services.user_submission_index import migrate_all_user_submission_indexes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-key the user paper submission index deterministically.")
+    parser.add_argument("--dry-run", action="store_true", help="Compute the migration without writing anything.")
+    args = parser.parse_args()
+
+    init_firebase()
+    print(json.dumps(migrate_all_user_submission_indexes(dry_run=args.dry_run), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -133,6 +133,7 @@ def purge_user_by_email(email: str, dry_run: bool) -> dict:
         for path in [
             f"users/{uid}",
             f"user_registrations/{uid}",
+            f"registration_index/{uid}",
             f"user_paper_submissions/{uid}",
             f"payment_proofs/{uid}",
         ]:
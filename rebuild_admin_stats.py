@@ -0,0 +1,34 @@
+"""
+Recompute the stats/ aggregate node used by the admin dashboard.
+
+Write paths keep stats/ up to date incrementally; this job corrects any drift
+(missed hooks, records edited in the console) and refreshes the cached Yoco
+payment summary.  Run it periodically, e.g. hourly from cron:
+
+    0 * * * * cd /srv/giir && python rebuild_admin_stats.py
+
+Usage:
+    python rebuild_admin_stats.py --dry-run     # print the recomputed stats only
+    python rebuild_admin_stats.py --skip-yoco   # do not call the Yoco API
+    python rebuild_admin_stats.py
+"""
+import argparse
+import json
+
+from services.admin_stats import rebuild_stats
+from services.firebase_init import init_firebase
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild the admin dashboard aggregate counters.")
+    parser.add_argument("--dry-run", action="store_true", help="Compute the stats without writing anything.")
+    parser.add_argument("--skip-yoco", action="store_true", help="Leave stats/yoco untouched.")
+    args = parser.parse_args()
+
+    init_firebase()
+    stats = rebuild_stats(dry_run=args.dry_run, include_yoco=not args.skip_yoco)
+    print(json.dumps(stats, indent=2, default=str))
+
+
+if __name__ == "__main__":
+    main()
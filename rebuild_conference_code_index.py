@@ -0,0 +1,26 @@
+"""
+Rebuild conference_codes/{CODE} -> conference_id from the conferences tree.
+
+Usage:
+    python rebuild_conference_code_index.py --dry-run
+    python rebuild_conference_code_index.py
+"""
+import argparse
+import json
+
+from services.firebase_init import init_firebase
+from utils import rebuild_conference_code_index
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild the conference code lookup index.")
+    parser.add_argument("--dry-run", action="store_true", help="Compute the index without writing it.")
+    args = parser.parse_args()
+
+    init_firebase()
+
+    print(json.dumps(rebuild_conference_code_index(dry_run=args.dry_run), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""
+Backfill, rebuild or verify registration_index/{user_id}/{conference_id}.
+
+Usage:
+    python rebuild_registration_index.py --check        # report inconsistencies only
+    python rebuild_registration_index.py --dry-run      # show what a rebuild would write
+    python rebuild_registration_index.py                # rebuild and mark the index ready
+"""
+import argparse
+import json
+
+from services.firebase_init import init_firebase
+from services.registration_index import check_registration_index, rebuild_registration_index
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild or verify the registration lookup index.")
+    parser.add_argument("--check", action="store_true", help="Only compare the stored index with the registrations node.")
+    parser.add_argument("--dry-run", action="store_true", help="Compute the rebuild without writing anything.")
+    args = parser.parse_args()
+
+    init_firebase()
+
+    if args.check:
+        report = check_registration_index()
+        print(json.dumps(report, indent=2))
+        if not report["consistent"]:
+            raise SystemExit(1)
+        return
+
+    print(json.dumps(rebuild_registration_index(dry_run=args.dry_run), indent=2))
+
+
+if __name__ == "__main__":
+    main()
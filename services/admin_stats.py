@@ -0,0 +1,320 @@
+"""
+Admin dashboard aggregates
+
+The admin dashboard used to read every user, conference, registration and
+paper (plus a live Yoco API call) to show a dozen numbers.  Those numbers are
+now kept in a small ``stats/`` node:
+
+    stats/users         -> {total, admins}
+    stats/registrations -> {total, pending, by_payment_status/{status}: {count, amount}}
+    stats/submissions   -> {total, by_status/{status}: count}
+    stats/yoco          -> {total_revenue, approved_count, pending_count, refreshed_at}
+    stats/meta          -> {rebuilt_at, ...}
+
+Write paths report changes with the ``record_*_change(before, after)``
+helpers, which apply the difference with an RTDB transaction on the section.
+Failures are logged and never interrupt the request; drift (missed hooks,
+records edited outside the app) is corrected by :func:`rebuild_stats`, run
+periodically via rebuild_admin_stats.py.  The Yoco summary is also refreshed
+by :func:`refresh_yoco_stats_if_stale` when the dashboard finds it older than
+its maximum age, on a background thread claimed by one worker at a time.
+"""
+
+import copy
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from firebase_admin import db
+
+logger = logging.getLogger(__name__)
+
+STATS_ROOT = 'stats'
+RECEIVED_PAYMENT_STATUSES = ('approved', 'paid')
+ACCEPTED_SUBMISSION_STATUSES = ('accepted', 'approved')
+
+# Characters RTDB does not allow in keys
+_FORBIDDEN_KEY_CHARS = '.#$[]/'
+
+
+def _status_key(value: Any, default: str = 'pending') -> str:
+    text = str(value or '').strip().lower() or default
+    for char in _FORBIDDEN_KEY_CHARS:
+        text = text.replace(char, '_')
+    return text
+
+
+def _amount(value: Any) -> float:
+    try:
+        return float(value or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+# ---------------------------------------------------------------------------
+# Per-record contributions
+# ---------------------------------------------------------------------------
+
+def user_contribution(user: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    if not isinstance(user, dict):
+        return {}
+    return {'total': 1, 'admins': 1 if user.get('is_admin') else 0}
+
+
+def registration_contribution(registration: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    if not isinstance(registration, dict):
+        return {}
+    status = _status_key(registration.get('payment_status'))
+    return {
+        'total': 1,
+        'pending': 1 if status == 'pending' else 0,
+        'by_payment_status': {
+            status: {'count': 1, 'amount': _amount(registration.get('total_amount'))},
+        },
+    }
+
+
+def submission_contribution(submission: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    if not isinstance(submission, dict):
+        return {}
+    return {'total': 1, 'by_status': {_status_key(submission.get('status')): 1}}
+
+
+def _merge(target: Dict[str, Any], contribution: Dict[str, Any], sign: int = 1) -> Dict[str, Any]:
+    """Add ``sign * contribution`` into ``target`` in place (nested numeric dicts)."""
+    for key, value in contribution.items():
+        if isinstance(value, dict):
+            child = target.get(key)
+            if not isinstance(child, dict):
+                child = {}
+            target[key] = _merge(child, value, sign)
+        else:
+            target[key] = (target.get(key) or 0) + sign * value
+    return target
+
+
+def _is_zero(delta: Dict[str, Any]) -> bool:
+    for value in delta.values():
+        if isinstance(value, dict):
+            if not _is_zero(value):
+                return False
+        elif value:
+            return False
+    return True
+
+
+def _apply_change(section: str, before: Dict[str, Any], after: Dict[str, Any]) -> None:
+    delta = _merge(_merge({}, after), before, -1)
+    if _is_zero(delta):
+        return
+    try:
+        db.reference(f'{STATS_ROOT}/{section}').transaction(
+            lambda current: _merge(copy.deepcopy(current) if isinstance(current, dict) else {}, delta)
+        )
+    except Exception as exc:
+        logger.warning(f"[admin_stats] Could not update stats/{section}: {exc}")
+
+
+def record_user_change(before: Optional[Dict[str, Any]], after: Optional[Dict[str, Any]]) -> None:
+    _apply_change('users', user_contribution(before), user_contribution(after))
+
+
+def record_registration_change(before: Optional[Dict[str, Any]], after: Optional[Dict[str, Any]]) -> None:
+    """``after`` may be a partial update; it is merged over ``before``."""
+    if before and after is not None:
+        after = {**before, **after}
+    _apply_change('registrations', registration_contribution(before), registration_contribution(after))
+
+
+def record_submission_change(before: Optional[Dict[str, Any]], after: Optional[Dict[str, Any]]) -> None:
+    """``after`` may be a partial update; it is merged over ``before``."""
+    if before and after is not None:
+        after = {**before, **after}
+    _apply_change('submissions', submission_contribution(before), submission_contribution(after))
+
+
+# ---------------------------------------------------------------------------
+# Full rebuild
+# ---------------------------------------------------------------------------
+
+def compute_stats(
+    users: Dict[str, Any],
+    conferences: Dict[str, Any],
+    registrations: Dict[str, Any],
+    papers: Dict[str, Any],
+) -> Dict[str, Any]:
+    """
+    Compute every section from full snapshots.
+
+    Registrations include the legacy ``conferences/<id>/registrations`` copies
+    (deduplicated by id, the global record wins); submissions include the
+    legacy ``papers`` node and every ``conferences/<id>/paper_submissions``.
+    """
+    stats: Dict[str, Any] = {'users': {}, 'registrations': {}, 'submissions': {}}
+
+    for user in (users or {}).values():
+        _merge(stats['users'], user_contribution(user))
+
+    combined_registrations: Dict[str, Any] = {}
+    for conference in (conferences or {}).values():
+        if isinstance(conference, dict):
+            combined_registrations.update(conference.get('registrations') or {})
+    combined_registrations.update(registrations or {})
+    for registration in combined_registrations.values():
+        _merge(stats['registrations'], registration_contribution(registration))
+
+    for paper in (papers or {}).values():
+        _merge(stats['submissions'], submission_contribution(paper))
+    for conference in (conferences or {}).values():
+        if isinstance(conference, dict):
+            for paper in (conference.get('paper_submissions') or {}).values():
+                _merge(stats['submissions'], submission_contribution(paper))
+
+    return stats
+
+
+def refresh_yoco_stats(dry_run: bool = False) -> Dict[str, Any]:
+    """Fetch the Yoco payment summary once and store it under ``stats/yoco``."""
+    from services.yoco_service import get_yoco_payments
+
+    yoco = {'total_revenue': 0, 'approved_count': 0, 'pending_count': 0}
+    result = get_yoco_payments(limit=100, status_filter=['approved', 'pending'])
+    if result.get('success'):
+        summary = result.get('summary', {})
+        yoco = {
+            'total_revenue': summary.get('total_revenue', 0),
+            'approved_count': summary.get('approved_count', 0),
+            'pending_count': summary.get('pending_count', 0),
+        }
+    yoco['refreshed_at'] = datetime.now().isoformat()
+    if not dry_run:
+        db.reference(f'{STATS_ROOT}/yoco').set(yoco)
+    return yoco
+
+
+def _yoco_age_seconds(yoco: Optional[Dict[str, Any]]) -> Optional[float]:
+    try:
+        refreshed_at = datetime.fromisoformat((yoco or {}).get('refreshed_at') or '')
+    except (TypeError, ValueError):
+        return None
+    return (datetime.now() - refreshed_at).total_seconds()
+
+
+def refresh_yoco_stats_if_stale(stats: Dict[str, Any], max_age_seconds: float) -> bool:
+    """
+    Refresh ``stats/yoco`` in the background when it is missing or older than ``max_age_seconds``.
+
+    The Yoco API call never blocks the caller.  A claim timestamp written by
+    an RTDB transaction keeps workers from refreshing at the same time; a
+    claim left by a failed refresh expires after ``max_age_seconds``.
+    Returns whether this call started a refresh.
+    """
+    yoco = stats.get('yoco') or {}
+    age = _yoco_age_seconds(yoco)
+    if age is not None and age < max_age_seconds:
+        return False
+
+    now = time.time()
+    claimed = {}
+
+    def _claim(current):
+        current = current if isinstance(current, dict) else {}
+        fresh = _yoco_age_seconds(current)
+        if fresh is not None and fresh < max_age_seconds:
+            return current
+        if now - float(current.get('refresh_claimed_at') or 0) < max_age_seconds:
+            return current
+        claimed['at'] = now
+        return dict(current, refresh_claimed_at=now)
+
+    try:
+        db.reference(f'{STATS_ROOT}/yoco').transaction(_claim)
+    except Exception as exc:
+        logger.warning(f"[admin_stats] Could not claim Yoco stats refresh: {exc}")
+        return False
+    if not claimed:
+        return False
+
+    def _refresh():
+        try:
+            refresh_yoco_stats()
+        except Exception as exc:
+            logger.warning(f"[admin_stats] Could not refresh Yoco stats: {exc}")
+
+    threading.Thread(target=_refresh, name='yoco-stats-refresh', daemon=True).start()
+    return True
+
+
+def rebuild_stats(dry_run: bool = False, include_yoco: bool = True) -> Dict[str, Any]:
+    """Recompute ``stats/`` from the source nodes, replacing the counters."""
+    users = db.reference('users').get() or {}
+    conferences = db.reference('conferences').get() or {}
+    registrations = db.reference('registrations').get() or {}
+    papers = db.reference('papers').get() or {}
+
+    stats = compute_stats(users, conferences, registrations, papers)
+    stats['meta'] = {'rebuilt_at': datetime.now().isoformat()}
+
+    if not dry_run:
+        db.reference(STATS_ROOT).update(stats)
+    if include_yoco:
+        try:
+            stats['yoco'] = refresh_yoco_stats(dry_run=dry_run)
+        except Exception as exc:
+            logger.warning(f"[admin_stats] Could not refresh Yoco stats: {exc}")
+
+    logger.info(f"[admin_stats] Rebuilt stats (dry_run={dry_run})")
+    return stats
+
+
+def get_stats() -> Dict[str, Any]:
+    """Return the ``stats/`` node, rebuilding it (without Yoco) on first use."""
+    stats = db.reference(STATS_ROOT).get() or {}
+    if not stats.get('meta'):
+        stats.update(rebuild_stats(include_yoco=False))
+    return stats
+
+
+def dashboard_stats(stats: Dict[str, Any], conferences: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten ``stats/`` into the keys templates/admin/dashboard.html renders."""
+    users = stats.get('users') or {}
+    registrations = stats.get('registrations') or {}
+    submissions = stats.get('submissions') or {}
+    yoco = stats.get('yoco') or {}
+
+    by_payment_status = registrations.get('by_payment_status') or {}
+    total_revenue = sum(_amount(bucket.get('amount')) for bucket in by_payment_status.values() if bucket)
+    pending_payments = _amount((by_payment_status.get('pending') or {}).get('amount'))
+    received_payments = sum(
+        _amount((by_payment_status.get(status) or {}).get('amount')) for status in RECEIVED_PAYMENT_STATUSES
+    )
+
+    by_status = submissions.get('by_status') or {}
+    total_users = users.get('total') or 0
+    total_admins = users.get('admins') or 0
+
+    return {
+        'total_users': total_users,
+        'total_conferences': len(conferences or {}),
+        'active_conferences': sum(
+            1 for conf in (conferences or {}).values()
+            if conf and (conf.get('basic_info') or {}).get('status') == 'active'
+        ),
+        'total_registrations': registrations.get('total') or 0,
+        'total_submissions': submissions.get('total') or 0,
+        'pending_registrations': registrations.get('pending') or 0,
+        'pending_submissions': by_status.get('pending') or 0,
+        'accepted_submissions': sum(by_status.get(status) or 0 for status in ACCEPTED_SUBMISSION_STATUSES),
+        'total_admins': total_admins,
+        'total_regular_users': total_users - total_admins,
+        # Revenue stats
+        'total_revenue': round(total_revenue, 2),
+        'pending_payments': round(pending_payments, 2),
+        'received_payments': round(received_payments, 2),
+        # Yoco-specific stats (refreshed by the rebuild job, not per page view)
+        'yoco_revenue': round(_amount(yoco.get('total_revenue')), 2),
+        'yoco_approved_count': yoco.get('approved_count', 0),
+        'yoco_pending_count': yoco.get('pending_count', 0),
+    }
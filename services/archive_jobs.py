@@ -0,0 +1,208 @@
+"""
+Background submission archive jobs with cached artifacts in Storage
+
+Building the "download all submissions" ZIP is slow, and most clicks ask for
+the same archive as the previous one.  A job is therefore identified by a
+content key, the SHA-256 of the archive manifest (path, paper id, entry name,
+``updated_at`` and file location of every included paper):
+
+* the finished ZIP is uploaded to ``archives/submissions/<key>.zip``; a
+  repeat request whose papers have not changed finds it there and is served
+  a signed URL straight away;
+* job state lives in RTDB at ``archive_jobs/<key>`` (status, progress,
+  heartbeat), so every gunicorn worker can report on a job another worker
+  runs, and two clicks on the same archive share one job (the claim is an
+  RTDB transaction);
+* the archive is built on a daemon thread of the worker that took the
+  request, streaming :func:`services.submission_archive.stream_zip` into a
+  resumable upload, so neither the worker's memory nor the request timeout
+  limit its size.  A job whose heartbeat stops (worker restarted) is taken
+  over by the next request for it.
+
+Old artifacts are not deleted here; give the ``archives/`` prefix a Storage
+lifecycle rule.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from firebase_admin import db
+
+from services.storage_downloads import signed_url
+from services.submission_archive import stream_zip
+
+logger = logging.getLogger(__name__)
+
+JOBS_ROOT = 'archive_jobs'
+ARCHIVE_PREFIX = 'archives/submissions'
+
+STATUS_QUEUED = 'queued'
+STATUS_RUNNING = 'running'
+STATUS_READY = 'ready'
+STATUS_FAILED = 'failed'
+
+# Upload chunk size for the resumable upload (must be a multiple of 256 KiB)
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+# Minimum seconds between progress writes
+PROGRESS_INTERVAL = 2.0
+
+
+def manifest_key(manifest: Iterable[Any]) -> str:
+    """SHA-256 of a JSON-serialisable manifest; entry order matters."""
+    digest = hashlib.sha256()
+    for entry in manifest:
+        digest.update(json.dumps(entry, sort_keys=True, default=str).encode('utf-8'))
+        digest.update(b'\n')
+    return digest.hexdigest()
+
+
+def archive_storage_path(key: str) -> str:
+    return f'{ARCHIVE_PREFIX}/{key}.zip'
+
+
+def get_job(key: str) -> Optional[Dict[str, Any]]:
+    job = db.reference(f'{JOBS_ROOT}/{key}').get()
+    return job if isinstance(job, dict) else None
+
+
+def _is_live(job: Optional[Dict[str, Any]], stale_seconds: float) -> bool:
+    if not job or job.get('status') not in (STATUS_QUEUED, STATUS_RUNNING):
+        return False
+    return time.time() - float(job.get('heartbeat') or 0) < stale_seconds
+
+
+def start_job(
+    key: str,
+    items: List[Any],
+    load: Callable[[Any], Any],
+    bucket,
+    created_by: str = '',
+    filters: Optional[Dict[str, str]] = None,
+    max_workers: int = 4,
+    prefetch: int = 8,
+    stale_seconds: float = 600,
+) -> Dict[str, Any]:
+    """
+    Return the job for ``key``, starting a build when there is no usable one.
+
+    A cached artifact marks the job ready without rebuilding.  ``items`` and
+    ``load`` are handed to :func:`stream_zip` on the background thread.
+    """
+    job = get_job(key)
+    if job and job.get('status') == STATUS_READY:
+        if bucket.blob(job.get('storage_path') or archive_storage_path(key)).exists():
+            return job
+    elif _is_live(job, stale_seconds):
+        return job
+
+    now = time.time()
+    record = {
+        'key': key,
+        'status': STATUS_QUEUED,
+        'filters': filters or {},
+        'total': len(items),
+        'done': 0,
+        'entries': 0,
+        'skipped': 0,
+        'storage_path': archive_storage_path(key),
+        'created_by': created_by,
+        'created_at': datetime.now().isoformat(),
+        'heartbeat': now,
+    }
+
+    # The artifact may outlive its job record (or belong to another filter)
+    if bucket.blob(record['storage_path']).exists():
+        record.update(status=STATUS_READY, done=len(items), finished_at=record['created_at'])
+        db.reference(f'{JOBS_ROOT}/{key}').set(record)
+        return record
+
+    claimed = {}
+
+    def _claim(current):
+        if _is_live(current, stale_seconds):
+            return current
+        claimed['job'] = record
+        return record
+
+    try:
+        db.reference(f'{JOBS_ROOT}/{key}').transaction(_claim)
+    except Exception as e:
+        logger.warning(f"[archive_jobs] Could not claim job {key}: {e}")
+        return get_job(key) or record
+    if not claimed:
+        return get_job(key) or record
+
+    thread = threading.Thread(
+        target=_run_job,
+        args=(key, items, load, bucket, max_workers, prefetch),
+        name=f'archive-job-{key[:12]}',
+        daemon=True,
+    )
+    thread.start()
+    return record
+
+
+def _run_job(key: str, items: List[Any], load, bucket, max_workers: int, prefetch: int) -> None:
+    ref = db.reference(f'{JOBS_ROOT}/{key}')
+    storage_path = archive_storage_path(key)
+    stats = {}
+    last_progress = 0.0
+    try:
+        ref.update({'status': STATUS_RUNNING, 'heartbeat': time.time()})
+        blob = bucket.blob(storage_path)
+        writer = blob.open('wb', content_type='application/zip', chunk_size=UPLOAD_CHUNK_SIZE)
+        size = 0
+        for chunk in stream_zip(items, load, max_workers=max_workers, prefetch=prefetch, stats=stats):
+            writer.write(chunk)
+            size += len(chunk)
+            if time.time() - last_progress >= PROGRESS_INTERVAL:
+                last_progress = time.time()
+                ref.update({
+                    'done': stats['entries'] + stats['skipped'],
+                    'entries': stats['entries'],
+                    'skipped': stats['skipped'],
+                    'heartbeat': last_progress,
+                })
+        if not stats['entries']:
+            # Every item was skipped; leave the upload unfinalized so no empty
+            # artifact is cached under this key
+            ref.update({
+                'status': STATUS_FAILED,
+                'error': 'No attachments found with valid file data.',
+                'done': stats['skipped'],
+                'entries': 0,
+                'skipped': stats['skipped'],
+                'heartbeat': time.time(),
+                'finished_at': datetime.now().isoformat(),
+            })
+            logger.warning(f"[archive_jobs] Job {key[:12]} found no files to archive")
+            return
+        # Only a completed archive is finalized; a failed upload is abandoned
+        writer.close()
+        ref.update({
+            'status': STATUS_READY,
+            'done': stats['entries'] + stats['skipped'],
+            'entries': stats['entries'],
+            'skipped': stats['skipped'],
+            'size': size,
+            'heartbeat': time.time(),
+            'finished_at': datetime.now().isoformat(),
+        })
+        logger.info(f"[archive_jobs] Job {key[:12]} ready: {stats['entries']} files, {size} bytes")
+    except Exception as e:
+        logger.error(f"[archive_jobs] Job {key[:12]} failed: {e}")
+        try:
+            ref.update({'status': STATUS_FAILED, 'error': str(e), 'heartbeat': time.time()})
+        except Exception:
+            pass
+
+
+def signed_download_url(bucket, job: Dict[str, Any], download_name: str, expiration_minutes: int = 15) -> str:
+    """Short-lived V4 URL that downloads the job's artifact as ``download_name``."""
+    blob = bucket.blob(job.get('storage_path') or archive_storage_path(job['key']))
+    return signed_url(blob, download_name, 'application/zip', expiration_minutes)
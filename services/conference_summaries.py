@@ -0,0 +1,87 @@
+"""
+Projected conference reads
+
+Listing pages (home, /conferences, /galleries, sitemap.xml) only need a
+handful of small fields per conference, but ``db.reference('conferences').get()``
+downloads every paper submission, registration and gallery entry stored under
+each conference.
+
+``fetch_conference_summaries`` instead lists conference IDs with a shallow REST
+query (``?shallow=true`` returns ``{id: true}`` only) and then reads the
+whitelisted sub-paths of every conference concurrently.
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Optional
+
+from firebase_admin import db
+
+logger = logging.getLogger(__name__)
+
+# Sub-paths read for each conference. Everything else (paper_submissions,
+# registrations, gallery, gallery_attendees, ...) is skipped.
+CONFERENCE_SUMMARY_KEYS = (
+    'basic_info',
+    'settings',
+    'conference_code',
+    'gallery_summary',
+    'gradient_colors',
+    'hero_image',
+)
+
+DEFAULT_MAX_WORKERS = 8
+
+
+def fetch_conference_ids(root: str = 'conferences') -> list:
+    """Return conference IDs without downloading their contents."""
+    shallow = db.reference(root).get(shallow=True) or {}
+    return list(shallow.keys())
+
+
+def _fetch_path(path: str) -> Any:
+    return db.reference(path).get()
+
+
+def fetch_conference_summaries(
+    keys: Iterable[str] = CONFERENCE_SUMMARY_KEYS,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    conference_ids: Optional[Iterable[str]] = None,
+    root: str = 'conferences',
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetch a projection of every conference.
+
+    Args:
+        keys:           Sub-paths to read for each conference.
+        max_workers:    Size of the thread pool used for the per-path reads.
+        conference_ids: Restrict to these IDs (skips the shallow listing).
+        root:           RTDB node holding the conferences.
+
+    Returns:
+        ``{conference_id: {key: value, ...}}``; keys that do not exist in the
+        database are omitted, mirroring what a full-tree read would return.
+    """
+    keys = tuple(keys)
+    if conference_ids is None:
+        conference_ids = fetch_conference_ids(root)
+    conference_ids = list(conference_ids)
+    if not conference_ids or not keys:
+        return {}
+
+    paths = [
+        (conference_id, key, f'{root}/{conference_id}/{key}')
+        for conference_id in conference_ids
+        for key in keys
+    ]
+
+    summaries: Dict[str, Dict[str, Any]] = {conference_id: {} for conference_id in conference_ids}
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(paths)))) as executor:
+        results = executor.map(_fetch_path, [path for _, _, path in paths])
+        for (conference_id, key, _), value in zip(paths, results):
+            if value is not None:
+                summaries[conference_id][key] = value
+
+    # A conference that vanished between the listing and the reads has no
+    # fields left; drop it like the full-tree read would.
+    return {conference_id: summary for conference_id, summary in summaries.items() if summary}
@@ -0,0 +1,503 @@
+"""
+Realtime Database backends
+
+Routes and services talk to the Realtime Database through
+``firebase_admin.db.reference(path)``.  This module puts that call behind a
+backend so the same code can run against:
+
+* :class:`FirebaseBackend` - the live database (the default);
+* :class:`InMemoryBackend` - a process-local tree that emulates the RTDB
+  path semantics the app relies on: nested paths, multi-location
+  ``update`` (``None`` deletes), push keys, ``get(shallow=True)``,
+  ``order_by_child/key/value`` with ``start_at/end_at/equal_to`` and
+  ``limit_to_first/last``, and ``transaction``.  Every call can be delayed by
+  a configurable simulated latency and is counted (calls, bytes), so hot
+  routes can be profiled and benchmarked without a Firebase project.
+
+:func:`activate_backend` routes ``firebase_admin.db.reference`` to the chosen
+backend, which covers every existing ``db.reference`` call site (routes and
+the services they use) without rewriting them.  The in-memory backend is
+meant for local benchmarks and tests only; Storage and Auth still need
+Firebase.
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import random
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from firebase_admin import db, exceptions
+
+logger = logging.getLogger(__name__)
+
+_FORBIDDEN_KEY_CHARS = set('.#$[]')
+PUSH_CHARS = '-0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz'
+
+
+def split_path(path: Optional[str]) -> List[str]:
+    return [part for part in str(path or '').strip('/').split('/') if part]
+
+
+def _validate_path(parts: List[str]) -> None:
+    for part in parts:
+        if _FORBIDDEN_KEY_CHARS & set(part):
+            raise ValueError(f'Invalid path segment: {part!r}')
+
+
+def _normalize(value: Any) -> Any:
+    """Store values the way RTDB does: JSON types only, no empty objects, no nulls."""
+    if isinstance(value, dict):
+        cleaned = {}
+        for key, child in value.items():
+            child = _normalize(child)
+            if child is not None:
+                cleaned[str(key)] = child
+        return cleaned or None
+    if isinstance(value, (list, tuple)):
+        return _normalize({str(index): child for index, child in enumerate(value)})
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    raise ValueError(f'Unsupported value type: {type(value).__name__}')
+
+
+def _to_output(value: Any) -> Any:
+    """Objects whose keys are array indices come back as lists, as RTDB returns them."""
+    if not isinstance(value, dict):
+        return value
+    converted = {key: _to_output(child) for key, child in value.items()}
+    if converted and all(key.isdigit() and (key == '0' or not key.startswith('0')) for key in converted):
+        indices = [int(key) for key in converted]
+        if max(indices) < 2 * len(indices):
+            items = [None] * (max(indices) + 1)
+            for key, child in converted.items():
+                items[int(key)] = child
+            return items
+    return converted
+
+
+def _payload_bytes(value: Any) -> int:
+    if value is None:
+        return 0
+    return len(json.dumps(value, separators=(',', ':')).encode('utf-8'))
+
+
+def _rank(value: Any) -> Tuple[int, Any]:
+    """RTDB ordering of child values: null < false < true < numbers < strings < objects."""
+    if value is None:
+        return (0, 0)
+    if value is False:
+        return (1, 0)
+    if value is True:
+        return (2, 0)
+    if isinstance(value, (int, float)):
+        return (3, value)
+    if isinstance(value, str):
+        return (4, value)
+    return (5, 0)
+
+
+def _key_rank(key: str) -> Tuple[int, Any]:
+    """Keys that parse as 32-bit integers sort numerically before other keys."""
+    try:
+        number = int(key)
+        if str(number) == key and -2 ** 31 <= number < 2 ** 31:
+            return (0, number)
+    except ValueError:
+        pass
+    return (1, key)
+
+
+class _PushIdGenerator:
+    """Chronologically ordered 20-character push keys, as generated by the Firebase SDKs."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._last_time = 0
+        self._last_random = [0] * 12
+
+    def __call__(self) -> str:
+        with self._lock:
+            now = int(time.time() * 1000)
+            if now == self._last_time:
+                for index in range(11, -1, -1):
+                    if self._last_random[index] < 63:
+                        self._last_random[index] += 1
+                        break
+                    self._last_random[index] = 0
+            else:
+                self._last_random = [random.randrange(64) for _ in range(12)]
+            self._last_time = now
+
+            time_chars = []
+            for _ in range(8):
+                time_chars.append(PUSH_CHARS[now % 64])
+                now //= 64
+            return ''.join(reversed(time_chars)) + ''.join(PUSH_CHARS[index] for index in self._last_random)
+
+
+class BackendStats:
+    """Counters for backend calls; one call is one network round trip on the live database."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.reads = 0
+            self.writes = 0
+            self.bytes_read = 0
+            self.bytes_written = 0
+
+    def record_read(self, payload: Any) -> None:
+        with self._lock:
+            self.reads += 1
+            self.bytes_read += _payload_bytes(payload)
+
+    def record_write(self, payload: Any) -> None:
+        with self._lock:
+            self.writes += 1
+            self.bytes_written += _payload_bytes(payload)
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                'reads': self.reads,
+                'writes': self.writes,
+                'bytes_read': self.bytes_read,
+                'bytes_written': self.bytes_written,
+            }
+
+
+class FirebaseBackend:
+    """The live Realtime Database through the Admin SDK."""
+
+    name = 'firebase'
+
+    def __init__(self, reference: Callable[..., Any] = None):
+        self._reference = reference or _original_reference
+
+    def reference(self, path: str = '/'):
+        return self._reference(path)
+
+
+class InMemoryBackend:
+    """
+    Process-local emulation of the Realtime Database.
+
+    ``latency_ms`` (plus up to ``jitter_ms`` random extra) is slept on every
+    call outside the lock, so concurrent readers overlap the way real network
+    calls do.  ``stats`` counts calls and JSON payload bytes in both directions.
+    """
+
+    name = 'memory'
+
+    def __init__(self, data: Optional[Dict[str, Any]] = None, latency_ms: float = 0.0, jitter_ms: float = 0.0):
+        self._lock = threading.RLock()
+        self._root: Any = _normalize(copy.deepcopy(data)) if data else None
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.stats = BackendStats()
+        self.push_id = _PushIdGenerator()
+
+    # -- loading ------------------------------------------------------------
+
+    @classmethod
+    def from_json_file(cls, path: str, **kwargs) -> 'InMemoryBackend':
+        """Load an RTDB export (or a generated dataset) from a JSON file."""
+        with open(path, 'r', encoding='utf-8') as handle:
+            return cls(json.load(handle), **kwargs)
+
+    def load(self, data: Optional[Dict[str, Any]]) -> None:
+        with self._lock:
+            self._root = _normalize(copy.deepcopy(data)) if data else None
+
+    def dump(self) -> Any:
+        with self._lock:
+            return copy.deepcopy(self._root)
+
+    def reference(self, path: str = '/') -> 'MemoryReference':
+        return MemoryReference(self, split_path(path))
+
+    # -- internals used by MemoryReference / MemoryQuery ----------------------
+
+    def _wait(self) -> None:
+        delay = self.latency_ms + (random.uniform(0, self.jitter_ms) if self.jitter_ms else 0.0)
+        if delay > 0:
+            time.sleep(delay / 1000.0)
+
+    def _read(self, parts: List[str]) -> Any:
+        node = self._root
+        for part in parts:
+            if not isinstance(node, dict):
+                return None
+            node = node.get(part)
+        return node
+
+    def _write(self, parts: List[str], value: Any) -> None:
+        value = _normalize(value)
+        if not parts:
+            self._root = value
+            return
+        if value is None:
+            self._delete(parts)
+            return
+        if not isinstance(self._root, dict):
+            self._root = {}
+        node = self._root
+        for part in parts[:-1]:
+            child = node.get(part)
+            if not isinstance(child, dict):
+                child = {}
+                node[part] = child
+            node = child
+        node[parts[-1]] = value
+
+    def _delete(self, parts: List[str]) -> None:
+        trail = []
+        node = self._root
+        for part in parts[:-1]:
+            if not isinstance(node, dict) or part not in node:
+                return
+            trail.append((node, part))
+            node = node[part]
+        if isinstance(node, dict):
+            node.pop(parts[-1], None)
+        # RTDB has no empty objects: drop parents left empty
+        while trail and not node:
+            parent, key = trail.pop()
+            parent.pop(key, None)
+            node = parent
+        if not self._root:
+            self._root = None
+
+
+class MemoryReference:
+    """Subset of ``firebase_admin.db.Reference`` backed by :class:`InMemoryBackend`."""
+
+    def __init__(self, backend: InMemoryBackend, parts: List[str]):
+        _validate_path(parts)
+        self._backend = backend
+        self._parts = parts
+
+    @property
+    def key(self) -> Optional[str]:
+        return self._parts[-1] if self._parts else None
+
+    @property
+    def path(self) -> str:
+        return '/' + '/'.join(self._parts)
+
+    @property
+    def parent(self) -> Optional['MemoryReference']:
+        if not self._parts:
+            return None
+        return MemoryReference(self._backend, self._parts[:-1])
+
+    def child(self, path: str) -> 'MemoryReference':
+        return MemoryReference(self._backend, self._parts + split_path(path))
+
+    def get(self, etag: bool = False, shallow: bool = False):
+        backend = self._backend
+        backend._wait()
+        with backend._lock:
+            value = _to_output(copy.deepcopy(backend._read(self._parts)))
+        if shallow and isinstance(value, (dict, list)):
+            items = value.items() if isinstance(value, dict) else enumerate(value)
+            value = {
+                str(key): (True if isinstance(child, (dict, list)) else child)
+                for key, child in items if child is not None
+            }
+        backend.stats.record_read(value)
+        if etag:
+            digest = hashlib.md5(json.dumps(value, sort_keys=True).encode('utf-8')).hexdigest()
+            return value, digest
+        return value
+
+    def set(self, value: Any) -> None:
+        backend = self._backend
+        backend._wait()
+        with backend._lock:
+            backend._write(self._parts, copy.deepcopy(value))
+        backend.stats.record_write(value)
+
+    def update(self, value: Dict[str, Any]) -> None:
+        if not isinstance(value, dict) or not value:
+            raise ValueError('Value argument must be a non-empty dictionary.')
+        targets = [(split_path(key), child) for key, child in value.items()]
+        paths = sorted('/'.join(parts) for parts, _ in targets)
+        for current, following in zip(paths, paths[1:]):
+            if following.startswith(current + '/') or following == current:
+                raise exceptions.InvalidArgumentError(
+                    f'Path {current} is an ancestor of {following} in the same update.'
+                )
+        backend = self._backend
+        backend._wait()
+        with backend._lock:
+            for parts, child in targets:
+                backend._write(self._parts + parts, copy.deepcopy(child))
+        backend.stats.record_write(value)
+
+    def delete(self) -> None:
+        backend = self._backend
+        backend._wait()
+        with backend._lock:
+            backend._write(self._parts, None)
+        backend.stats.record_write(None)
+
+    def push(self, value: Any = '') -> 'MemoryReference':
+        child = self.child(self._backend.push_id())
+        child.set(value)
+        return child
+
+    def transaction(self, transaction_update: Callable[[Any], Any]) -> Any:
+        backend = self._backend
+        backend._wait()
+        with backend._lock:
+            current = _to_output(copy.deepcopy(backend._read(self._parts)))
+            backend.stats.record_read(current)
+            new_value = transaction_update(current)
+            backend._write(self._parts, copy.deepcopy(new_value))
+        backend.stats.record_write(new_value)
+        return new_value
+
+    def order_by_child(self, path: str) -> 'MemoryQuery':
+        if not path or path.startswith('$'):
+            raise ValueError(f'Illegal child path: {path!r}')
+        return MemoryQuery(self, lambda key, row: MemoryQuery.child_value(row, path))
+
+    def order_by_key(self) -> 'MemoryQuery':
+        return MemoryQuery(self, lambda key, row: key, by_key=True)
+
+    def order_by_value(self) -> 'MemoryQuery':
+        return MemoryQuery(self, lambda key, row: row)
+
+
+class MemoryQuery:
+    """Subset of ``firebase_admin.db.Query``; ``get()`` returns an ordered dict like the SDK."""
+
+    def __init__(self, reference: MemoryReference, value_of: Callable[[str, Any], Any], by_key: bool = False):
+        self._reference = reference
+        self._value_of = value_of
+        self._by_key = by_key
+        self._start = self._end = self._equal = None
+        self._has_start = self._has_end = self._has_equal = False
+        self._limit_first = self._limit_last = None
+
+    @staticmethod
+    def child_value(row: Any, path: str) -> Any:
+        """The value ordered on for ``order_by_child(path)``; objects order as null here."""
+        node = row
+        for part in split_path(path):
+            if not isinstance(node, dict):
+                return None
+            node = node.get(part)
+        return node if not isinstance(node, dict) else None
+
+    def _rank(self, key: str, row: Any) -> Tuple:
+        if self._by_key:
+            return (_key_rank(key),)
+        return (_rank(self._value_of(key, row)), _key_rank(key))
+
+    def _bound(self, value: Any) -> Tuple:
+        return (_key_rank(value),) if self._by_key else (_rank(value),)
+
+    def start_at(self, start: Any) -> 'MemoryQuery':
+        if start is None:
+            raise ValueError('Start value must not be None.')
+        self._start, self._has_start = start, True
+        return self
+
+    def end_at(self, end: Any) -> 'MemoryQuery':
+        if end is None:
+            raise ValueError('End value must not be None.')
+        self._end, self._has_end = end, True
+        return self
+
+    def equal_to(self, value: Any) -> 'MemoryQuery':
+        if value is None:
+            raise ValueError('Equal to value must not be None.')
+        self._equal, self._has_equal = value, True
+        return self
+
+    def limit_to_first(self, limit: int) -> 'MemoryQuery':
+        if self._limit_last is not None:
+            raise ValueError('Cannot set both first and last limits.')
+        self._limit_first = int(limit)
+        return self
+
+    def limit_to_last(self, limit: int) -> 'MemoryQuery':
+        if self._limit_first is not None:
+            raise ValueError('Cannot set both first and last limits.')
+        self._limit_last = int(limit)
+        return self
+
+    def get(self) -> 'OrderedDict[str, Any]':
+        backend = self._reference._backend
+        backend._wait()
+        with backend._lock:
+            node = copy.deepcopy(backend._read(self._reference._parts))
+        rows = list(node.items()) if isinstance(node, dict) else []
+        rows.sort(key=lambda item: self._rank(*item))
+
+        def _position(item):
+            return self._rank(*item)[:1]
+
+        if self._has_equal:
+            rows = [item for item in rows if _position(item) == self._bound(self._equal)]
+        if self._has_start:
+            rows = [item for item in rows if _position(item) >= self._bound(self._start)]
+        if self._has_end:
+            rows = [item for item in rows if _position(item) <= self._bound(self._end)]
+        if self._limit_first is not None:
+            rows = rows[:self._limit_first]
+        if self._limit_last is not None:
+            rows = rows[-self._limit_last:] if self._limit_last else []
+
+        result = OrderedDict((key, _to_output(row)) for key, row in rows)
+        backend.stats.record_read(result)
+        return result
+
+
+# ---------------------------------------------------------------------------
+# Active backend
+# ---------------------------------------------------------------------------
+
+_original_reference = db.reference
+_active_backend = None
+
+
+def get_backend():
+    """The backend ``db.reference`` currently resolves to."""
+    global _active_backend
+    if _active_backend is None:
+        _active_backend = FirebaseBackend(_original_reference)
+    return _active_backend
+
+
+def activate_backend(backend) -> None:
+    """
+    Route ``firebase_admin.db.reference`` (and so every existing call site) to ``backend``.
+
+    Call sites resolve ``db.reference`` at call time, so this also affects
+    modules imported earlier.  Activating a :class:`FirebaseBackend` restores
+    the Admin SDK implementation.
+    """
+    global _active_backend
+    _active_backend = backend
+    if isinstance(backend, FirebaseBackend):
+        db.reference = _original_reference
+    else:
+        db.reference = backend.reference
+    logger.info(f"[data_backend] Active backend: {backend.name}")
+
+
+def create_memory_backend(seed_path: Optional[str] = None, latency_ms: float = 0.0, jitter_ms: float = 0.0) -> InMemoryBackend:
+    if seed_path:
+        return InMemoryBackend.from_json_file(seed_path, latency_ms=latency_ms, jitter_ms=jitter_ms)
+    return InMemoryBackend(latency_ms=latency_ms, jitter_ms=jitter_ms)
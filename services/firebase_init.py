@@ -0,0 +1,43 @@
+"""
+Firebase Admin initialisation for the maintenance scripts
+
+The rebuild/backfill/migration/benchmark scripts run outside the Flask app,
+so they initialise the Admin SDK themselves.  Credentials are taken from, in
+order: ``FIREBASE_CREDENTIALS`` (service account JSON),
+``GOOGLE_APPLICATION_CREDENTIALS``, ``FIREBASE_SERVICE_ACCOUNT_PATH``, then
+``serviceAccountKey.json`` in the working directory.
+"""
+
+import json
+import os
+
+import firebase_admin
+from firebase_admin import credentials
+from dotenv import load_dotenv
+
+DEFAULT_DATABASE_URL = "https://giir-66ae6-default-rtdb.firebaseio.com"
+DEFAULT_STORAGE_BUCKET = "giir-66ae6.firebasestorage.app"
+
+
+def init_firebase() -> None:
+    """Initialise the default Firebase app from the environment (no-op if already done)."""
+    if firebase_admin._apps:
+        return
+
+    load_dotenv()
+
+    if os.environ.get("FIREBASE_CREDENTIALS"):
+        cred_dict = json.loads(os.environ["FIREBASE_CREDENTIALS"])
+        cred = credentials.Certificate(cred_dict)
+    elif os.environ.get("GOOGLE_APPLICATION_CREDENTIALS"):
+        cred = credentials.Certificate(os.environ["GOOGLE_APPLICATION_CREDENTIALS"])
+    elif os.environ.get("FIREBASE_SERVICE_ACCOUNT_PATH"):
+        cred = credentials.Certificate(os.environ["FIREBASE_SERVICE_ACCOUNT_PATH"])
+    else:
+        cred = credentials.Certificate("serviceAccountKey.json")
+
+    firebase_options = {
+        "databaseURL": os.environ.get("FIREBASE_DATABASE_URL", DEFAULT_DATABASE_URL),
+        "storageBucket": os.environ.get("FIREBASE_STORAGE_BUCKET", DEFAULT_STORAGE_BUCKET),
+    }
+    firebase_admin.initialize_app(cred, firebase_options)
@@ -0,0 +1,377 @@
+"""
+Move legacy inline ``file_data`` out of RTDB into Storage
+
+Early submissions stored the uploaded file as base64 in ``file_data`` on the
+paper record, and revisions copied it into ``file_history`` entries.  Every
+read of ``papers`` (or of a conference's ``paper_submissions``) transferred
+those megabytes just for ``admin_submissions`` to strip them again.
+
+:func:`migrate_inline_files` walks the collections one paper at a time:
+each inline file is decoded, uploaded next to the files the app uploads
+today (``papers/{conference_id|global}/{paper_id}/...``, revisions under
+``.../history/``) with its MD5 checked by Storage, and the record is
+rewritten with ``file_storage_path``/``file_url``/``file_md5`` and without
+the payload.  The rewrite is an RTDB transaction that only applies while
+the payload is still the one that was uploaded, so it is safe while the
+site is live.
+
+The walk is resumable: paper ids are processed in key order and the last id
+whose predecessors are all done is checkpointed under
+``index_status/inline_file_data``.  Retryable errors (uploads, the rewrite
+transaction, a record edited mid-migration) hold the checkpoint so the next
+run tries again; papers that can never migrate as stored (undecodable
+base64) are recorded under ``index_status/inline_file_data/failed`` and
+passed over, and ``retry_failed`` reprocesses just those.
+:func:`verify_migrated_files` compares every recorded ``file_md5`` with the
+MD5 Storage holds for the object.
+"""
+
+import base64
+import hashlib
+import logging
+import mimetypes
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from firebase_admin import db
+from werkzeug.utils import secure_filename
+
+logger = logging.getLogger(__name__)
+
+STATUS_PATH = 'index_status/inline_file_data'
+FAILED_PATH = f'{STATUS_PATH}/failed'
+LEGACY_ROOT = 'papers'
+
+
+class Throttle:
+    """Blocks callers so that at most ``bytes_per_second`` pass on average (0 = unlimited)."""
+
+    def __init__(self, bytes_per_second: float = 0):
+        self.bytes_per_second = bytes_per_second
+        self._lock = threading.Lock()
+        self._next_free = time.monotonic()
+
+    def wait(self, size: int) -> None:
+        if self.bytes_per_second <= 0 or size <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_free)
+            self._next_free = start + size / self.bytes_per_second
+        if start > now:
+            time.sleep(start - now)
+
+
+def _md5_base64(data: bytes) -> str:
+    """MD5 in the base64 form Storage reports as ``md5_hash``."""
+    return base64.b64encode(hashlib.md5(data).digest()).decode('ascii')
+
+
+def _text_digest(text: str) -> str:
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def _collection_slug(path: str) -> str:
+    """RTDB-safe checkpoint key for a collection path."""
+    return path.replace('/', ':')
+
+
+def list_collections(conference_ids: Optional[Iterable[str]] = None, include_legacy: bool = True) -> List[str]:
+    """``papers`` plus every (or the given) conference's ``paper_submissions``."""
+    collections = [LEGACY_ROOT] if include_legacy else []
+    if conference_ids is None:
+        conference_ids = sorted((db.reference('conferences').get(shallow=True) or {}).keys())
+    collections.extend(f'conferences/{conference_id}/paper_submissions' for conference_id in conference_ids)
+    return collections
+
+
+def _storage_folder(collection: str, paper_id: str) -> str:
+    if collection == LEGACY_ROOT:
+        return f'papers/global/{paper_id}'
+    conference_id = collection.split('/')[1]
+    return f'papers/{conference_id}/{paper_id}'
+
+
+def _history_items(file_history: Any) -> List[Tuple[str, Dict[str, Any]]]:
+    """``[(key, entry)]`` for a history stored as a list or a dict."""
+    if isinstance(file_history, list):
+        return [(str(index), entry) for index, entry in enumerate(file_history) if isinstance(entry, dict)]
+    if isinstance(file_history, dict):
+        return [(str(key), entry) for key, entry in file_history.items() if isinstance(entry, dict)]
+    return []
+
+
+def _history_entry(record: Dict[str, Any], key: str) -> Optional[Dict[str, Any]]:
+    file_history = record.get('file_history')
+    if isinstance(file_history, list):
+        index = int(key)
+        entry = file_history[index] if index < len(file_history) else None
+    elif isinstance(file_history, dict):
+        entry = file_history.get(key)
+    else:
+        entry = None
+    return entry if isinstance(entry, dict) else None
+
+
+def inline_files(paper: Dict[str, Any]) -> List[Tuple[Optional[str], Dict[str, Any]]]:
+    """``[(history key or None for the current file, holder)]`` still carrying inline ``file_data``."""
+    found = []
+    if paper.get('file_data') and not paper.get('file_storage_path'):
+        found.append((None, paper))
+    for key, entry in _history_items(paper.get('file_history')):
+        if entry.get('file_data') and not entry.get('file_storage_path'):
+            found.append((key, entry))
+    return found
+
+
+def _upload(bucket, storage_path: str, data: bytes, content_type: str, throttle: Throttle) -> Any:
+    throttle.wait(len(data))
+    blob = bucket.blob(storage_path)
+    # Storage rejects the upload if the bytes it receives do not match
+    blob.md5_hash = _md5_base64(data)
+    blob.upload_from_string(data, content_type=content_type)
+    blob.make_public()
+    return blob
+
+
+def migrate_paper(
+    collection: str,
+    paper_id: str,
+    bucket,
+    throttle: Optional[Throttle] = None,
+    dry_run: bool = False,
+) -> Dict[str, int]:
+    """
+    Move one paper's inline files to Storage; returns ``{files, bytes, errors, failed}``.
+
+    ``errors`` are retryable; ``failed`` counts files that cannot migrate as
+    stored, described in ``result['failure']``.
+    """
+    throttle = throttle or Throttle()
+    result = {'files': 0, 'bytes': 0, 'errors': 0, 'failed': 0}
+    ref = db.reference(f'{collection}/{paper_id}')
+    paper = ref.get()
+    if not isinstance(paper, dict):
+        return result
+
+    pending = inline_files(paper)
+    if not pending:
+        return result
+
+    folder = _storage_folder(collection, paper_id)
+    uploaded = []  # (history key, source digest, fields)
+    for key, holder in pending:
+        try:
+            data = base64.b64decode(holder['file_data'])
+        except Exception as e:
+            logger.warning(f"[inline_file_migration] {collection}/{paper_id} history={key}: undecodable file_data: {e}")
+            result['failed'] += 1
+            result['failure'] = f"{'current file' if key is None else f'file_history/{key}'}: undecodable file_data: {e}"
+            continue
+
+        file_name = secure_filename(holder.get('file_name') or 'paper.pdf') or 'paper.pdf'
+        if key is None:
+            storage_path = f'{folder}/{file_name}'
+        else:
+            version = holder.get('version') or (int(key) + 1 if key.isdigit() else key)
+            storage_path = f'{folder}/history/v{version}_{file_name}'
+        content_type = holder.get('file_type') or mimetypes.guess_type(file_name)[0] or 'application/pdf'
+
+        result['files'] += 1
+        result['bytes'] += len(data)
+        if dry_run:
+            continue
+        try:
+            blob = _upload(bucket, storage_path, data, content_type, throttle)
+        except Exception as e:
+            logger.error(f"[inline_file_migration] Upload of {storage_path} failed: {e}")
+            result['files'] -= 1
+            result['bytes'] -= len(data)
+            result['errors'] += 1
+            continue
+        uploaded.append((key, _text_digest(holder['file_data']), {
+            'file_data': None,
+            'file_storage_path': storage_path,
+            'file_url': blob.public_url,
+            'file_size': len(data),
+            'file_md5': _md5_base64(data),
+            'file_migrated_at': datetime.now().isoformat(),
+        }))
+        del data
+
+    if dry_run or not uploaded:
+        return result
+
+    applied = set()
+
+    def _rewrite(current):
+        applied.clear()
+        if not isinstance(current, dict):
+            return current
+        for key, digest, fields in uploaded:
+            holder = current if key is None else _history_entry(current, key)
+            # Only while the payload is still the one that was uploaded
+            if holder is None or not holder.get('file_data') or _text_digest(holder['file_data']) != digest:
+                continue
+            holder.update(fields)
+            holder.pop('file_data', None)
+            applied.add(key)
+        return current
+
+    try:
+        ref.transaction(_rewrite)
+    except Exception as e:
+        logger.error(f"[inline_file_migration] Rewriting {collection}/{paper_id} failed: {e}")
+        result['errors'] += len(uploaded)
+        return result
+
+    for key, _, fields in uploaded:
+        if key not in applied:
+            # The record changed underneath us; retried (and re-uploaded) on the next run
+            logger.warning(
+                f"[inline_file_migration] {collection}/{paper_id} history={key} changed during migration; "
+                f"left inline ({fields['file_storage_path']} not referenced)"
+            )
+            result['files'] -= 1
+            result['bytes'] -= fields['file_size']
+            result['errors'] += 1
+    return result
+
+
+def _load_checkpoints() -> Dict[str, str]:
+    return dict(db.reference(f'{STATUS_PATH}/checkpoints').get() or {})
+
+
+def list_failed(collections: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+    """``{collection: {paper_id: failure}}`` recorded by earlier runs."""
+    failed = db.reference(FAILED_PATH).get() or {}
+    by_collection = {slug.replace(':', '/'): dict(papers or {}) for slug, papers in failed.items()}
+    if collections is not None:
+        by_collection = {collection: by_collection[collection] for collection in collections if collection in by_collection}
+    return by_collection
+
+
+def _record_outcome(collection: str, paper_id: str, result: Dict[str, Any]) -> None:
+    """Record a permanent failure, or clear an earlier one once the paper has no failed files."""
+    path = f'{FAILED_PATH}/{_collection_slug(collection)}/{paper_id}'
+    if result['failed']:
+        db.reference(path).set({'error': result.get('failure') or 'failed', 'failed_at': datetime.now().isoformat()})
+    elif not result['errors']:
+        db.reference(path).delete()
+
+
+def migrate_inline_files(
+    bucket,
+    collections: Optional[List[str]] = None,
+    dry_run: bool = False,
+    workers: int = 4,
+    bytes_per_second: float = 0,
+    limit: int = 0,
+    resume: bool = True,
+    retry_failed: bool = False,
+) -> Dict[str, Any]:
+    """
+    Migrate every paper with inline files in ``collections`` (default: all).
+
+    ``workers`` papers are processed concurrently, uploads are throttled to
+    ``bytes_per_second`` and at most ``limit`` papers with inline files are
+    migrated (0 = no limit).  With ``resume`` each collection restarts after
+    its checkpoint.  ``retry_failed`` only reprocesses the papers recorded
+    as failed (checkpoints are left alone).
+    """
+    collections = collections if collections is not None else list_collections()
+    throttle = Throttle(bytes_per_second)
+    checkpoints = _load_checkpoints() if resume else {}
+    failed = list_failed(collections) if retry_failed else {}
+    totals = {'papers_scanned': 0, 'papers_migrated': 0, 'files': 0, 'bytes': 0, 'errors': 0, 'failed': 0}
+    started = time.monotonic()
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        for collection in collections:
+            slug = _collection_slug(collection)
+            if retry_failed:
+                paper_ids = sorted(failed.get(collection) or {})
+            else:
+                paper_ids = sorted((db.reference(collection).get(shallow=True) or {}).keys())
+                after = checkpoints.get(slug)
+                if after:
+                    paper_ids = [paper_id for paper_id in paper_ids if paper_id > after]
+
+            # Batches of ``workers`` keep the checkpoint contiguous
+            for offset in range(0, len(paper_ids), max(1, workers)):
+                if limit and totals['papers_migrated'] >= limit:
+                    break
+                batch = paper_ids[offset:offset + max(1, workers)]
+                results = list(executor.map(
+                    lambda paper_id: migrate_paper(collection, paper_id, bucket, throttle, dry_run), batch
+                ))
+                batch_errors = 0
+                for paper_id, result in zip(batch, results):
+                    totals['papers_scanned'] += 1
+                    if result['files']:
+                        totals['papers_migrated'] += 1
+                    for field in ('files', 'bytes', 'errors', 'failed'):
+                        totals[field] += result[field]
+                    batch_errors += result['errors']
+                    if not dry_run and (result['failed'] or retry_failed):
+                        _record_outcome(collection, paper_id, result)
+                if retry_failed:
+                    continue
+                # Permanent failures are recorded above and passed over; a batch
+                # with retryable errors is retried from its start on the next run
+                if not dry_run and not batch_errors:
+                    checkpoints[slug] = batch[-1]
+                    db.reference(f'{STATUS_PATH}/checkpoints/{slug}').set(batch[-1])
+                elif batch_errors:
+                    logger.warning(f"[inline_file_migration] Errors in {collection}; checkpoint held before {batch[0]}")
+                    break
+            logger.info(f"[inline_file_migration] {collection}: done (scanned so far {totals['papers_scanned']})")
+
+    elapsed = time.monotonic() - started
+    totals.update({
+        'collections': len(collections),
+        'dry_run': dry_run,
+        'elapsed_seconds': round(elapsed, 1),
+        'mb_per_second': round(totals['bytes'] / 1048576 / elapsed, 2) if elapsed else 0,
+    })
+    if not dry_run:
+        db.reference(STATUS_PATH).update({
+            'last_run_at': datetime.now().isoformat(),
+            'last_run': {key: value for key, value in totals.items() if key != 'dry_run'},
+        })
+    return totals
+
+
+def verify_migrated_files(bucket, collections: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Check every file recorded with ``file_md5`` against the object in Storage.
+
+    Also counts payloads that are still inline.  Mismatches and missing
+    objects are listed by record path.
+    """
+    collections = collections if collections is not None else list_collections()
+    report = {'checked': 0, 'ok': 0, 'missing': [], 'mismatched': [], 'still_inline': 0}
+    for collection in collections:
+        for paper_id in sorted((db.reference(collection).get(shallow=True) or {}).keys()):
+            paper = db.reference(f'{collection}/{paper_id}').get()
+            if not isinstance(paper, dict):
+                continue
+            report['still_inline'] += len(inline_files(paper))
+            holders = [(None, paper)] + _history_items(paper.get('file_history'))
+            for key, holder in holders:
+                if not holder.get('file_md5') or not holder.get('file_storage_path'):
+                    continue
+                location = f'{collection}/{paper_id}' + ('' if key is None else f'/file_history/{key}')
+                report['checked'] += 1
+                blob = bucket.get_blob(holder['file_storage_path'])
+                if blob is None:
+                    report['missing'].append(location)
+                elif blob.md5_hash != holder['file_md5'] or (
+                        holder.get('file_size') is not None and blob.size != holder['file_size']):
+                    report['mismatched'].append(location)
+                else:
+                    report['ok'] += 1
+    return report
@@ -0,0 +1,306 @@
+"""
+Cursor pagination over RTDB collections
+
+Admin list pages read one page at a time with
+
+    order_by_child(child).end_at(cursor).limit_to_last(n)
+
+instead of downloading the whole collection, so page time and memory stay
+flat however many records accumulate.  Results are returned newest first.
+
+A cursor is the ``(value, key)`` position of a boundary row, encoded as an
+opaque URL-safe string.  ``direction='older'`` returns rows after the cursor
+(the next page), ``direction='newer'`` rows before it (the previous page).
+Rows sharing the cursor value are disambiguated by key, matching RTDB's own
+ordering; rows missing ``child`` sort last (RTDB orders null first).  An
+empty page's backward cursor is inclusive, so stepping back from it shows
+the boundary row again.
+
+Optional ``predicate`` filters (status, legacy rows, ...) are applied to each
+batch; the query limit grows until a page is filled or ``max_scan`` rows have
+been examined, so a selective filter cannot turn a page view into a full
+read; a page cut short by ``max_scan`` still carries a cursor to resume from.
+RTDB cannot seek by key among rows sharing a value, so a run of equal (or
+missing) values longer than ``max_scan`` is read past the cursor in full
+rather than ending the listing early.  When the ``.indexOn`` rule for
+``child`` is not deployed the database rejects the query and the collection
+is ordered locally instead.  Read errors propagate to the caller.
+"""
+
+import base64
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from firebase_admin import db, exceptions
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+DEFAULT_MAX_SCAN = 2000
+
+Row = Tuple[str, Dict[str, Any]]
+# (value, key, inclusive): whether the boundary row itself is on the page
+Cursor = Tuple[Any, str, bool]
+
+_unindexed_warned = set()
+_tie_warned = set()
+
+
+def encode_cursor(value: Any, key: str, inclusive: bool = False) -> str:
+    position = [value, key, 1] if inclusive else [value, key]
+    raw = json.dumps(position, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[Cursor]:
+    """Return ``(value, key, inclusive)`` or None for a missing or malformed cursor."""
+    if not cursor:
+        return None
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        position = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        if not isinstance(position, list) or len(position) not in (2, 3):
+            return None
+        value, key = position[0], position[1]
+        if not isinstance(key, str) or isinstance(value, (dict, list)):
+            return None
+        return value, key, len(position) == 3 and bool(position[2])
+    except (ValueError, TypeError):
+        return None
+
+
+def parse_page_size(value: Any, default: int = DEFAULT_PAGE_SIZE) -> int:
+    try:
+        size = int(value)
+    except (TypeError, ValueError):
+        return default
+    return max(1, min(size, MAX_PAGE_SIZE))
+
+
+def _rank(value: Any) -> Tuple[int, Any]:
+    """RTDB ordering of child values: null < false < true < numbers < strings."""
+    if value is None:
+        return (0, 0)
+    if value is False:
+        return (1, 0)
+    if value is True:
+        return (2, 0)
+    if isinstance(value, (int, float)):
+        return (3, value)
+    if isinstance(value, str):
+        return (4, value)
+    return (5, 0)
+
+
+def _position(row: Dict[str, Any], child: str) -> Any:
+    value = row.get(child) if isinstance(row, dict) else None
+    return value if not isinstance(value, (dict, list)) else None
+
+
+def _sort_key(row: Row, child: str) -> Tuple[Tuple[int, Any], str]:
+    return (_rank(_position(row[1], child)), row[0])
+
+
+def _query(path: str, child: str, limit: int, cursor: Optional[Cursor], direction: str) -> List[Row]:
+    """Run one ordered query; returns rows in ascending RTDB order."""
+    query = db.reference(path).order_by_child(child)
+    if direction == 'older':
+        if cursor is not None:
+            # end_at(False) keeps only null-valued rows (null sorts before false)
+            query = query.end_at(cursor[0] if cursor[0] is not None else False)
+        query = query.limit_to_last(limit)
+    else:
+        if cursor is not None and cursor[0] is not None:
+            query = query.start_at(cursor[0])
+        query = query.limit_to_first(limit)
+    rows = query.get() or {}
+    return sorted(
+        ((key, row) for key, row in rows.items() if isinstance(row, dict)),
+        key=lambda item: _sort_key(item, child),
+    )
+
+
+def _beyond(position: Tuple[Tuple[int, Any], str], bound: Tuple[Tuple[int, Any], str], inclusive: bool, direction: str) -> bool:
+    """Whether a row at ``position`` belongs on a page read from ``bound`` in ``direction``."""
+    if position == bound:
+        return inclusive
+    return position < bound if direction == 'older' else position > bound
+
+
+def _local_query(path: str, child: str, limit: int, cursor: Optional[Cursor], direction: str) -> List[Row]:
+    rows = db.reference(path).get() or {}
+    if isinstance(rows, list):
+        rows = {str(index): row for index, row in enumerate(rows)}
+    ordered = sorted(
+        ((key, row) for key, row in rows.items() if isinstance(row, dict)),
+        key=lambda item: _sort_key(item, child),
+    )
+    if cursor is not None:
+        bound = (_rank(cursor[0]), cursor[1])
+        ordered = [row for row in ordered if _beyond(_sort_key(row, child), bound, cursor[2], direction)]
+    return ordered[-limit:] if direction == 'older' else ordered[:limit]
+
+
+def _collect(
+    path: str,
+    child: str,
+    want: int,
+    cursor: Optional[Cursor],
+    direction: str,
+    predicate: Optional[Callable[[str, Dict[str, Any]], bool]],
+    max_scan: int,
+) -> Tuple[List[Row], Optional[Row]]:
+    """
+    Return up to ``want`` matching rows beyond ``cursor``, nearest to the cursor first.
+
+    The second value is the last row examined when ``max_scan`` was reached
+    before the page filled (the caller resumes from there), otherwise None.
+    The query asks for ``limit`` rows plus those it returned at or behind
+    the cursor last time (the cursor row, and rows tied with it), so a short
+    read always means the collection is exhausted.  A window made up only of
+    such rows is widened past ``max_scan``, since no resume point beyond the
+    cursor exists yet.
+    """
+    bound = (_rank(cursor[0]), cursor[1]) if cursor is not None else None
+    limit = want
+    behind = 1 if cursor is not None else 0
+    while True:
+        query_limit = limit + behind
+        try:
+            rows = _query(path, child, query_limit, cursor, direction)
+        except exceptions.InvalidArgumentError as exc:
+            warn_key = (path.split('/')[0], child)
+            if warn_key not in _unindexed_warned:
+                _unindexed_warned.add(warn_key)
+                logger.warning(f"[pagination] Query on {path} by {child} rejected ({exc}); ordering locally")
+            rows = _local_query(path, child, query_limit, cursor, direction)
+        exhausted = len(rows) < query_limit
+
+        if direction == 'older':
+            rows.reverse()
+        if bound is None:
+            scanned = rows
+        else:
+            scanned = [row for row in rows if _beyond(_sort_key(row, child), bound, cursor[2], direction)]
+        behind = len(rows) - len(scanned)
+        matches = [row for row in scanned if predicate is None or predicate(*row)]
+        if len(matches) >= want or exhausted:
+            return matches[:want], None
+        if limit < max_scan:
+            limit = min(limit * 2, max_scan)
+        elif scanned:
+            return matches, scanned[-1]
+        else:
+            # Every row returned shares the cursor's value and was already
+            # seen; only a wider read reaches the rest of the tie group
+            warn_key = (path.split('/')[0], child)
+            if warn_key not in _tie_warned:
+                _tie_warned.add(warn_key)
+                logger.warning(f"[pagination] More than {max_scan} rows of {path} share one {child} value; reading past the scan limit")
+
+
+def fetch_merged_page(
+    paths: Sequence[str],
+    child: str,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    direction: str = 'older',
+    predicate: Optional[Callable[[str, Dict[str, Any]], bool]] = None,
+    max_scan: int = DEFAULT_MAX_SCAN,
+    max_workers: int = 8,
+) -> Dict[str, Any]:
+    """
+    Return one newest-first page of the collections in ``paths`` merged by ``child``.
+
+    Each collection is queried (in parallel) for at most ``page_size + 1``
+    rows beyond the cursor, so the cost is bounded by the number of
+    collections rather than their size.  The result holds ``items`` (a list
+    of ``(path, key, row)``), ``next_cursor`` / ``prev_cursor`` (None at
+    either end) and ``has_next`` / ``has_prev``.
+    """
+    direction = 'newer' if direction == 'newer' else 'older'
+    position = decode_cursor(cursor)
+    want = page_size + 1
+    scan = max(max_scan, want)
+    nearest_first = direction == 'older'
+
+    def _item_key(item):
+        return _sort_key((item[1], item[2]), child)
+
+    def _fetch(path):
+        rows, resume = _collect(path, child, want, position, direction, predicate, scan)
+        return [(path, key, row) for key, row in rows], (path, resume[0], resume[1]) if resume else None
+
+    paths = list(paths)
+    if len(paths) > 1:
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(paths)))) as executor:
+            results = list(executor.map(_fetch, paths))
+    else:
+        results = [_fetch(path) for path in paths]
+
+    merged = sorted((item for rows, _ in results for item in rows), key=_item_key, reverse=nearest_first)
+
+    # A collection that hit max_scan has unexamined rows past its resume point;
+    # stop the page there so the next page picks them up.
+    resumes = [resume for _, resume in results if resume]
+    resume_at = None
+    if resumes:
+        resume_at = (max if nearest_first else min)(resumes, key=_item_key)
+        limit_key = _item_key(resume_at)
+        merged = [
+            item for item in merged
+            if (_item_key(item) >= limit_key if nearest_first else _item_key(item) <= limit_key)
+        ]
+
+    if len(merged) > page_size:
+        items = merged[:page_size]
+        far = items[-1]
+    else:
+        items = merged
+        far = resume_at
+
+    def _encode(item):
+        return encode_cursor(_position(item[2], child), item[1])
+
+    # Cursor in the direction of travel, and back towards where we came from
+    onward = _encode(far) if far is not None else None
+    if position is None:
+        backward = None
+    elif items:
+        backward = _encode(items[0])
+    else:
+        # Nothing past the cursor: step back to a page that includes its row
+        backward = encode_cursor(position[0], position[1], inclusive=True)
+
+    if nearest_first:
+        next_cursor, prev_cursor = onward, backward
+    else:
+        items = list(reversed(items))
+        next_cursor, prev_cursor = backward, onward
+
+    return {
+        'items': items,
+        'page_size': page_size,
+        'has_next': next_cursor is not None,
+        'has_prev': prev_cursor is not None,
+        'next_cursor': next_cursor,
+        'prev_cursor': prev_cursor,
+    }
+
+
+def fetch_page(
+    path: str,
+    child: str,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    direction: str = 'older',
+    predicate: Optional[Callable[[str, Dict[str, Any]], bool]] = None,
+    max_scan: int = DEFAULT_MAX_SCAN,
+) -> Dict[str, Any]:
+    """Single-collection :func:`fetch_merged_page`; ``items`` are ``(key, row)`` pairs."""
+    page = fetch_merged_page([path], child, page_size, cursor, direction, predicate, max_scan)
+    page['items'] = [(key, row) for _, key, row in page['items']]
+    return page
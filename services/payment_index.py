@@ -0,0 +1,159 @@
+"""
+Payment reference index
+
+Maps a Yoco transaction reference to the registration it pays for:
+
+    payments_by_reference/{reference} -> {
+        registration_id, user_id, conference_id, payment_id, status, created_at, updated_at
+    }
+
+Entries are written when a payment session is created, so the webhook and
+the return callback can reconcile a payment with one small read instead of
+scanning every registration.  References created before the index existed
+are filled in by :func:`backfill_payment_index` (see backfill_payment_index.py).
+"""
+
+import logging
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from firebase_admin import db
+
+logger = logging.getLogger(__name__)
+
+INDEX_ROOT = 'payments_by_reference'
+STATUS_PATH = 'index_status/payments_by_reference'
+
+_index_ready = False
+
+# Characters RTDB does not allow in keys
+_FORBIDDEN_KEY_CHARS = '.#$[]/'
+
+
+def reference_key(reference: Any) -> str:
+    """Return ``reference`` as a valid RTDB key ('' when unusable)."""
+    text = str(reference or '').strip()
+    for char in _FORBIDDEN_KEY_CHARS:
+        text = text.replace(char, '_')
+    return text
+
+
+def index_path(reference: Any) -> str:
+    return f'{INDEX_ROOT}/{reference_key(reference)}'
+
+
+def payment_index_entry(
+    registration_id: Optional[str],
+    user_id: Optional[str],
+    conference_id: Optional[str] = None,
+    payment_id: Optional[str] = None,
+    status: str = 'pending',
+) -> Dict[str, Any]:
+    now_iso = datetime.now().isoformat()
+    return {
+        'registration_id': registration_id,
+        'user_id': user_id,
+        'conference_id': conference_id,
+        'payment_id': payment_id,
+        'status': status,
+        'created_at': now_iso,
+        'updated_at': now_iso,
+    }
+
+
+def index_updates(reference: Any, entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Multi-path update entries (relative to the root) writing ``entry`` for ``reference``."""
+    if not reference_key(reference):
+        return {}
+    return {index_path(reference): entry}
+
+
+def record_payment_reference(reference: Any, entry: Dict[str, Any]) -> None:
+    """Write (or overwrite) the index entry for ``reference``."""
+    updates = index_updates(reference, entry)
+    if updates:
+        db.reference('/').update(updates)
+
+
+def update_payment_reference(reference: Any, changes: Dict[str, Any]) -> None:
+    """Merge ``changes`` into an existing index entry."""
+    if not reference_key(reference):
+        return
+    changes = dict(changes)
+    changes.setdefault('updated_at', datetime.now().isoformat())
+    db.reference(index_path(reference)).update(changes)
+
+
+def get_payment_by_reference(reference: Any) -> Optional[Dict[str, Any]]:
+    """Return the index entry for ``reference`` or None."""
+    if not reference_key(reference):
+        return None
+    return db.reference(index_path(reference)).get()
+
+
+def build_payment_index(registrations: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Build index entries from a registrations snapshot."""
+    tree: Dict[str, Dict[str, Any]] = {}
+    for registration_id, registration in (registrations or {}).items():
+        if not isinstance(registration, dict):
+            continue
+        key = reference_key(registration.get('transaction_reference'))
+        if not key:
+            continue
+        entry = {
+            'registration_id': registration_id,
+            'user_id': registration.get('user_id'),
+            'conference_id': registration.get('conference_id'),
+            'payment_id': registration.get('payment_id'),
+            'status': registration.get('payment_status') or 'pending',
+            'created_at': registration.get('payment_date') or registration.get('updated_at') or '',
+            'updated_at': registration.get('updated_at') or '',
+        }
+        previous = tree.get(key)
+        if previous is None or (entry['updated_at'] or '') > (previous['updated_at'] or ''):
+            tree[key] = entry
+    return tree
+
+
+def backfill_payment_index(dry_run: bool = False) -> Dict[str, Any]:
+    """
+    Add index entries for every registration carrying a transaction_reference.
+
+    Existing entries are left untouched so that sessions created since the
+    index went live (which may not have a registration yet) are preserved.
+    """
+    global _index_ready
+    registrations = db.reference('registrations').get() or {}
+    expected = build_payment_index(registrations)
+    existing = db.reference(INDEX_ROOT).get(shallow=True) or {}
+    missing = {key: entry for key, entry in expected.items() if key not in existing}
+
+    if not dry_run:
+        if missing:
+            db.reference(INDEX_ROOT).update(missing)
+        db.reference(STATUS_PATH).set({
+            'backfilled_at': datetime.now().isoformat(),
+            'entries_added': len(missing),
+        })
+        _index_ready = True
+
+    logger.info(f"[payment_index] Backfilled {len(missing)} references (dry_run={dry_run})")
+    return {
+        'registrations_scanned': len(registrations),
+        'references_found': len(expected),
+        'already_indexed': len(expected) - len(missing),
+        'entries_added': len(missing),
+        'dry_run': dry_run,
+    }
+
+
+def is_payment_index_ready() -> bool:
+    """True once the backfill has run (memoized per worker)."""
+    global _index_ready
+    if _index_ready:
+        return True
+    try:
+        _index_ready = bool(db.reference(STATUS_PATH).get())
+    except Exception as exc:
+        logger.warning(f"[payment_index] Could not read index status: {exc}")
+    return _index_ready
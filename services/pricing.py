@@ -0,0 +1,250 @@
+"""
+Compiled registration pricing tables
+
+A conference's ``registration_fees`` node is turned into a :class:`PricingTable`
+once: deadlines are parsed to dates, period availability is resolved and every
+price is laid out in a lookup keyed by ``(period, registration type, workshop,
+banquet)``.  Registration pages, payment creation and the acceptance-letter
+flow then price against the table instead of re-reading the node and
+re-parsing deadline strings on every call.
+
+Tables are immutable and shared between requests (app.py caches one per
+conference in a :class:`~services.versioned_cache.VersionedCache` that
+``admin_registration_fees`` bumps).  Callers that need the raw structure, e.g.
+to hand it to a template, get a private copy from :meth:`PricingTable.fees_dict`.
+"""
+
+import copy
+import logging
+from datetime import date, datetime
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+PERIODS = ('early_bird', 'early', 'regular', 'late')
+# Periods with a deadline, in the order they are checked
+DEADLINE_PERIODS = ('early_bird', 'regular', 'late')
+REGISTRATION_TYPES = ('student_author', 'regular_author', 'physical_delegate', 'listener')
+ADDITIONAL_ITEMS = ('extra_paper', 'workshop', 'banquet')
+PREFERRED_TYPES = ('regular_author', 'student_author', 'physical_delegate', 'listener')
+
+
+def _safe_float(value: Any, default: float = 0.0) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _parse_deadline(value: Any) -> Optional[date]:
+    text = str(value or '').strip()
+    if not text:
+        return None
+    try:
+        return datetime.strptime(text, '%Y-%m-%d').date()
+    except ValueError:
+        return None
+
+
+def default_registration_fees(payment_details: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """The fee structure used when neither the conference nor the root node has one."""
+    zero_fees = {registration_type: 0 for registration_type in REGISTRATION_TYPES}
+    return {
+        'currency': {
+            'code': 'ZAR',
+            'symbol': 'R'
+        },
+        'early_bird': {
+            'enabled': False,
+            'deadline': '',
+            'seats': {
+                'total': 100,
+                'remaining': 100,
+                'show_remaining': True
+            },
+            'fees': dict(zero_fees),
+            'benefits': []
+        },
+        'regular': {
+            'deadline': '',
+            'fees': dict(zero_fees),
+            'benefits': []
+        },
+        'late': {
+            'deadline': '',
+            'fees': dict(zero_fees),
+            'benefits': []
+        },
+        'additional_items': {
+            'extra_paper': {
+                'enabled': False,
+                'fee': 0,
+                'description': 'Submit an additional paper',
+                'virtual_eligible': True
+            },
+            'workshop': {
+                'enabled': False,
+                'fee': 0,
+                'description': 'Attend the conference workshop',
+                'virtual_eligible': True
+            },
+            'banquet': {
+                'enabled': False,
+                'fee': 0,
+                'description': 'Join the conference banquet',
+                'virtual_eligible': False
+            }
+        },
+        'payment_details': payment_details or {}
+    }
+
+
+class PricingTable:
+    """Immutable, pre-parsed view of one ``registration_fees`` configuration."""
+
+    __slots__ = (
+        '_fees', 'currency', 'deadlines', 'early_bird_enabled', 'early_bird_seats_remaining',
+        '_period_fees', '_addon_fees', '_prices', '_frozen',
+    )
+
+    def __init__(self, fees: Optional[Dict[str, Any]]):
+        fees = copy.deepcopy(fees) if isinstance(fees, dict) else {}
+        set_ = object.__setattr__
+        set_(self, '_frozen', False)
+        set_(self, '_fees', fees)
+        set_(self, 'currency', dict(fees.get('currency') or {}))
+
+        early_bird = fees.get('early_bird') if isinstance(fees.get('early_bird'), dict) else {}
+        set_(self, 'early_bird_enabled', bool(early_bird.get('enabled')))
+        set_(self, 'early_bird_seats_remaining',
+             _safe_float((early_bird.get('seats') or {}).get('remaining'), 0.0))
+        set_(self, 'deadlines', {
+            period: _parse_deadline((fees.get(period) or {}).get('deadline'))
+            if isinstance(fees.get(period), dict) else None
+            for period in DEADLINE_PERIODS
+        })
+
+        # Periods whose 'fees' is a dict (even an empty one) can be priced
+        period_fees = {}
+        for period in PERIODS:
+            period_data = fees.get(period)
+            if isinstance(period_data, dict) and isinstance(period_data.get('fees'), dict):
+                period_fees[period] = dict(period_data['fees'])
+        set_(self, '_period_fees', period_fees)
+
+        additional_items = fees.get('additional_items') or {}
+        addon_fees = {}
+        for item in ADDITIONAL_ITEMS:
+            item_data = additional_items.get(item) or {}
+            addon_fees[item] = _safe_float(item_data.get('fee'), 0.0) if item_data.get('enabled', False) else 0.0
+        set_(self, '_addon_fees', addon_fees)
+
+        prices = {}
+        for period, type_fees in period_fees.items():
+            for registration_type, amount in type_fees.items():
+                base = _safe_float(amount, 0.0)
+                for workshop in (False, True):
+                    for banquet in (False, True):
+                        extras = (addon_fees['workshop'] if workshop else 0.0) + (addon_fees['banquet'] if banquet else 0.0)
+                        prices[(period, registration_type, workshop, banquet)] = (base, round(extras, 2))
+        set_(self, '_prices', prices)
+        set_(self, '_frozen', True)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('PricingTable is immutable')
+
+    def __bool__(self) -> bool:
+        return bool(self._fees)
+
+    # Raw structure -----------------------------------------------------------
+
+    def fees_dict(self) -> Dict[str, Any]:
+        """A private deep copy of the fee configuration (for templates and legacy callers)."""
+        return copy.deepcopy(self._fees)
+
+    def period_fees(self, period: str) -> Dict[str, Any]:
+        """``{registration_type: fee}`` for ``period`` ({} when the period is not configured)."""
+        return dict(self._period_fees.get(period) or {})
+
+    def has_type(self, period: str, registration_type: str) -> bool:
+        return registration_type in self._period_fees.get(period, {})
+
+    # Prices ------------------------------------------------------------------
+
+    def base_price(self, period: str, registration_type: str) -> float:
+        return _safe_float((self._period_fees.get(period) or {}).get(registration_type), 0.0)
+
+    def addon_fee(self, item: str) -> float:
+        """Fee of an enabled additional item (0 when disabled or unknown)."""
+        return self._addon_fees.get(item, 0.0)
+
+    def addons_amount(self, workshop: bool = False, banquet: bool = False) -> float:
+        """Workshop/banquet add-ons (extra-paper pricing is handled separately)."""
+        return round((self._addon_fees['workshop'] if workshop else 0.0)
+                     + (self._addon_fees['banquet'] if banquet else 0.0), 2)
+
+    def price(self, period: str, registration_type: str, workshop: bool = False, banquet: bool = False):
+        """``(base_amount, add-ons amount)`` for one selection."""
+        key = (period, registration_type, bool(workshop), bool(banquet))
+        if key in self._prices:
+            return self._prices[key]
+        return self.base_price(period, registration_type), self.addons_amount(workshop, banquet)
+
+    # Periods -----------------------------------------------------------------
+
+    def current_period(self, today: Optional[date] = None) -> str:
+        """
+        The period open on ``today``: 'early_bird', 'regular', 'late' or 'closed'.
+
+        Without any valid deadline the first priced period is used, and once
+        every deadline has passed registration stays open at regular prices.
+        """
+        if not self._fees:
+            return 'closed'
+        today = today or datetime.now().date()
+
+        if self.early_bird_enabled:
+            deadline = self.deadlines['early_bird']
+            if deadline and today <= deadline and self.early_bird_seats_remaining > 0:
+                return 'early_bird'
+        for period in ('regular', 'late'):
+            deadline = self.deadlines[period]
+            if deadline and today <= deadline:
+                return period
+
+        has_valid_deadline = any(
+            self.deadlines[period] for period in DEADLINE_PERIODS
+            if period != 'early_bird' or self.early_bird_enabled
+        )
+        if not has_valid_deadline:
+            if self._period_fees.get('regular'):
+                return 'regular'
+            for period in PERIODS:
+                if self._period_fees.get(period):
+                    return period if period != 'early_bird' or self.early_bird_enabled else 'regular'
+
+        if self._period_fees.get('regular'):
+            return 'regular'
+        return 'closed'
+
+    def select_period(self, current_period: Optional[str]) -> str:
+        """``current_period`` if this table prices it, else the first priced fallback period."""
+        candidates = []
+        if current_period and current_period != 'closed':
+            candidates.append(current_period)
+        candidates.extend(['regular', 'early_bird', 'early', 'late'])
+        for period in candidates:
+            if period in self._period_fees:
+                return period
+        return 'regular'
+
+    def default_registration_type(self, period: str) -> str:
+        period_fees = self._period_fees.get(period) or {}
+        for registration_type in PREFERRED_TYPES:
+            if registration_type in period_fees:
+                return registration_type
+        return 'regular_author'
+
+
+def compile_pricing(fees: Optional[Dict[str, Any]]) -> PricingTable:
+    return PricingTable(fees)
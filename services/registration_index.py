@@ -0,0 +1,196 @@
+"""
+Registration lookup index
+
+Maintains ``registration_index/{user_id}/{conference_id} -> registration_id`` so
+that finding a user's registration for a conference is a single small read
+instead of a scan over every registration ever made.
+
+When a user has more than one registration for the same conference the index
+points at the latest one (by ``updated_at``/``created_at``/``submission_date``),
+matching what the old linear scan returned.
+
+The index is only trusted for negative lookups ("no registration") once a full
+rebuild has completed; :func:`rebuild_registration_index` records that in
+``index_status/registration_index``.  Until then callers fall back to a scan.
+"""
+
+import logging
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+from firebase_admin import db
+
+from services.rtdb_queries import query_by_child
+
+logger = logging.getLogger(__name__)
+
+INDEX_ROOT = 'registration_index'
+STATUS_PATH = 'index_status/registration_index'
+
+_index_ready = False
+
+# Characters RTDB does not allow in keys
+_FORBIDDEN_KEY_CHARS = set('.#$[]/')
+
+
+def _valid_key(value: Any) -> bool:
+    text = str(value or '').strip()
+    return bool(text) and not (_FORBIDDEN_KEY_CHARS & set(text))
+
+
+def index_path(user_id: str, conference_id: str) -> str:
+    return f'{INDEX_ROOT}/{user_id}/{conference_id}'
+
+
+def registration_sort_key(registration: Dict[str, Any]) -> str:
+    """Recency key used to choose between duplicate registrations."""
+    return (
+        registration.get('updated_at')
+        or registration.get('created_at')
+        or registration.get('submission_date')
+        or ''
+    )
+
+
+def index_updates(registration_id: str, user_id: str, conference_id: str) -> Dict[str, Any]:
+    """Multi-path update entries (relative to the root) pointing the index at ``registration_id``."""
+    if not (_valid_key(user_id) and _valid_key(conference_id) and registration_id):
+        return {}
+    return {index_path(user_id, conference_id): registration_id}
+
+
+def set_registration_index(registration_id: str, user_id: str, conference_id: str) -> None:
+    """Point the index entry for (user, conference) at ``registration_id``."""
+    updates = index_updates(registration_id, user_id, conference_id)
+    if updates:
+        db.reference('/').update(updates)
+
+
+def find_latest_registration(
+    registrations: Dict[str, Any], user_id: str, conference_id: str
+) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+    """Scan ``registrations`` for the latest match; the pre-index behaviour."""
+    matches = [
+        (registration_id, registration)
+        for registration_id, registration in (registrations or {}).items()
+        if registration
+        and registration.get('user_id') == user_id
+        and registration.get('conference_id') == conference_id
+    ]
+    if not matches:
+        return None, None
+    matches.sort(key=lambda item: registration_sort_key(item[1]), reverse=True)
+    return matches[0]
+
+
+def refresh_registration_index(user_id: str, conference_id: str, registrations: Dict[str, Any] = None) -> Optional[str]:
+    """
+    Recompute one index entry from the registrations node.
+
+    Used after a registration leaves a (user, conference) pair (reassignment,
+    unassignment, deletion), where another registration may still qualify.
+    """
+    if not (_valid_key(user_id) and _valid_key(conference_id)):
+        return None
+    if registrations is None:
+        registrations = query_by_child('registrations', 'user_id', user_id)
+    registration_id, _ = find_latest_registration(registrations, user_id, conference_id)
+    db.reference(index_path(user_id, conference_id)).set(registration_id)
+    return registration_id
+
+
+def build_registration_index(registrations: Dict[str, Any]) -> Dict[str, Dict[str, str]]:
+    """Build the full index tree from a registrations snapshot."""
+    latest: Dict[Tuple[str, str], Tuple[str, str]] = {}
+    for registration_id, registration in (registrations or {}).items():
+        if not isinstance(registration, dict):
+            continue
+        user_id = registration.get('user_id')
+        conference_id = registration.get('conference_id')
+        if not (_valid_key(user_id) and _valid_key(conference_id)):
+            continue
+        key = (user_id, conference_id)
+        recency = registration_sort_key(registration)
+        if key not in latest or recency > latest[key][1]:
+            latest[key] = (registration_id, recency)
+
+    tree: Dict[str, Dict[str, str]] = {}
+    for (user_id, conference_id), (registration_id, _) in latest.items():
+        tree.setdefault(user_id, {})[conference_id] = registration_id
+    return tree
+
+
+def rebuild_registration_index(dry_run: bool = False) -> Dict[str, Any]:
+    """Rebuild ``registration_index`` from scratch and mark it ready."""
+    global _index_ready
+    registrations = db.reference('registrations').get() or {}
+    tree = build_registration_index(registrations)
+    entry_count = sum(len(conferences) for conferences in tree.values())
+
+    if not dry_run:
+        db.reference(INDEX_ROOT).set(tree)
+        db.reference(STATUS_PATH).set({
+            'rebuilt_at': datetime.now().isoformat(),
+            'entries': entry_count,
+        })
+        _index_ready = True
+
+    logger.info(f"[registration_index] Rebuilt {entry_count} entries (dry_run={dry_run})")
+    return {
+        'registrations_scanned': len(registrations),
+        'users': len(tree),
+        'entries': entry_count,
+        'dry_run': dry_run,
+    }
+
+
+def check_registration_index() -> Dict[str, Any]:
+    """
+    Compare the stored index with one rebuilt from the registrations node.
+
+    Returns lists of ``missing`` (expected but absent), ``stale`` (pointing at
+    the wrong registration) and ``orphaned`` (no longer backed by any
+    registration) entries.
+    """
+    registrations = db.reference('registrations').get() or {}
+    expected = build_registration_index(registrations)
+    stored = db.reference(INDEX_ROOT).get() or {}
+
+    missing, stale, orphaned = [], [], []
+    for user_id, conferences in expected.items():
+        stored_user = stored.get(user_id) or {}
+        for conference_id, registration_id in conferences.items():
+            actual = stored_user.get(conference_id)
+            if actual is None:
+                missing.append({'user_id': user_id, 'conference_id': conference_id, 'expected': registration_id})
+            elif actual != registration_id:
+                stale.append({
+                    'user_id': user_id,
+                    'conference_id': conference_id,
+                    'expected': registration_id,
+                    'actual': actual,
+                })
+    for user_id, conferences in stored.items():
+        for conference_id, registration_id in (conferences or {}).items():
+            if conference_id not in (expected.get(user_id) or {}):
+                orphaned.append({'user_id': user_id, 'conference_id': conference_id, 'actual': registration_id})
+
+    return {
+        'consistent': not (missing or stale or orphaned),
+        'expected_entries': sum(len(c) for c in expected.values()),
+        'missing': missing,
+        'stale': stale,
+        'orphaned': orphaned,
+    }
+
+
+def is_registration_index_ready() -> bool:
+    """True once a full rebuild has populated the index (memoized per worker)."""
+    global _index_ready
+    if _index_ready:
+        return True
+    try:
+        _index_ready = bool(db.reference(STATUS_PATH).get())
+    except Exception as exc:
+        logger.warning(f"[registration_index] Could not read index status: {exc}")
+    return _index_ready
@@ -0,0 +1,312 @@
+"""
+Registration reassignment as one multi-location write
+
+Moving a registration to another conference touches ``registrations/``, both
+conferences' ``registrations`` copies, the linked ``paper_submissions``,
+``user_registrations``, ``user_paper_submissions`` and ``registration_index``.
+It used to do that with one ``get``/``set``/``update``/``delete`` per node,
+several per paper, so a user with a few papers cost dozens of round trips and
+a failure part way through left the move half done.
+
+The flow is now split in three steps:
+
+* :func:`load_reassignment_snapshot` reads everything the move depends on,
+  in parallel;
+* the ``plan_*`` helpers turn the snapshot into root-relative update entries
+  (``None`` deletes) without any I/O;
+* the caller merges the entries and applies them with a single
+  ``db.reference('/').update(...)``, which RTDB commits atomically.
+
+Bulk assignment of many registrations to one conference follows the same
+pattern: :func:`fetch_registrations` reads the selection concurrently and
+:func:`plan_bulk_assignment` builds one update plus a per-item result list.
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from firebase_admin import db
+
+from services.registration_index import find_latest_registration, index_path, index_updates
+from services.rtdb_queries import query_by_child
+from services.user_submission_index import plan_submission_index_moves
+
+logger = logging.getLogger(__name__)
+
+
+def load_reassignment_snapshot(
+    user_id: str, old_conference_id: str, new_conference_id: str, max_workers: int = 5
+) -> Dict[str, Any]:
+    """
+    Read the nodes a reassignment depends on concurrently.
+
+    Returns ``old_papers`` / ``new_papers`` (the user's rows in each
+    conference's ``paper_submissions``), ``user_registrations``,
+    ``submission_index`` (``user_paper_submissions/{user_id}``) and
+    ``registrations`` (the user's global registrations).
+    """
+    reads = {
+        'old_papers': lambda: query_by_child(
+            f'conferences/{old_conference_id}/paper_submissions', 'user_id', user_id
+        ),
+        'new_papers': lambda: query_by_child(
+            f'conferences/{new_conference_id}/paper_submissions', 'user_id', user_id
+        ),
+        'user_registrations': lambda: db.reference(f'user_registrations/{user_id}').get() or {},
+        'submission_index': lambda: db.reference(f'user_paper_submissions/{user_id}').get() or {},
+        'registrations': lambda: query_by_child('registrations', 'user_id', user_id),
+    }
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(reads)))) as executor:
+        futures = {name: executor.submit(read) for name, read in reads.items()}
+        return {name: future.result() for name, future in futures.items()}
+
+
+def linked_paper_ids(registration: Dict[str, Any]) -> set:
+    """Paper ids a registration points at directly (``paper_submission_id`` / ``paper_id``)."""
+    linked = set()
+    for key in ('paper_submission_id', 'paper_id'):
+        value = registration.get(key)
+        if value is not None and str(value).strip():
+            linked.add(str(value).strip())
+    return linked
+
+
+def plan_paper_moves(
+    user_id: str,
+    registration_id: str,
+    registration: Dict[str, Any],
+    old_conference_id: str,
+    new_conference_id: str,
+    new_conference_name: str,
+    old_papers: Dict[str, Any],
+    new_papers: Dict[str, Any],
+    admin_email: str,
+    now_iso: str,
+) -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]:
+    """
+    Plan moving the registration's papers from the old conference to the new one.
+
+    A paper moves when it belongs to ``user_id`` and either records this
+    ``registration_id`` or is the paper the registration links to.  Papers
+    whose id already exists in the target are left in place (and logged),
+    as before.  Returns ``(updates, moved)`` where ``moved`` maps paper id
+    to the new paper record.
+    """
+    updates: Dict[str, Any] = {}
+    moved: Dict[str, Dict[str, Any]] = {}
+    linked = linked_paper_ids(registration)
+
+    for paper_id, paper in (old_papers or {}).items():
+        if not isinstance(paper, dict) or paper.get('user_id') != user_id:
+            continue
+        if (paper.get('registration_id') or '').strip() != registration_id and paper_id not in linked:
+            continue
+        if (new_papers or {}).get(paper_id):
+            logger.warning(
+                f"[reassign] Target already has paper {paper_id}; not overwriting. Manual cleanup may be needed."
+            )
+            continue
+
+        new_paper = dict(paper)
+        new_paper.update({
+            'conference_id': new_conference_id,
+            'conference_name': new_conference_name,
+            'registration_id': registration_id,
+            'updated_at': now_iso,
+            'reassigned_from_conference_id': old_conference_id,
+            'reassigned_at': now_iso,
+            'reassigned_by': admin_email,
+        })
+        updates[f'conferences/{new_conference_id}/paper_submissions/{paper_id}'] = new_paper
+        updates[f'conferences/{old_conference_id}/paper_submissions/{paper_id}'] = None
+        moved[paper_id] = new_paper
+    return updates, moved
+
+
+def submission_index_payload(paper_id: str, paper: Dict[str, Any], now_iso: str) -> Dict[str, Any]:
+    """``user_paper_submissions`` fields for a moved paper."""
+    return {
+        'conference_id': paper.get('conference_id'),
+        'paper_id': paper_id,
+        'registration_id': paper.get('registration_id'),
+        'conference_name': paper.get('conference_name'),
+        'paper_title': paper.get('paper_title', 'Untitled'),
+        'status': paper.get('status') or 'pending',
+        'is_deleted': False,
+        'submitted_at': paper.get('submitted_at', now_iso),
+        'updated_at': now_iso,
+    }
+
+
+def plan_submission_index_updates(
+    user_id: str,
+    index_entries: Dict[str, Any],
+    old_conference_id: str,
+    new_conference_id: str,
+    moved: Dict[str, Dict[str, Any]],
+    now_iso: str,
+) -> Dict[str, Any]:
+    payloads = {paper_id: submission_index_payload(paper_id, paper, now_iso) for paper_id, paper in moved.items()}
+    return plan_submission_index_moves(user_id, index_entries, old_conference_id, new_conference_id, payloads)
+
+
+def plan_registration_move(
+    registration_id: str,
+    user_id: str,
+    registration: Dict[str, Any],
+    changes: Dict[str, Any],
+    old_conference_id: str,
+    new_conference_id: str,
+    user_registrations: Dict[str, Any],
+    user_registration_changes: Dict[str, Any],
+    registrations: Optional[Dict[str, Any]] = None,
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Plan the registration side of the move.
+
+    Covers the global record (field-level, so concurrent edits to other
+    fields survive), the old and new conference copies, matching
+    ``user_registrations`` entries and both ``registration_index`` entries.
+    Returns ``(updates, final_registration)``.
+    """
+    final_registration = {
+        key: value for key, value in {**registration, **changes}.items() if value is not None
+    }
+
+    updates: Dict[str, Any] = {
+        f'registrations/{registration_id}/{key}': value for key, value in changes.items()
+    }
+    updates[f'conferences/{old_conference_id}/registrations/{registration_id}'] = None
+    updates[f'conferences/{new_conference_id}/registrations/{registration_id}'] = final_registration
+
+    for entry_key, entry in (user_registrations or {}).items():
+        if isinstance(entry, dict) and entry.get('registration_id') == registration_id:
+            for key, value in user_registration_changes.items():
+                updates[f'user_registrations/{user_id}/{entry_key}/{key}'] = value
+
+    updates.update(index_updates(registration_id, user_id, new_conference_id))
+    # Another registration of this user may still belong to the old conference
+    remaining = dict(registrations or {})
+    remaining[registration_id] = final_registration
+    previous_id, _ = find_latest_registration(remaining, user_id, old_conference_id)
+    if user_id and old_conference_id:
+        updates[index_path(user_id, old_conference_id)] = previous_id
+
+    return updates, final_registration
+
+
+def project_conference_papers(
+    papers: Dict[str, Any], moved: Dict[str, Dict[str, Any]], removed: Iterable[str] = ()
+) -> Dict[str, Any]:
+    """A conference's paper rows as they will read after the update is applied."""
+    projected = {key: value for key, value in (papers or {}).items() if key not in set(removed)}
+    projected.update(moved)
+    return projected
+
+
+# ---------------------------------------------------------------------------
+# Bulk assignment
+# ---------------------------------------------------------------------------
+
+def fetch_registrations(registration_ids: Iterable[str], max_workers: int = 16) -> Dict[str, Any]:
+    """
+    Read ``registrations/{id}`` for every id concurrently.
+
+    Returns ``{id: record}``; a missing record maps to None and a failed read
+    to the exception, so one bad id does not abort the batch.
+    """
+    ids = list(dict.fromkeys(registration_ids))
+    if not ids:
+        return {}
+
+    def _read(registration_id):
+        try:
+            return db.reference(f'registrations/{registration_id}').get()
+        except Exception as exc:
+            return exc
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(ids)))) as executor:
+        return dict(zip(ids, executor.map(_read, ids)))
+
+
+def fetch_user_registrations(user_ids: Iterable[str], max_workers: int = 16) -> Dict[str, Dict[str, Any]]:
+    """The global registrations of each user, read concurrently (``{user_id: {id: record}}``)."""
+    ids = [user_id for user_id in dict.fromkeys(user_ids) if user_id]
+    if not ids:
+        return {}
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(ids)))) as executor:
+        rows = executor.map(lambda user_id: query_by_child('registrations', 'user_id', user_id), ids)
+        return dict(zip(ids, rows))
+
+
+def plan_bulk_assignment(
+    registrations: Dict[str, Any],
+    conference_id: str,
+    conference_name: str,
+    admin_email: str,
+    now_iso: str,
+    user_registrations: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> Tuple[Dict[str, Any], list]:
+    """
+    Plan assigning many registrations to ``conference_id`` in one update.
+
+    ``registrations`` is the output of :func:`fetch_registrations`;
+    ``user_registrations`` (from :func:`fetch_user_registrations`) is needed
+    to repoint the index of any conference a registration is taken from.
+    Returns ``(updates, results)`` with one result per requested id:
+    ``{'registration_id', 'status': assigned|not_found|error, ...}``.
+    """
+    changes = {
+        'conference_id': conference_id,
+        'conference_name': conference_name,
+        'assigned_at': now_iso,
+        'assigned_by': admin_email,
+    }
+    updates: Dict[str, Any] = {}
+    results = []
+    assigned: Dict[str, Dict[str, Any]] = {}
+    vacated = set()
+
+    for registration_id, registration in registrations.items():
+        if isinstance(registration, Exception):
+            results.append({'registration_id': registration_id, 'status': 'error', 'error': str(registration)})
+            continue
+        if not isinstance(registration, dict):
+            results.append({'registration_id': registration_id, 'status': 'not_found'})
+            continue
+
+        previous_conference_id = registration.get('conference_id')
+        final_registration = {**registration, **changes}
+        for key, value in changes.items():
+            updates[f'registrations/{registration_id}/{key}'] = value
+        updates[f'conferences/{conference_id}/registrations/{registration_id}'] = final_registration
+        assigned[registration_id] = final_registration
+
+        user_id = registration.get('user_id')
+        if previous_conference_id and previous_conference_id != conference_id:
+            updates[f'conferences/{previous_conference_id}/registrations/{registration_id}'] = None
+            if user_id:
+                vacated.add((user_id, previous_conference_id))
+        results.append({
+            'registration_id': registration_id,
+            'status': 'assigned',
+            'previous_conference_id': previous_conference_id,
+        })
+
+    # Index entries: the newest registration per user wins, as in the full rebuild
+    by_user: Dict[str, Dict[str, Any]] = {}
+    for registration_id, registration in assigned.items():
+        if registration.get('user_id'):
+            by_user.setdefault(registration['user_id'], {})[registration_id] = registration
+    for user_id, rows in by_user.items():
+        current = {**((user_registrations or {}).get(user_id) or {}), **rows}
+        latest_id, _ = find_latest_registration(current, user_id, conference_id)
+        updates.update(index_updates(latest_id, user_id, conference_id))
+
+    for user_id, previous_conference_id in vacated:
+        remaining = {**((user_registrations or {}).get(user_id) or {}), **by_user.get(user_id, {})}
+        previous_id, _ = find_latest_registration(remaining, user_id, previous_conference_id)
+        updates[index_path(user_id, previous_conference_id)] = previous_id
+
+    return updates, results
@@ -0,0 +1,254 @@
+"""
+Per-request backend call instrumentation
+
+Counts and times every call a request makes to the outside world:
+
+* Realtime Database reads and writes (``Reference.get/set/update/delete/push/
+  transaction`` and ``Query.get``, on the Admin SDK and on the in-memory
+  backend alike), keyed by a path pattern with ids replaced by ``*``;
+* Firebase Storage, Resend and Yoco, recognised by host at the HTTP layer
+  (``requests.Session.request``, which the Storage client, the Resend SDK and
+  yoco_service all go through).  Other HTTP calls are reported as ``http``;
+  RTDB's own HTTP calls are skipped since they are counted above.
+
+Cache hits from :mod:`services.rtdb_cache` never reach the backend, so they
+are (correctly) not counted.
+
+After the response is built the totals are added as a ``Server-Timing``
+header, logged as one JSON line, and any read path pattern hit more than
+``N_PLUS_ONE_THRESHOLD`` times is logged as a probable N+1 pattern.
+
+Calls made from worker threads (``ThreadPoolExecutor`` fan-outs) have no
+request context.  They are attributed to the request when it is the only one
+in flight in the process, which is always the case under the sync gunicorn
+workers used in production; otherwise they are dropped rather than guessed.
+"""
+
+import json
+import logging
+import re
+import threading
+import time
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+from firebase_admin import db
+from flask import g, request
+
+logger = logging.getLogger(__name__)
+
+RTDB_READ = 'rtdb-read'
+RTDB_WRITE = 'rtdb-write'
+
+# (host suffix, category) for calls seen at the HTTP layer; None = skip
+_HTTP_CATEGORIES = [
+    ('firebaseio.com', None),
+    ('firebasedatabase.app', None),
+    ('storage.googleapis.com', 'storage'),
+    ('identitytoolkit.googleapis.com', 'auth'),
+    ('api.resend.com', 'resend'),
+    ('yoco.com', 'yoco'),
+]
+
+_ID_SEGMENT = re.compile(r'[a-z_]+')
+
+_local = threading.local()
+_active_lock = threading.Lock()
+_active = set()
+_installed = False
+
+
+def path_pattern(path: Optional[str]) -> str:
+    """``conferences/-Nx1/paper_submissions/-Ny2`` -> ``conferences/*/paper_submissions/*``."""
+    parts = [part for part in str(path or '').split('/') if part]
+    return '/'.join(part if _ID_SEGMENT.fullmatch(part) else '*' for part in parts) or '/'
+
+
+class RequestMetrics:
+    """Counters for one request; safe to update from worker threads."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started = time.perf_counter()
+        self.calls: Dict[str, Dict[str, float]] = {}
+        self.read_patterns: Dict[str, int] = {}
+
+    def record(self, category: str, duration_ms: float, pattern: Optional[str] = None) -> None:
+        with self._lock:
+            entry = self.calls.setdefault(category, {'count': 0, 'ms': 0.0})
+            entry['count'] += 1
+            entry['ms'] += duration_ms
+            if pattern and category == RTDB_READ:
+                self.read_patterns[pattern] = self.read_patterns.get(pattern, 0) + 1
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.started) * 1000
+
+    def server_timing(self) -> str:
+        metrics = [
+            f'{category};dur={entry["ms"]:.1f};desc="{entry["count"]} calls"'
+            for category, entry in sorted(self.calls.items())
+        ]
+        metrics.append(f'total;dur={self.elapsed_ms():.1f}')
+        return ', '.join(metrics)
+
+    def repeated_reads(self, threshold: int) -> Dict[str, int]:
+        return {pattern: count for pattern, count in self.read_patterns.items() if count > threshold}
+
+
+def current_metrics() -> Optional[RequestMetrics]:
+    """The collector of the request this call belongs to, if it can be told."""
+    metrics = getattr(_local, 'metrics', None)
+    if metrics is not None:
+        return metrics
+    with _active_lock:
+        if len(_active) == 1:
+            return next(iter(_active))
+    return None
+
+
+def _timed(category_of, pattern_of=None):
+    """Wrap a callable so each outermost call is recorded on the current request."""
+
+    def decorate(original):
+        def wrapper(*args, **kwargs):
+            # Nested calls (e.g. push() -> set()) count once
+            if getattr(_local, 'depth', 0) or current_metrics() is None:
+                return original(*args, **kwargs)
+            category = category_of(*args, **kwargs)
+            if category is None:
+                return original(*args, **kwargs)
+            _local.depth = getattr(_local, 'depth', 0) + 1
+            started = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                _local.depth -= 1
+                metrics = current_metrics()
+                if metrics is not None:
+                    pattern = pattern_of(*args, **kwargs) if pattern_of else None
+                    metrics.record(category, (time.perf_counter() - started) * 1000, pattern)
+
+        wrapper.__wrapped__ = original
+        wrapper.__name__ = getattr(original, '__name__', 'wrapper')
+        return wrapper
+
+    return decorate
+
+
+def _target_path(target: Any, *args, **kwargs) -> str:
+    """Path of a Reference or Query (Admin SDK or in-memory)."""
+    path = getattr(target, 'path', None)
+    if path is None:
+        path = getattr(target, '_pathurl', None)
+    if path is None:
+        path = getattr(getattr(target, '_reference', None), 'path', None)
+    return path_pattern(path)
+
+
+def _query_pattern(target: Any, *args, **kwargs) -> str:
+    return f'{_target_path(target)} [query]'
+
+
+def _http_category(session, method, url, *args, **kwargs) -> Optional[str]:
+    host = (urlsplit(str(url)).hostname or '').lower()
+    for suffix, category in _HTTP_CATEGORIES:
+        if host == suffix or host.endswith('.' + suffix):
+            return category
+    if host == 'www.googleapis.com' and '/storage/' in str(url):
+        return 'storage'
+    return 'http'
+
+
+def _patch(owner, name, wrapper_factory) -> None:
+    original = getattr(owner, name, None)
+    if original is None or hasattr(original, '__wrapped__'):
+        return
+    setattr(owner, name, wrapper_factory(original))
+
+
+def install_instrumentation() -> None:
+    """Wrap the RTDB and HTTP client methods (idempotent)."""
+    global _installed
+    if _installed:
+        return
+    _installed = True
+
+    from services.data_backend import MemoryQuery, MemoryReference
+
+    read = _timed(lambda *a, **k: RTDB_READ, _target_path)
+    query = _timed(lambda *a, **k: RTDB_READ, _query_pattern)
+    write = _timed(lambda *a, **k: RTDB_WRITE)
+    for reference_class in (db.Reference, MemoryReference):
+        _patch(reference_class, 'get', read)
+        for name in ('set', 'update', 'delete', 'push', 'transaction'):
+            _patch(reference_class, name, write)
+    for query_class in (db.Query, MemoryQuery):
+        _patch(query_class, 'get', query)
+
+    try:
+        import requests
+    except ImportError:
+        logger.info("[request_metrics] requests not installed; HTTP calls are not instrumented")
+        return
+    _patch(requests.Session, 'request', _timed(_http_category))
+
+
+def _start() -> None:
+    metrics = RequestMetrics()
+    g._request_metrics = metrics
+    _local.metrics = metrics
+    with _active_lock:
+        _active.add(metrics)
+
+
+def _finish(response, threshold: int):
+    metrics = getattr(g, '_request_metrics', None)
+    if metrics is None:
+        return response
+    response.headers['Server-Timing'] = metrics.server_timing()
+
+    totals = {category: {'count': entry['count'], 'ms': round(entry['ms'], 1)}
+              for category, entry in metrics.calls.items()}
+    logger.info(json.dumps({
+        'event': 'request_metrics',
+        'method': request.method,
+        'path': request.path,
+        'endpoint': request.endpoint,
+        'status': response.status_code,
+        'duration_ms': round(metrics.elapsed_ms(), 1),
+        'calls': totals,
+    }, sort_keys=True))
+
+    repeated = metrics.repeated_reads(threshold)
+    if repeated:
+        logger.warning(json.dumps({
+            'event': 'n_plus_one',
+            'method': request.method,
+            'path': request.path,
+            'endpoint': request.endpoint,
+            'threshold': threshold,
+            'repeated_reads': dict(sorted(repeated.items(), key=lambda item: -item[1])),
+        }, sort_keys=True))
+    return response
+
+
+def _teardown(exc=None) -> None:
+    metrics = getattr(g, '_request_metrics', None)
+    _local.metrics = None
+    if metrics is not None:
+        with _active_lock:
+            _active.discard(metrics)
+
+
+def init_request_metrics(app, threshold: int = 5) -> None:
+    """
+    Instrument backend calls and report them for every request of ``app``.
+
+    Register before other ``before_request`` hooks so calls they make (the
+    user loader, for one) are included.
+    """
+    install_instrumentation()
+    app.before_request(_start)
+    app.after_request(lambda response: _finish(response, threshold))
+    app.teardown_request(_teardown)
@@ -0,0 +1,179 @@
+"""
+Request-scoped Realtime Database cache
+
+A single page render reads the same RTDB nodes many times (route helpers,
+context processors, template globals).  This module memoizes
+``db.reference(path).get()`` on ``flask.g`` so that each logical path crosses
+the network at most once per request.
+
+* A child path is served from an already-fetched ancestor, e.g. once
+  ``conferences`` is cached, ``conferences/<id>/basic_info`` is free.
+* Writes made through :func:`cached_set`, :func:`cached_update` and
+  :func:`cached_delete` invalidate the written path, its descendants and
+  every cached ancestor, so later reads in the same request see fresh data.
+* Only safe (GET/HEAD) requests are cached.  POST handlers frequently write
+  with ``db.reference`` directly and then re-read, so they always go to the
+  network.  Outside a request context every call is a plain passthrough.
+
+Values are deep-copied on the way out because callers routinely mutate what
+they read (``setdefault`` merges, ``dict.pop`` etc.).
+
+:func:`cached_get_many` reads a batch of independent paths concurrently on a
+bounded thread pool and stores the results in the same cache, so a page that
+needs N unrelated nodes waits for the slowest read rather than the sum.
+"""
+
+import copy
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Optional
+
+from firebase_admin import db
+from flask import g, has_request_context, request
+
+logger = logging.getLogger(__name__)
+
+CACHEABLE_METHODS = ('GET', 'HEAD')
+
+_MISSING = object()
+
+
+def normalize_path(path: Optional[str]) -> str:
+    """Return ``path`` without leading/trailing slashes ('' is the root)."""
+    return '/'.join(part for part in str(path or '').split('/') if part)
+
+
+def _request_cache() -> Optional[Dict[str, Any]]:
+    """Return the cache dict for the active request, or None when disabled."""
+    if not has_request_context():
+        return None
+    if request.method not in CACHEABLE_METHODS:
+        return None
+    cache = getattr(g, '_rtdb_cache', None)
+    if cache is None:
+        cache = {}
+        g._rtdb_cache = cache
+    return cache
+
+
+def _descend(value: Any, parts) -> Any:
+    """Walk ``parts`` down a fetched RTDB value; a missing key reads as None."""
+    for part in parts:
+        if value is None:
+            return None
+        if isinstance(value, dict):
+            value = value.get(part)
+        elif isinstance(value, list):
+            # RTDB returns arrays for dense integer keys
+            try:
+                value = value[int(part)]
+            except (ValueError, IndexError):
+                return None
+        else:
+            return None
+    return value
+
+
+def _lookup(cache: Dict[str, Any], key: str) -> Any:
+    """Find ``key`` in the cache, directly or via the nearest cached ancestor."""
+    if key in cache:
+        return cache[key]
+    parts = key.split('/') if key else []
+    for depth in range(len(parts) - 1, -1, -1):
+        ancestor = '/'.join(parts[:depth])
+        if ancestor in cache:
+            return _descend(cache[ancestor], parts[depth:])
+    return _MISSING
+
+
+def cached_get(path: str) -> Any:
+    """Read ``path`` through the request cache."""
+    key = normalize_path(path)
+    cache = _request_cache()
+    if cache is None:
+        return db.reference(key or '/').get()
+
+    value = _lookup(cache, key)
+    if value is _MISSING:
+        value = db.reference(key or '/').get()
+        cache[key] = value
+    return copy.deepcopy(value)
+
+
+def cached_get_many(paths: Iterable[str], max_workers: int = 8) -> Dict[str, Any]:
+    """
+    Read several paths through the request cache, fetching the misses concurrently.
+
+    Duplicate paths are read once and paths under an already-cached ancestor
+    are served locally.  Returns ``{normalized path: value}``.  Worker
+    threads only do the network reads; the cache itself is touched from the
+    calling thread, which owns the request context.
+    """
+    keys = list(dict.fromkeys(normalize_path(path) for path in paths))
+    cache = _request_cache()
+    results: Dict[str, Any] = {}
+    missing = []
+    for key in keys:
+        value = _lookup(cache, key) if cache is not None else _MISSING
+        if value is _MISSING:
+            missing.append(key)
+        else:
+            results[key] = value
+
+    if len(missing) == 1:
+        fetched = [db.reference(missing[0] or '/').get()]
+    elif missing:
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(missing)))) as executor:
+            fetched = list(executor.map(lambda key: db.reference(key or '/').get(), missing))
+    else:
+        fetched = []
+    for key, value in zip(missing, fetched):
+        results[key] = value
+        if cache is not None:
+            cache[key] = value
+
+    return {key: copy.deepcopy(value) for key, value in results.items()}
+
+
+def invalidate_path(path: str) -> None:
+    """Drop ``path``, its descendants and its ancestors from the request cache."""
+    if not has_request_context():
+        return
+    cache = getattr(g, '_rtdb_cache', None)
+    if not cache:
+        return
+
+    key = normalize_path(path)
+    prefix = f'{key}/' if key else ''
+    for cached_key in list(cache.keys()):
+        is_descendant = cached_key == key or cached_key.startswith(prefix)
+        is_ancestor = cached_key == '' or key.startswith(f'{cached_key}/')
+        if is_descendant or is_ancestor:
+            cache.pop(cached_key, None)
+
+
+def clear() -> None:
+    """Forget everything cached for the active request."""
+    if has_request_context() and hasattr(g, '_rtdb_cache'):
+        g._rtdb_cache = {}
+
+
+def cached_set(path: str, value: Any) -> None:
+    """``db.reference(path).set(value)`` plus cache invalidation."""
+    key = normalize_path(path)
+    db.reference(key or '/').set(value)
+    invalidate_path(key)
+
+
+def cached_update(path: str, value: Dict[str, Any]) -> None:
+    """``db.reference(path).update(value)`` plus cache invalidation."""
+    key = normalize_path(path)
+    db.reference(key or '/').update(value)
+    invalidate_path(key)
+
+
+def cached_delete(path: str) -> None:
+    """``db.reference(path).delete()`` plus cache invalidation."""
+    key = normalize_path(path)
+    db.reference(key or '/').delete()
+    invalidate_path(key)
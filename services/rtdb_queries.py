@@ -0,0 +1,68 @@
+"""
+Server-side filtered RTDB reads
+
+``order_by_child(child).equal_to(value)`` makes the database do the filtering,
+so a request only transfers the matching rows instead of a whole collection.
+The children queried here are declared as ``.indexOn`` in database.rules.json.
+
+If the rules have not been deployed yet the database rejects the query
+("Index not defined"); :func:`query_by_child` then falls back to reading the
+collection and filtering locally, so the app keeps working during rollout.
+"""
+
+import logging
+from typing import Any, Dict, Optional
+
+from firebase_admin import db, exceptions
+
+logger = logging.getLogger(__name__)
+
+_unindexed_warned = set()
+
+
+def _filter_locally(path: str, child: str, value: Any, limit: Optional[int]) -> Dict[str, Any]:
+    rows = db.reference(path).get() or {}
+    if isinstance(rows, list):
+        rows = {str(index): row for index, row in enumerate(rows) if row is not None}
+    matches = {}
+    for key, row in rows.items():
+        if isinstance(row, dict) and row.get(child) == value:
+            matches[key] = row
+            if limit and len(matches) >= limit:
+                break
+    return matches
+
+
+def query_by_child(path: str, child: str, value: Any, limit: Optional[int] = None) -> Dict[str, Any]:
+    """Return ``{key: row}`` for children of ``path`` whose ``child`` equals ``value``."""
+    if value is None or value == '':
+        return {}
+    try:
+        query = db.reference(path).order_by_child(child).equal_to(value)
+        if limit:
+            query = query.limit_to_first(limit)
+        return dict(query.get() or {})
+    except exceptions.InvalidArgumentError as exc:
+        warn_key = (path.split('/')[0], child)
+        if warn_key not in _unindexed_warned:
+            _unindexed_warned.add(warn_key)
+            logger.warning(f"[rtdb_queries] Query on {path} by {child} rejected ({exc}); filtering locally")
+        return _filter_locally(path, child, value, limit)
+
+
+def query_latest(path: str, child: str, limit: int) -> Dict[str, Any]:
+    """Return the ``limit`` children of ``path`` with the highest ``child`` values, newest first."""
+    try:
+        rows = db.reference(path).order_by_child(child).limit_to_last(limit).get() or {}
+    except exceptions.InvalidArgumentError as exc:
+        warn_key = (path.split('/')[0], child)
+        if warn_key not in _unindexed_warned:
+            _unindexed_warned.add(warn_key)
+            logger.warning(f"[rtdb_queries] Query on {path} by {child} rejected ({exc}); sorting locally")
+        rows = db.reference(path).get() or {}
+    ordered = sorted(
+        ((key, row) for key, row in rows.items() if isinstance(row, dict) and row.get(child)),
+        key=lambda item: str(item[1].get(child)),
+        reverse=True,
+    )
+    return dict(ordered[:limit])
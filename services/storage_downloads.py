@@ -0,0 +1,241 @@
+"""
+Serving Firebase Storage files without holding them in a worker
+
+Download routes used to ``download_as_bytes()`` the whole blob, wrap it in a
+``BytesIO`` and ``send_file`` it, tying up a gunicorn worker (and the file's
+size in memory) for the entire transfer.  Routes now keep their own
+authorization checks and hand the blob to :func:`send_blob`, which either
+
+* redirects to a short-lived V4 signed URL carrying the response
+  ``Content-Disposition``/``Content-Type``, so the client downloads straight
+  from Storage (``STORAGE_SIGNED_URLS_ENABLED``, the default), or
+* proxies the blob in fixed-size chunks read through ``blob.open('rb')`` when
+  signed URLs are disabled or the credentials cannot sign.
+
+Proxied responses (:func:`stream_blob`, and :func:`proxy_url` for files only
+reachable by URL) honour ``Range``/``If-Range`` with 206 responses, forward
+``ETag``/``Last-Modified`` and answer ``If-None-Match``/``If-Modified-Since``
+with 304, so PDF viewers can fetch the pages they render first and resumed
+downloads continue where they stopped.  Ranged reads seek in Storage; they
+never read and discard the bytes before the range.
+"""
+
+import logging
+import re
+from datetime import timedelta
+from typing import Dict, Iterator, Optional, Tuple
+from urllib.parse import quote, unquote, urlsplit
+
+from flask import Response, has_request_context, redirect, request
+from werkzeug.http import http_date, is_resource_modified
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+DEFAULT_EXPIRATION_MINUTES = 15
+
+# Request headers passed upstream, and response headers passed back, by proxy_url
+_CONDITIONAL_REQUEST_HEADERS = ('Range', 'If-Range', 'If-None-Match', 'If-Modified-Since')
+_FORWARDED_RESPONSE_HEADERS = ('Content-Type', 'Content-Length', 'Content-Range', 'Accept-Ranges', 'ETag', 'Last-Modified')
+
+_FIREBASE_URL = re.compile(r'^/v0/b/(?P<bucket>[^/]+)/o/(?P<path>[^/]+)$')
+
+
+def content_disposition(filename: str, as_attachment: bool = True) -> str:
+    """``attachment``/``inline`` header value with an ASCII fallback and RFC 5987 name."""
+    kind = 'attachment' if as_attachment else 'inline'
+    ascii_name = filename.encode('ascii', 'ignore').decode('ascii').replace('"', '') or 'download'
+    if ascii_name == filename:
+        return f'{kind}; filename="{filename}"'
+    return f"{kind}; filename=\"{ascii_name}\"; filename*=UTF-8''{quote(filename)}"
+
+
+def signed_url(
+    blob,
+    download_name: str,
+    mimetype: Optional[str] = None,
+    expiration_minutes: int = DEFAULT_EXPIRATION_MINUTES,
+    as_attachment: bool = True,
+) -> str:
+    """Short-lived V4 GET URL for ``blob`` that Storage serves under ``download_name``."""
+    options = {
+        'version': 'v4',
+        'expiration': timedelta(minutes=expiration_minutes),
+        'method': 'GET',
+        'response_disposition': content_disposition(download_name, as_attachment),
+    }
+    if mimetype:
+        options['response_type'] = mimetype
+    return blob.generate_signed_url(**options)
+
+
+def storage_location(url: str) -> Optional[Tuple[str, str]]:
+    """``(bucket, object path)`` of a Firebase/Cloud Storage download URL, else None."""
+    parts = urlsplit(url or '')
+    if parts.scheme != 'https':
+        return None
+    if parts.hostname == 'firebasestorage.googleapis.com':
+        match = _FIREBASE_URL.match(parts.path)
+        if match:
+            return match.group('bucket'), unquote(match.group('path'))
+    elif parts.hostname == 'storage.googleapis.com':
+        bucket, _, path = parts.path.lstrip('/').partition('/')
+        if bucket and path:
+            return bucket, unquote(path)
+    return None
+
+
+def iter_blob(blob, chunk_size: int = DEFAULT_CHUNK_SIZE, start: int = 0, end: Optional[int] = None) -> Iterator[bytes]:
+    """Yield bytes ``start``..``end`` (exclusive; None = to the end) of ``blob``, ``chunk_size`` at a time."""
+    with blob.open('rb', chunk_size=chunk_size) as reader:
+        if start:
+            reader.seek(start)
+        remaining = None if end is None else end - start
+        while remaining is None or remaining > 0:
+            chunk = reader.read(chunk_size if remaining is None else min(chunk_size, remaining))
+            if not chunk:
+                break
+            if remaining is not None:
+                remaining -= len(chunk)
+            yield chunk
+
+
+def _if_range_matches(etag: Optional[str], last_modified) -> bool:
+    """Whether an ``If-Range`` precondition (if any) still holds for the current object."""
+    if_range = request.if_range
+    if if_range.etag:
+        return bool(etag) and if_range.etag == etag
+    if if_range.date:
+        return last_modified is not None and int(last_modified.timestamp()) == int(if_range.date.timestamp())
+    return True
+
+
+def stream_blob(
+    blob,
+    download_name: str,
+    mimetype: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    as_attachment: bool = True,
+) -> Response:
+    """
+    Proxy ``blob`` through the worker in chunks instead of reading it whole.
+
+    ``blob`` must have its metadata loaded (``reload()``/``get_blob()``).
+    Within a request, ``Range``, ``If-Range`` and the conditional headers
+    are honoured.
+    """
+    size = blob.size
+    etag = blob.etag
+    last_modified = blob.updated
+    headers: Dict[str, str] = {
+        'Accept-Ranges': 'bytes',
+        'Content-Disposition': content_disposition(download_name, as_attachment),
+    }
+    if etag:
+        headers['ETag'] = f'"{etag}"'
+    if last_modified is not None:
+        headers['Last-Modified'] = http_date(last_modified)
+
+    if has_request_context():
+        if not is_resource_modified(request.environ, etag=etag, last_modified=last_modified):
+            return Response(status=304, headers=headers)
+
+        byte_range = request.range
+        if byte_range is not None and size is not None and len(byte_range.ranges) == 1 \
+                and _if_range_matches(etag, last_modified):
+            span = byte_range.range_for_length(size)
+            if span is None:
+                headers['Content-Range'] = f'bytes */{size}'
+                return Response(status=416, headers=headers)
+            start, end = span
+            headers['Content-Range'] = f'bytes {start}-{end - 1}/{size}'
+            headers['Content-Length'] = str(end - start)
+            return Response(
+                iter_blob(blob, chunk_size, start, end),
+                status=206, mimetype=mimetype, headers=headers, direct_passthrough=True,
+            )
+
+    if size is not None:
+        headers['Content-Length'] = str(size)
+    return Response(iter_blob(blob, chunk_size), mimetype=mimetype, headers=headers, direct_passthrough=True)
+
+
+def proxy_url(
+    url: str,
+    download_name: str,
+    mimetype: Optional[str] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    as_attachment: bool = True,
+    timeout: float = 30,
+    allow_redirects: bool = False,
+) -> Optional[Response]:
+    """
+    Relay a file fetched over HTTPS, passing range and conditional headers both ways.
+
+    Redirects are not followed unless ``allow_redirects`` (callers validate
+    ``url`` against SSRF).  Returns None when the upstream answers anything
+    but 200/206/304/416.
+    """
+    import requests
+
+    upstream_headers = {'User-Agent': 'Mozilla/5.0'}
+    if has_request_context():
+        for name in _CONDITIONAL_REQUEST_HEADERS:
+            if request.headers.get(name):
+                upstream_headers[name] = request.headers[name]
+
+    upstream = requests.get(url, headers=upstream_headers, stream=True, timeout=timeout, allow_redirects=allow_redirects)
+    if upstream.status_code not in (200, 206, 304, 416):
+        upstream.close()
+        return None
+
+    headers = {name: upstream.headers[name] for name in _FORWARDED_RESPONSE_HEADERS if upstream.headers.get(name)}
+    if mimetype:
+        headers['Content-Type'] = mimetype
+    headers['Content-Disposition'] = content_disposition(download_name, as_attachment)
+    if upstream.status_code in (304, 416):
+        upstream.close()
+        return Response(status=upstream.status_code, headers=headers)
+
+    def generate():
+        try:
+            for chunk in upstream.iter_content(chunk_size=chunk_size):
+                yield chunk
+        finally:
+            upstream.close()
+
+    return Response(generate(), status=upstream.status_code, headers=headers, direct_passthrough=True)
+
+
+def send_blob(
+    blob,
+    download_name: str,
+    mimetype: str,
+    use_signed_url: bool = True,
+    expiration_minutes: int = DEFAULT_EXPIRATION_MINUTES,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    as_attachment: bool = True,
+) -> Response:
+    """
+    Signed-URL redirect to ``blob`` or, failing that, a chunked proxy of it.
+
+    Raises ``google.api_core.exceptions.NotFound`` when proxying a missing
+    blob, so callers can keep their "could not download" handling.
+    """
+    if use_signed_url:
+        try:
+            response = redirect(signed_url(blob, download_name, mimetype, expiration_minutes, as_attachment))
+        except Exception as e:
+            # Credentials without a private key (e.g. bare metadata-server auth) cannot sign
+            logger.warning(f"[storage_downloads] Signing {blob.name} failed, proxying instead: {e}")
+        else:
+            response.headers['Cache-Control'] = 'no-cache, no-store, must-revalidate'
+            return response
+
+    # Fetch metadata first so a missing blob fails before the response starts
+    blob.reload()
+    response = stream_blob(blob, download_name, mimetype, chunk_size, as_attachment)
+    response.headers['X-Content-Type-Options'] = 'nosniff'
+    # Revalidate every time, but let the ETag answer it with a 304
+    response.headers['Cache-Control'] = 'private, no-cache'
+    return response
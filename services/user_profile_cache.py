@@ -0,0 +1,88 @@
+"""
+Per-worker cache of signed-in users' profiles
+
+Flask-Login's user loader runs on every authenticated request (pages, AJAX
+polls, downloads).  Building the user used to cost a Firebase Auth
+``get_user`` call plus a ``users/{uid}`` read each time.  This module keeps
+the assembled profile in a small LRU with a short TTL instead.
+
+Routes that change a profile (the profile page, email preferences, admin
+edits and ``toggle_admin``) call :meth:`UserProfileCache.invalidate`, which
+takes effect immediately in the worker that handled the edit.  Other workers
+pick the change up when their entry expires, so the TTL bounds how long a
+revoked admin flag can linger; keep it short.
+"""
+
+import copy
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Fields copied from users/{uid} onto the User object
+PROFILE_FIELDS = (
+    'institution', 'department', 'title', 'phone', 'country', 'city',
+    'bio', 'website', 'created_at', 'updated_at', 'email_preferences',
+)
+
+
+def build_profile(uid: str, email: Optional[str], display_name: Optional[str],
+                  user_data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """The cacheable profile for ``uid`` from its Auth record and ``users/{uid}`` node."""
+    user_data = user_data or {}
+    profile = {
+        'uid': uid,
+        'email': email,
+        'display_name': display_name,
+        'is_admin': bool(user_data.get('is_admin', False)),
+        'has_user_data': bool(user_data),
+    }
+    for field in PROFILE_FIELDS:
+        profile[field] = user_data.get(field)
+    if profile['email_preferences'] is None:
+        profile['email_preferences'] = {}
+    return profile
+
+
+class UserProfileCache:
+    """Thread-safe LRU of profiles with a per-entry TTL"""
+
+    def __init__(self, ttl_seconds: float = 60, max_entries: int = 1024):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: 'OrderedDict[str, tuple]' = OrderedDict()
+
+    def get(self, uid: str) -> Optional[Dict[str, Any]]:
+        if self.ttl_seconds <= 0 or not uid:
+            return None
+        with self._lock:
+            entry = self._entries.get(uid)
+            if entry is None:
+                return None
+            stored_at, profile = entry
+            if time.time() - stored_at >= self.ttl_seconds:
+                del self._entries[uid]
+                return None
+            self._entries.move_to_end(uid)
+            return copy.deepcopy(profile)
+
+    def put(self, uid: str, profile: Dict[str, Any]) -> None:
+        if self.ttl_seconds <= 0 or not uid:
+            return
+        with self._lock:
+            self._entries[uid] = (time.time(), copy.deepcopy(profile))
+            self._entries.move_to_end(uid)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, uid: str) -> None:
+        with self._lock:
+            self._entries.pop(uid, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
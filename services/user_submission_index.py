@@ -0,0 +1,213 @@
+"""
+User submission index
+
+``user_paper_submissions/{user_id}`` lists a user's conference papers.  Entries
+used to be stored under push keys, so every update had to download and scan
+the user's whole node to find the ``(conference_id, paper_id)`` entry.
+
+Entries are now keyed deterministically as ``{conference_id}__{paper_id}``.
+While existing data is being migrated, lookups fall back to scanning for
+push-keyed entries and migrate any they find (``dual read``); once
+:func:`migrate_all_user_submission_indexes` has run it records
+``index_status/user_paper_submissions`` and the fallback is skipped.
+"""
+
+import logging
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from firebase_admin import db
+
+logger = logging.getLogger(__name__)
+
+INDEX_ROOT = 'user_paper_submissions'
+STATUS_PATH = 'index_status/user_paper_submissions'
+KEY_SEPARATOR = '__'
+
+_migration_complete = False
+
+
+def submission_index_key(conference_id: str, paper_id: str) -> str:
+    return f'{conference_id}{KEY_SEPARATOR}{paper_id}'
+
+
+def submission_index_path(user_id: str, conference_id: str, paper_id: str) -> str:
+    return f'{INDEX_ROOT}/{user_id}/{submission_index_key(conference_id, paper_id)}'
+
+
+def _entry_recency(entry: Dict[str, Any]) -> str:
+    return entry.get('updated_at') or entry.get('submitted_at') or ''
+
+
+def is_migration_complete() -> bool:
+    """True once every user's node has been re-keyed (memoized per worker)."""
+    global _migration_complete
+    if _migration_complete:
+        return True
+    try:
+        _migration_complete = bool(db.reference(STATUS_PATH).get())
+    except Exception as exc:
+        logger.warning(f"[user_submission_index] Could not read migration status: {exc}")
+    return _migration_complete
+
+
+def plan_user_migration(user_id: str, entries: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build the multi-path update that re-keys one user's push-keyed entries.
+
+    Duplicate entries for the same paper are merged oldest-first so the most
+    recent values win; an existing deterministic entry is applied last.
+    Entries without both ``conference_id`` and ``paper_id`` are left alone.
+    """
+    grouped: Dict[str, list] = {}
+    for entry_key, entry in (entries or {}).items():
+        if not isinstance(entry, dict):
+            continue
+        conference_id = entry.get('conference_id')
+        paper_id = entry.get('paper_id')
+        if not conference_id or not paper_id:
+            continue
+        target_key = submission_index_key(conference_id, paper_id)
+        grouped.setdefault(target_key, []).append((entry_key, entry))
+
+    updates: Dict[str, Any] = {}
+    for target_key, items in grouped.items():
+        legacy = [(key, entry) for key, entry in items if key != target_key]
+        if not legacy:
+            continue
+        current = [entry for key, entry in items if key == target_key]
+        merged: Dict[str, Any] = {}
+        for _, entry in sorted(legacy, key=lambda item: _entry_recency(item[1])):
+            merged.update(entry)
+        for entry in current:
+            merged.update(entry)
+        updates[f'{INDEX_ROOT}/{user_id}/{target_key}'] = merged
+        for legacy_key, _ in legacy:
+            updates[f'{INDEX_ROOT}/{user_id}/{legacy_key}'] = None
+    return updates
+
+
+def migrate_user_submission_index(user_id: str, entries: Dict[str, Any] = None, dry_run: bool = False) -> int:
+    """Re-key one user's entries in a single atomic write; returns entries migrated."""
+    if entries is None:
+        entries = db.reference(f'{INDEX_ROOT}/{user_id}').get() or {}
+    updates = plan_user_migration(user_id, entries)
+    migrated = sum(1 for value in updates.values() if value is None)
+    if updates and not dry_run:
+        db.reference('/').update(updates)
+    return migrated
+
+
+def migrate_all_user_submission_indexes(dry_run: bool = False) -> Dict[str, Any]:
+    """Re-key every user's node, one user at a time, then mark the migration done."""
+    global _migration_complete
+    user_ids = list((db.reference(INDEX_ROOT).get(shallow=True) or {}).keys())
+    users_changed = 0
+    entries_migrated = 0
+    for user_id in user_ids:
+        migrated = migrate_user_submission_index(user_id, dry_run=dry_run)
+        if migrated:
+            users_changed += 1
+            entries_migrated += migrated
+
+    if not dry_run:
+        db.reference(STATUS_PATH).set({
+            'migrated_at': datetime.now().isoformat(),
+            'users': len(user_ids),
+            'entries_migrated': entries_migrated,
+        })
+        _migration_complete = True
+
+    logger.info(f"[user_submission_index] Migrated {entries_migrated} entries (dry_run={dry_run})")
+    return {
+        'users_scanned': len(user_ids),
+        'users_changed': users_changed,
+        'entries_migrated': entries_migrated,
+        'dry_run': dry_run,
+    }
+
+
+def get_submission_index_entry(user_id: str, conference_id: str, paper_id: str) -> Optional[Dict[str, Any]]:
+    """Read one entry, migrating the user's legacy entries on a miss."""
+    if not user_id or not conference_id or not paper_id:
+        return None
+    entry = db.reference(submission_index_path(user_id, conference_id, paper_id)).get()
+    if entry is not None or is_migration_complete():
+        return entry
+
+    entries = db.reference(f'{INDEX_ROOT}/{user_id}').get() or {}
+    if migrate_user_submission_index(user_id, entries):
+        entry = db.reference(submission_index_path(user_id, conference_id, paper_id)).get()
+    return entry
+
+
+def upsert_submission_index_entry(user_id: str, conference_id: str, paper_id: str, payload: Dict[str, Any]) -> str:
+    """Create or update the entry for (conference_id, paper_id); returns its key."""
+    key = submission_index_key(conference_id, paper_id)
+    if not is_migration_complete():
+        # Fold any push-keyed duplicates into the deterministic key first
+        get_submission_index_entry(user_id, conference_id, paper_id)
+    db.reference(f'{INDEX_ROOT}/{user_id}/{key}').update(payload)
+    return key
+
+
+def move_submission_index_entry(
+    user_id: str, old_conference_id: str, new_conference_id: str, paper_id: str, payload: Dict[str, Any]
+) -> str:
+    """Re-key an entry to a new conference in one write, merging ``payload``; returns the new key."""
+    existing = get_submission_index_entry(user_id, old_conference_id, paper_id) or {}
+    target = get_submission_index_entry(user_id, new_conference_id, paper_id) or {}
+    merged = dict(existing)
+    merged.update(target)
+    merged.update(payload)
+    updates = {submission_index_path(user_id, new_conference_id, paper_id): merged}
+    if old_conference_id != new_conference_id:
+        updates[submission_index_path(user_id, old_conference_id, paper_id)] = None
+    db.reference('/').update(updates)
+    return submission_index_key(new_conference_id, paper_id)
+
+
+def plan_submission_index_moves(
+    user_id: str,
+    entries: Dict[str, Any],
+    old_conference_id: str,
+    new_conference_id: str,
+    payloads: Dict[str, Dict[str, Any]],
+) -> Dict[str, Any]:
+    """
+    Multi-path update re-keying several papers' entries from a snapshot of the user's node.
+
+    ``payloads`` maps paper id to the fields to merge.  Push-keyed legacy
+    entries in ``entries`` are folded in first (see :func:`plan_user_migration`),
+    so the result is the same as calling :func:`move_submission_index_entry`
+    per paper, without its reads.
+    """
+    updates = plan_user_migration(user_id, entries) if not is_migration_complete() else {}
+    current = {
+        key: value for key, value in (entries or {}).items()
+        if f'{INDEX_ROOT}/{user_id}/{key}' not in updates
+    }
+    for path, value in updates.items():
+        if value is not None:
+            current[path.rsplit('/', 1)[-1]] = value
+
+    for paper_id, payload in payloads.items():
+        old_key = submission_index_key(old_conference_id, paper_id)
+        new_key = submission_index_key(new_conference_id, paper_id)
+        merged: Dict[str, Any] = {}
+        for key in (old_key, new_key):
+            if isinstance(current.get(key), dict):
+                merged.update(current[key])
+        merged.update(payload)
+        updates[f'{INDEX_ROOT}/{user_id}/{new_key}'] = merged
+        if old_key != new_key:
+            updates[f'{INDEX_ROOT}/{user_id}/{old_key}'] = None
+    return updates
+
+
+def update_submission_index_entry(user_id: str, conference_id: str, paper_id: str, changes: Dict[str, Any]) -> bool:
+    """Update the entry only if it exists (never creates a partial entry)."""
+    if get_submission_index_entry(user_id, conference_id, paper_id) is None:
+        return False
+    db.reference(submission_index_path(user_id, conference_id, paper_id)).update(changes)
+    return True
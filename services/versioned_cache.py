@@ -0,0 +1,122 @@
+"""
+Process-wide versioned cache
+
+Keeps a loaded value in memory for the lifetime of a gunicorn worker and
+refetches it when either the TTL expires or a shared version key changes.
+
+The version key lives in Realtime Database under ``cache_versions/<name>``.
+Admin routes that change the cached data call :meth:`VersionedCache.bump`,
+which writes a new version token; every worker notices the new token on its
+next version check (at most ``version_check_seconds`` later) and reloads.
+Checking the version is a single tiny read, so workers can poll it far more
+often than they could afford to download the underlying tree.
+"""
+
+import copy
+import logging
+import threading
+import time
+import uuid
+from typing import Any, Callable, Optional
+
+from firebase_admin import db
+
+logger = logging.getLogger(__name__)
+
+VERSION_ROOT = 'cache_versions'
+
+
+class VersionedCache:
+    """
+    In-memory cache for a single value with TTL and shared version invalidation
+    """
+
+    def __init__(
+        self,
+        name: str,
+        loader: Callable[[], Any],
+        ttl_seconds: float = 300,
+        version_check_seconds: float = 5,
+        copy_values: bool = True,
+    ):
+        """
+        Args:
+            name:                  Version key under ``cache_versions/``.
+            loader:                Zero-argument callable producing the value.
+            ttl_seconds:           Maximum age of a loaded value.
+            version_check_seconds: How often to poll the shared version key.
+                                   0 checks on every access.
+            copy_values:           Deep-copy the value on every get(); turn off
+                                   for immutable values.
+        """
+        self.name = name
+        self.loader = loader
+        self.ttl_seconds = ttl_seconds
+        self.version_check_seconds = version_check_seconds
+        self.copy_values = copy_values
+
+        self._lock = threading.RLock()
+        self._value: Any = None
+        self._loaded_at = 0.0
+        self._version: Optional[str] = None
+        self._version_checked_at = 0.0
+        self._has_value = False
+
+    @property
+    def version_path(self) -> str:
+        return f'{VERSION_ROOT}/{self.name}'
+
+    def _read_version(self) -> Optional[str]:
+        try:
+            version = db.reference(self.version_path).get()
+            return str(version) if version is not None else None
+        except Exception as exc:
+            logger.warning(f"[cache:{self.name}] Could not read version key: {exc}")
+            return self._version
+
+    def _is_fresh(self, now: float) -> bool:
+        if not self._has_value:
+            return False
+        if now - self._loaded_at >= self.ttl_seconds:
+            return False
+        if now - self._version_checked_at < self.version_check_seconds:
+            return True
+
+        current_version = self._read_version()
+        self._version_checked_at = now
+        if current_version != self._version:
+            logger.info(
+                f"[cache:{self.name}] Version changed "
+                f"({self._version} -> {current_version}); reloading"
+            )
+            return False
+        return True
+
+    def get(self) -> Any:
+        """Return the cached value (a deep copy unless copy_values is off), loading it when stale."""
+        with self._lock:
+            now = time.time()
+            if not self._is_fresh(now):
+                version = self._read_version()
+                value = self.loader()
+                self._value = value
+                self._version = version
+                self._loaded_at = now
+                self._version_checked_at = now
+                self._has_value = True
+            return copy.deepcopy(self._value) if self.copy_values else self._value
+
+    def invalidate_local(self) -> None:
+        """Drop this worker's copy without touching the shared version key."""
+        with self._lock:
+            self._value = None
+            self._has_value = False
+            self._loaded_at = 0.0
+
+    def bump(self) -> None:
+        """Publish a new version so every worker reloads on its next check."""
+        self.invalidate_local()
+        try:
+            db.reference(self.version_path).set(f'{int(time.time())}-{uuid.uuid4().hex[:8]}')
+        except Exception as exc:
+            logger.error(f"[cache:{self.name}] Could not bump version key: {exc}")
@@ -1,4 +1,5 @@
 from firebase_admin import db
+from services.rtdb_cache import cached_get
 import os
 from datetime import datetime
 
@@ -21,8 +22,7 @@ def get_site_design():
     Returns the design settings or default theme if none exists.
     """
     try:
-        design_ref = db.reference('site_design')
-        design = design_ref.get()
+        design = cached_get('site_design')
         return design if design else DEFAULT_THEME
     except Exception as e:
         print(f"Error fetching site design: {str(e)}")
@@ -66,10 +66,113 @@ def status_badge(status):
     }
     return status_colors.get(status.lower(), 'secondary')
 
+CONFERENCE_CODE_INDEX = 'conference_codes'
+CONFERENCE_CODE_INDEX_STATUS = 'index_status/conference_codes'
+CONFERENCE_CODE_MAX_ATTEMPTS = 10
+
+_conference_code_index_ready = False
+
+def conference_code_key(code):
+    """Normalise a conference code for use as an RTDB key (upper case, no forbidden characters)."""
+    key = str(code or '').strip().upper()
+    for char in '.#$[]/':
+        key = key.replace(char, '_')
+    return key
+
+def conference_code_index_updates(conference_id, new_code=None, old_code=None):
+    """
+    Build multi-path updates (relative to the root) keeping conference_codes in sync.
+
+    Args:
+        conference_id: Conference the code belongs to
+        new_code: Code to point at conference_id (None when removing)
+        old_code: Previous code to release
+
+    Returns:
+        dict: {path: value} entries for db.reference('/').update()
+    """
+    updates = {}
+    old_key = conference_code_key(old_code)
+    new_key = conference_code_key(new_code)
+    if old_key and old_key != new_key:
+        updates[f'{CONFERENCE_CODE_INDEX}/{old_key}'] = None
+    if new_key:
+        updates[f'{CONFERENCE_CODE_INDEX}/{new_key}'] = conference_id
+    return updates
+
+def is_conference_code_index_ready():
+    """True once rebuild_conference_code_index() has populated the index."""
+    global _conference_code_index_ready
+    if not _conference_code_index_ready:
+        try:
+            _conference_code_index_ready = bool(db.reference(CONFERENCE_CODE_INDEX_STATUS).get())
+        except Exception as e:
+            print(f"Error reading conference code index status: {e}")
+    return _conference_code_index_ready
+
+def resolve_conference_code(code):
+    """
+    Resolve a conference code to its conference ID
+
+    Args:
+        code: Conference code
+
+    Returns:
+        str: Conference ID or None
+    """
+    key = conference_code_key(code)
+    if not key:
+        return None
+
+    conference_id = cached_get(f'{CONFERENCE_CODE_INDEX}/{key}')
+    if conference_id or is_conference_code_index_ready():
+        return conference_id
+
+    # Index not built yet: fall back to scanning conference codes
+    for conference_id in (db.reference('conferences').get(shallow=True) or {}):
+        if conference_code_key(cached_get(f'conferences/{conference_id}/conference_code')) == key:
+            db.reference(f'{CONFERENCE_CODE_INDEX}/{key}').set(conference_id)
+            return conference_id
+    return None
+
+def rebuild_conference_code_index(dry_run=False):
+    """
+    Rebuild conference_codes/{CODE} -> conference_id from the conferences tree
+
+    Args:
+        dry_run: Compute the index without writing it
+
+    Returns:
+        dict: Summary including duplicate codes (first conference wins)
+    """
+    global _conference_code_index_ready
+    index = {}
+    duplicates = []
+    for conference_id in (db.reference('conferences').get(shallow=True) or {}):
+        key = conference_code_key(db.reference(f'conferences/{conference_id}/conference_code').get())
+        if not key:
+            continue
+        if key in index:
+            duplicates.append({'code': key, 'conference_ids': [index[key], conference_id]})
+            continue
+        index[key] = conference_id
+
+    if not dry_run:
+        db.reference(CONFERENCE_CODE_INDEX).set(index)
+        db.reference(CONFERENCE_CODE_INDEX_STATUS).set({
+            'rebuilt_at': datetime.now().isoformat(),
+            'entries': len(index),
+        })
+        _conference_code_index_ready = True
+
+    return {'entries': len(index), 'duplicates': duplicates, 'dry_run': dry_run}
+
 def generate_conference_code(conference_abbr, year):
     """
     Generate a unique conference code in the format: CONF-[YEAR]-[ABBREVIATION]-[UNIQUE_ID]
 
+    Uniqueness is checked against the conference_codes index (one small read per attempt).
+
     Args:
         conference_abbr: Conference abbreviation (e.g., 'ETL', 'STM', 'TBME', 'SAT')
         year: Conference year (e.g., 2026, 2027)
@@ -80,10 +183,19 @@ def generate_conference_code(conference_abbr, year):
     import random
     import string
 
-    # Generate 8-character alphanumeric unique ID
-    unique_id = ''.join(random.choices(string.ascii_uppercase + string.digits, k=8))
+    code = None
+    for _ in range(CONFERENCE_CODE_MAX_ATTEMPTS):
+        # Generate 8-character alphanumeric unique ID
+        unique_id = ''.join(random.choices(string.ascii_uppercase + string.digits, k=8))
+        code = f"CONF-{year}-{conference_abbr}-{unique_id}"
+        try:
+            if db.reference(f'{CONFERENCE_CODE_INDEX}/{conference_code_key(code)}').get() is None:
+                return code
+        except Exception as e:
+            print(f"Error checking conference code collision: {e}")
+            return code
 
-    return f"CONF-{year}-{conference_abbr}-{unique_id}"
+    return code
 
 def validate_conference_code(code):
     """
@@ -96,7 +208,6 @@ def validate_conference_code(code):
         dict: {'valid': bool, 'conference_id': str, 'error': str}
     """
     import re
-    from firebase_admin import db
 
     try:
         # Expected format: CONF-YYYY-XXX-XXXXXXXX (where X are alphanumeric)
@@ -106,21 +217,18 @@ def validate_conference_code(code):
         if not match:
             return {'valid': False, 'error': 'Invalid conference code format'}
 
-        year, abbr, unique_id = match.groups()
+        conference_id = resolve_conference_code(code)
+        if not conference_id:
+            return {'valid': False, 'error': 'Conference code not found'}
 
-        # Search for conference with this code in Firebase
-        conferences_ref = db.reference('conferences')
-        conferences = conferences_ref.get() or {}
-
-        for conference_id, conference_data in conferences.items():
-            if conference_data.get('conference_code') == code.upper():
-                return {
-                    'valid': True,
-                    'conference_id': conference_id,
-                    'conference': conference_data
-                }
-
-        return {'valid': False, 'error': 'Conference code not found'}
+        return {
+            'valid': True,
+            'conference_id': conference_id,
+            'conference': {
+                'basic_info': cached_get(f'conferences/{conference_id}/basic_info') or {},
+                'conference_code': code.upper()
+            }
+        }
 
     except Exception as e:
         return {'valid': False, 'error': str(e)}
@@ -135,20 +243,19 @@ def get_conference_by_code(code):
     Returns:
         dict: Conference data or None
     """
-    from firebase_admin import db
-
     try:
-        conferences_ref = db.reference('conferences')
-        conferences = conferences_ref.get() or {}
+        conference_id = resolve_conference_code(code)
+        if not conference_id:
+            return None
 
-        for conference_id, conference_data in conferences.items():
-            if conference_data.get('conference_code') == code.upper():
-                return {
-                    'conference_id': conference_id,
-                    'conference_data': conference_data
-                }
+        conference_data = cached_get(f'conferences/{conference_id}')
+        if not conference_data:
+            return None
 
-        return None
+        return {
+            'conference_id': conference_id,
+            'conference_data': conference_data
+        }
     except Exception as e:
         print(f"Error getting conference by code: {e}")
         return None